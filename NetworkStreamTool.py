@@ -1,14 +1,9 @@
+import multiprocessing
 import sys
 import webbrowser
 from pathlib import Path
 from threading import Thread
 
-from PIL import Image
-from pystray import Icon
-from pystray import MenuItem as item
-
-from app import kill_python, shiny_app
-
 EXECUTABLE = sys.executable.split("\\")[-1]
 PROJECT_DIRECTORY = (
     (Path(__file__) if EXECUTABLE == "python.exe" else Path(sys.executable))
@@ -22,7 +17,13 @@ def open_app_in_browser():
     webbrowser.open("http://localhost:8000")
 
 
-if __name__ == "__main__":
+def run_app() -> None:
+    from PIL import Image
+    from pystray import Icon
+    from pystray import MenuItem as item
+
+    from app import kill_python, shiny_app
+
     run_shiny_app = Thread(target=shiny_app.run)
     run_shiny_app.start()
 
@@ -36,3 +37,16 @@ if __name__ == "__main__":
     open_app_in_browser()
 
     systray_icon.run()
+
+
+if __name__ == "__main__":
+    # experiments run in spawned worker processes, which re-launch the frozen executable
+    multiprocessing.freeze_support()
+
+    # given a manifest, the experiments run headless without the app and the tray icon
+    if len(sys.argv) > 1:
+        from app.cli import main
+
+        sys.exit(main(sys.argv[1:]))
+
+    run_app()
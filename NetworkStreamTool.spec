@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('app', 'app')],
-    hiddenimports=['faicons', 'networkx', 'plotly', 'pympler.asizeof', 'scipy.io', 'shelve', 'shinywidgets', 'tabulate'],
+    hiddenimports=['faicons', 'networkx', 'plotly', 'pympler.asizeof', 'shelve', 'shinywidgets', 'tabulate'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 import pandas as pd
@@ -16,6 +17,14 @@ class BatchAlgorithm(ABC):
     -------
     perform_calculations(data)
         Calculates the examined property of the data using batch processing for the purpose of verifying accuracy of the streaming algorithm
+    update_property(data)
+        optionally updates the examined property with the edges which arrived since the previous update
+    on_edge_accumulate(edge)
+        optionally accumulates one edge of the stream while it is being processed
+    on_edges_accumulate(edges)
+        optionally accumulates a whole block of edges of the stream at once
+    finalize()
+        optionally calculates the examined property of the accumulated edges
     submit_results()
         Returns the result of the batch algorithm in the form of a node rank
     """
@@ -38,6 +47,60 @@ class BatchAlgorithm(ABC):
         """
         ...
 
+    def update_property(self, data: pd.DataFrame) -> None:
+        """
+        Updates the examined property with the edges which arrived since the previous update, for the purpose of
+        verifying the accuracy of the streaming algorithm on prefixes of the stream.
+        Implementing it is optional - if it is overridden, the algorithm maintains its graph between the updates
+        and calculate_property is not called at all, otherwise the property of every prefix is calculated from scratch.
+        Updating an algorithm with all edges of the dataset has to give the same result as calculate_property.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Edges which arrived since the previous update in the form of a pandas DataFrame
+
+        """
+        raise NotImplementedError
+
+    def on_edge_accumulate(self, edge: Any) -> None:
+        """
+        Accumulates one edge of the stream during the pass of the streaming algorithms, e.g. into a compact graph.
+        Implementing it is optional - if it is overridden together with finalize, the edges are neither buffered
+        nor converted into a DataFrame for the batch algorithm, and calculate_property is not called at all.
+
+        Parameters
+        ----------
+        edge: dict | Sequence
+            Edge in the same form as the edge given to the streaming algorithm
+
+        """
+        raise NotImplementedError
+
+    def on_edges_accumulate(self, edges: Sequence[Any]) -> None:
+        """
+        Accumulates a block of consecutive edges of the stream.
+        Implementing it is optional - it can be overridden instead of on_edge_accumulate to process the edges in bulk.
+
+        Parameters
+        ----------
+        edges: Sequence
+            Block of consecutive edges, each one in the same form as the edge given to on_edge_accumulate
+
+        """
+        for edge in edges:
+            self.on_edge_accumulate(edge)
+
+    def finalize(self) -> None:
+        """
+        Calculates the examined property of all edges accumulated so far.
+        Implementing it is required together with on_edge_accumulate or on_edges_accumulate. It is called once the
+        stream has been processed, and also after every evaluated prefix of the stream, after which more edges are
+        accumulated.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def submit_results(self) -> ResultList:
         """
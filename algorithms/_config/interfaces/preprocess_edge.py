@@ -9,6 +9,12 @@ class PreprocessEdge(ABC):
 
     ...
 
+    Attributes
+    ----------
+    columns: Sequence[str] | None
+        headers of the .csv columns needed to create an edge - if supplied, only those columns are read
+        and the line is a tuple of their values (in the given order) instead of a dictionary of all columns
+
     Methods
     -------
     create_edge_from(line)
@@ -17,6 +23,8 @@ class PreprocessEdge(ABC):
         returns the result of the streaming algorithm once the whole dataset has been processed
     """
 
+    columns: Sequence[str] | None = None
+
     @abstractmethod
     def create_edge_from(self, line: dict | Sequence) -> dict | Sequence:
         """
@@ -25,7 +33,8 @@ class PreprocessEdge(ABC):
         Parameters
         ----------
         line: dict | Sequence
-            Dataset row which could be any datatype depending on the format of the base file (e.g. string for .txt but dictionary for .csv)
+            Dataset row which could be any datatype depending on the format of the base file (e.g. string for .txt but dictionary for .csv,
+            or a tuple for .csv when the columns attribute is supplied)
 
         Returns
         -------
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 ResultList = list[tuple[Any, int | float]]
@@ -14,6 +15,14 @@ class StreamingAlgorithm(ABC):
     -------
     on_edge_calculate(edge)
         performs a set of instructions on one edge
+    on_edges_calculate(edges)
+        optionally performs a set of instructions on a whole block of edges at once
+    memory_footprint()
+        optionally reports the amount of memory used by the algorithm
+    get_state()
+        optionally returns the state of the algorithm saved in checkpoints
+    set_state(state)
+        optionally restores the state of the algorithm from a checkpoint
     submit_results()
         returns the result of the streaming algorithm once the whole dataset has been processed
     """
@@ -31,6 +40,59 @@ class StreamingAlgorithm(ABC):
         """
         ...
 
+    def on_edges_calculate(self, edges: Sequence[Any]) -> None:
+        """
+        Performs a set of instructions on a block of consecutive edges.
+        Implementing it is optional - if it is overridden, the edges are passed in blocks instead of one by one,
+        which avoids the overhead of a method call per edge for algorithms able to process many edges at once.
+        The calculation time of a block is split evenly between its edges.
+
+        Parameters
+        ----------
+        edges: Sequence
+            Block of consecutive edges, each one in the same form as the edge given to on_edge_calculate
+
+        """
+        for edge in edges:
+            self.on_edge_calculate(edge)
+
+    def memory_footprint(self) -> int:
+        """
+        Reports the amount of memory used by the state of the algorithm.
+        Implementing it is optional - if it is overridden, it is used for the memory usage history instead of
+        traversing the whole object graph of the algorithm, which gets slower the larger the state grows.
+
+        Returns
+        -------
+        Memory used by the algorithm in bytes
+        """
+        raise NotImplementedError
+
+    def get_state(self) -> Any:
+        """
+        Returns the state of the algorithm saved in the checkpoints of long runs.
+        Implementing it is optional - by default all attributes of the algorithm are pickled, it only has to be
+        overridden if some of them cannot be pickled or the state can be saved more compactly.
+
+        Returns
+        -------
+        Picklable state from which set_state restores the algorithm
+        """
+        return self.__dict__
+
+    def set_state(self, state: Any) -> None:
+        """
+        Restores the state of the algorithm from a checkpoint, before the remaining edges are processed.
+        Implementing it is optional - it has to be overridden together with get_state.
+
+        Parameters
+        ----------
+        state: Any
+            State returned by get_state when the checkpoint was taken
+
+        """
+        self.__dict__.update(state)
+
     @abstractmethod
     def submit_results(self) -> ResultList:
         """
@@ -1,9 +1,21 @@
-from shiny import App
-
-from .server import kill_python, server
-from .ui import STATIC_DIRECTORY, app_ui
+from typing import Any
 
 __all__ = ["kill_python", "shiny_app"]
 
 
-shiny_app = App(app_ui, server, static_assets=STATIC_DIRECTORY)
+def __getattr__(name: str) -> Any:
+    # the app is only built when it is started, the command line never imports shiny
+    if name == "kill_python":
+        from .server import kill_python
+
+        return kill_python
+    if name == "shiny_app":
+        from shiny import App
+
+        from .server import server
+        from .ui import STATIC_DIRECTORY, app_ui
+
+        global shiny_app
+        shiny_app = App(app_ui, server, static_assets=STATIC_DIRECTORY)
+        return shiny_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
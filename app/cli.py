@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import os
+import traceback
+from pathlib import Path
+from typing import Any
+
+from app.server.logic import ExperimentResults, get_catalog, shutdown_workers
+from app.server.logic.actions import IMAGE_FORMATS
+from app.server.logic.suite import (
+    OUTPUT_FORMATS,
+    ExperimentSpecification,
+    ManifestError,
+    Suite,
+    get_metrics,
+    run_suite,
+    save_run,
+    save_suite_metrics,
+)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="NetworkStreamTool",
+        description="Runs the experiments of a TOML manifest without the app.",
+    )
+    parser.add_argument(
+        "manifest", type=Path, nargs="?", help="path to the TOML manifest"
+    )
+    parser.add_argument(
+        "-c",
+        "--catalog",
+        nargs="?",
+        const="",
+        metavar="SEARCH",
+        help="lists the saved experiments instead of running a manifest, optionally only those "
+        "whose name, dataset or algorithm contain the searched text",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="amount of experiments running at once (by default from the manifest or one per core)",
+    )
+    parser.add_argument(
+        "-f",
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        help="format of the saved results (by default from the manifest)",
+    )
+    parser.add_argument(
+        "-i",
+        "--image-format",
+        choices=IMAGE_FORMATS,
+        help="format of the saved plots (by default from the manifest)",
+    )
+    return parser
+
+
+def print_catalog(search: str) -> None:
+    catalog = get_catalog(search)
+    if catalog.empty:
+        print("No saved experiments were found.")
+        return
+    # the hashes and directories identify the runs, but are too long to be listed
+    print(
+        catalog.drop(columns=["dataset_hash", "source_hash", "results_directory"])
+        .dropna(axis="columns", how="all")
+        .to_markdown(index=False, floatfmt=".4g")
+    )
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = get_parser()
+    options = parser.parse_args(arguments)
+    if options.catalog is not None:
+        print_catalog(options.catalog)
+        return 0
+    if options.manifest is None:
+        parser.error("the manifest is required unless the catalog is listed")
+    try:
+        suite = Suite(options.manifest)
+    except ManifestError as exception:
+        parser.error(str(exception))
+    if options.output_format:
+        suite.output_format = options.output_format
+    if options.image_format:
+        suite.image_format = options.image_format
+    workers = options.workers or suite.workers or os.cpu_count() or 1
+
+    metrics: list[dict[str, Any]] = []
+    finished_count = 0
+    is_successful = True
+
+    def on_finished(
+        specification: ExperimentSpecification,
+        repetition: int,
+        result: ExperimentResults | Exception,
+    ) -> None:
+        nonlocal finished_count, is_successful
+        finished_count += 1
+        run_name = specification.get_run_name(suite.name, repetition)
+        progress = f"[{finished_count}/{suite.run_count}] {run_name}"
+        if isinstance(result, Exception):
+            is_successful = False
+            print(f"{progress} failed:\n{''.join(traceback.format_exception(result))}")
+            metrics.append(
+                {
+                    "experiment": specification.name,
+                    "repetition": repetition,
+                    "error": repr(result),
+                }
+            )
+            return
+        run_metrics = get_metrics(specification, repetition, result)
+        metrics.append(run_metrics)
+        try:
+            save_run(suite, specification, repetition, result, run_metrics)
+        # a run which could not be saved is reported, the rest of the suite still runs
+        except Exception:  # noqa: BLE001
+            is_successful = False
+            print(f"{progress} could not be saved:\n{traceback.format_exc()}")
+            return
+        print(f"{progress} finished ({result.edge_count} edges)")
+
+    print(
+        f"Running {suite.run_count} experiments of '{suite.name}' in {workers} workers"
+    )
+    try:
+        asyncio.run(run_suite(suite, on_finished, workers))
+    finally:
+        shutdown_workers()
+
+    metrics.sort(key=lambda run: (run["experiment"], run["repetition"]))
+    results_directory = save_suite_metrics(suite, metrics)
+    print(f"Results saved to {results_directory}")
+    return 0 if is_successful else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -43,6 +43,10 @@ ALGORITHMS_DIRECTORY = PROJECT_DIRECTORY / "algorithms"
 ALGORITHM_TEMPLATES_DIRECTORY = ALGORITHMS_DIRECTORY / "_config" / "templates"
 
 EXPERIMENTS_DIRECTORY = PROJECT_DIRECTORY / "experiments"
+EDGE_CACHE_DIRECTORY = PROJECT_DIRECTORY / "edge_cache"
+CHECKPOINTS_DIRECTORY = EXPERIMENTS_DIRECTORY / "checkpoints"
+FIGURE_CACHE_DIRECTORY = EXPERIMENTS_DIRECTORY / "figure_cache"
+CATALOG_FILE = EXPERIMENTS_DIRECTORY / "catalog.sqlite"
 
 
 class AlgorithmType(StrEnum):
@@ -94,7 +98,7 @@ class AlgorithmTypeSpecification:
             case AlgorithmType.BATCH, _:
                 message = "\t# The dataframe only has one column 0 unless a specified preprocessing method has been supplied which converts the string line into an object (like a tuple).\n\t# In that case it follows how pandas creates DataFrames based on a list of those objects\n"
             case AlgorithmType.PREPROCESSING, "csv":
-                message = "\t# The edge is a dictionary. Its keys are the headers of the supplied .csv file.\n"
+                message = "\t# The edge is a dictionary. Its keys are the headers of the supplied .csv file.\n\t# If the class attribute `columns` lists some of the headers, the edge is a tuple of only their values.\n"
             case AlgorithmType.PREPROCESSING, "mtx":
                 message = "\t# The given edge is a tuple: 0 - source node, 1 - destination node, 2 - weight of the edge  (equal 1.0 for unweighted graphs) \n"
             case AlgorithmType.PREPROCESSING, _:
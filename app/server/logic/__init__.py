@@ -1,3 +1,46 @@
+from .archive import ArchiveError, get_saved_experiments, load_experiment
+from .catalog import get_catalog
+from .experiment import (
+    ExperimentResults,
+    format_size,
+    run_experiment_in_worker,
+    shutdown_workers,
+)
+from .memory import MemoryBackend, MemoryBackendError
+from .metrics import METRIC_NAMES, RankComparison
+from .progress import Progress, ProgressChannel, ProgressPhase
+from .ranking import RankIndex, get_top_results
 from .runner import Runner
+from .sweep import (
+    ParameterGridError,
+    SweepResults,
+    parse_parameter_grid,
+    run_sweep_in_workers,
+)
+from .timing import TimingMode
 
-__all__ = ["Runner"]
+__all__ = [
+    "METRIC_NAMES",
+    "ArchiveError",
+    "ExperimentResults",
+    "MemoryBackend",
+    "MemoryBackendError",
+    "ParameterGridError",
+    "Progress",
+    "ProgressChannel",
+    "ProgressPhase",
+    "RankComparison",
+    "RankIndex",
+    "Runner",
+    "SweepResults",
+    "TimingMode",
+    "format_size",
+    "get_catalog",
+    "get_saved_experiments",
+    "get_top_results",
+    "load_experiment",
+    "parse_parameter_grid",
+    "run_experiment_in_worker",
+    "run_sweep_in_workers",
+    "shutdown_workers",
+]
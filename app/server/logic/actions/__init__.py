@@ -1,5 +1,17 @@
 from .edit_algorithm import edit_algorithm
 from .open_file import open_file
-from .save_results import save_results
+from .save_results import (
+    IMAGE_FORMATS,
+    get_results_directory,
+    save_results,
+    save_sweep_results,
+)
 
-__all__ = ["edit_algorithm", "open_file", "save_results"]
+__all__ = [
+    "IMAGE_FORMATS",
+    "edit_algorithm",
+    "get_results_directory",
+    "open_file",
+    "save_results",
+    "save_sweep_results",
+]
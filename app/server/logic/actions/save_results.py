@@ -1,12 +1,19 @@
+import hashlib
+import json
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent as dedent_to_lowest
 
 from plotly.graph_objs import Figure
 
-from app.server._config import EXPERIMENTS_DIRECTORY
+from app.server._config import EXPERIMENTS_DIRECTORY, FIGURE_CACHE_DIRECTORY
 
+from ..archive import save_experiment
+from ..catalog import record_experiment
 from .open_file import open_file
 
 
@@ -28,54 +35,172 @@ def get_results_directory(experiment_name: str) -> Path:
     return results_directory
 
 
-def write_plot_image(name: str, plot: Figure, results_directory: Path) -> str:
+IMAGE_FORMATS = ["svg", "png", "pdf"]
+
+
+def export_image(figure_json: str, image_path: Path) -> None:
+    # the plots are downsampled, so their WebGL lines are exported as vectors rather than as embedded rasters
+    figure = json.loads(figure_json)
+    for trace in figure["data"]:
+        if trace.get("type") == "scattergl":
+            trace["type"] = "scatter"
+    # the image is written under a temporary name first, an interrupted export does not leave it in the cache
+    partial_path = image_path.with_name(f"partial_{image_path.name}")
+    # the raster images are rendered at twice the size of the plots, to stay sharp in the reports
+    scale = 2 if image_path.suffix == ".png" else 1
+    Figure(figure).write_image(partial_path, scale=scale)
+    os.replace(partial_path, image_path)
+
+
+def export_images(images: dict[Path, str]) -> None:
+    if len(images) == 1:
+        # a single figure is exported right away, without starting a worker
+        ((image_path, figure_json),) = images.items()
+        export_image(figure_json, image_path)
+        return
+    # every worker starts its own instance of kaleido, so the figures are exported at the same time
+    with ProcessPoolExecutor(
+        max_workers=min(len(images), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        list(executor.map(export_image, images.values(), images))
+
+
+def write_plot_images(
+    plots: dict[str, Figure], results_directory: Path, image_format: str = "svg"
+) -> dict[str, str]:
+    # the exported images are cached by the hash of their figures, a figure which did not change
+    # since it was last exported (in any experiment) is copied instead of exported again
     images_directory = results_directory / "images"
     images_directory.mkdir(exist_ok=True)
-    image_file = f"{name}.svg"
-    image_path = images_directory / image_file
-    if not image_path.exists():
-        plot.write_image(images_directory / image_file)
-    return image_file
+    FIGURE_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    cached_paths = {}
+    missing_images = {}
+    for name, plot in plots.items():
+        figure_json = plot.to_json()
+        figure_hash = hashlib.blake2b(figure_json.encode(), digest_size=16).hexdigest()
+        cached_path = FIGURE_CACHE_DIRECTORY / f"{figure_hash}.{image_format}"
+        cached_paths[name] = cached_path
+        if not cached_path.exists():
+            missing_images[cached_path] = figure_json
+    if missing_images:
+        export_images(missing_images)
+
+    image_files = {}
+    for name, cached_path in cached_paths.items():
+        image_files[name] = f"{name}.{image_format}"
+        shutil.copyfile(cached_path, images_directory / image_files[name])
+    return image_files
 
 
 def copy_used_algorithm(results_directory: Path, algorithm_path: str | Path) -> None:
     if not algorithm_path:
         return
     algorithm_path = Path(algorithm_path).resolve()
-    shutil.copy(algorithm_path, results_directory / algorithm_path.name)
+    destination_path = results_directory / algorithm_path.name
+    # the algorithms of results loaded from this directory are already there
+    if destination_path.resolve() != algorithm_path:
+        shutil.copy(algorithm_path, destination_path)
+
+
+def get_file_name(path: str | Path | None) -> str | None:
+    return Path(path).name if path else None
 
 
-def save_results(output_format: str, **kwargs) -> None:
+def save_results(output_format: str, open_results: bool = True, **kwargs) -> None:
     results_directory = get_results_directory(kwargs["experiment_name"])
 
     copy_used_algorithm(results_directory, kwargs["preprocessing_path"])
     copy_used_algorithm(results_directory, kwargs["streaming_path"])
+    for comparison_path in kwargs.get("comparison_paths") or ():
+        copy_used_algorithm(results_directory, comparison_path)
     copy_used_algorithm(results_directory, kwargs["batch_path"])
-
-    calculation_time_plot_file = write_plot_image(
-        "calculation_time", kwargs["calculation_time"], results_directory
-    )
-    memory_usage_plot_file = write_plot_image(
-        "memory_usage", kwargs["memory_usage"], results_directory
+    plots = {
+        "calculation_time": kwargs["calculation_time"],
+        "memory_usage": kwargs["memory_usage"],
+    }
+    # the metrics of every cardinality are also saved as a table
+    if kwargs.get("accuracy_curve") is not None:
+        plots["accuracy_curve"] = kwargs["accuracy_curve"]
+        kwargs["accuracy_curves"].to_csv(
+            results_directory / "accuracy_curves.csv", index=False
+        )
+    if kwargs.get("prefix_accuracy") is not None:
+        plots["prefix_accuracy"] = kwargs["prefix_accuracy"]
+        kwargs["prefix_accuracies"].to_csv(
+            results_directory / "prefix_accuracy.csv", index=False
+        )
+    image_files = write_plot_images(
+        plots, results_directory, kwargs.get("image_format", "svg")
     )
+    calculation_time_plot_file = image_files["calculation_time"]
+    memory_usage_plot_file = image_files["memory_usage"]
+    accuracy_curve_plot_file = image_files.get("accuracy_curve")
+    prefix_accuracy_plot_file = image_files.get("prefix_accuracy")
 
     if output_format == "markdown":
         results = get_results_as_markdown(
-            calculation_time_plot_file, memory_usage_plot_file, **kwargs
+            calculation_time_plot_file,
+            memory_usage_plot_file,
+            accuracy_curve_plot_file,
+            prefix_accuracy_plot_file,
+            **kwargs,
         )
         results_file = results_directory / "results.md"
     elif output_format == "latex":
         results = get_results_as_latex(
-            calculation_time_plot_file, memory_usage_plot_file, **kwargs
+            calculation_time_plot_file,
+            memory_usage_plot_file,
+            accuracy_curve_plot_file,
+            prefix_accuracy_plot_file,
+            **kwargs,
         )
         results_file = results_directory / "results.tex"
     with Path.open(results_file, "w", encoding="utf-8") as file:  # type: ignore
         file.write(results)  # type: ignore
-    open_file(results_file)  # type: ignore
+    # the measurements and node ranks are archived and catalogued only once the report has been written,
+    # so that a failed save does not leave an entry without one - the results can be loaded from them again
+    if kwargs.get("experiment") is not None:
+        save_experiment(
+            results_directory,
+            kwargs["experiment"],
+            experiment_name=kwargs["experiment_name"],
+            dataset=kwargs["dataset"],
+            dataset_path=kwargs["dataset_path"],
+            preprocessing_name=kwargs["preprocessing_name"],
+            preprocessing_file=get_file_name(kwargs["preprocessing_path"]),
+            streaming_files=[
+                get_file_name(kwargs["streaming_path"]),
+                *map(get_file_name, kwargs.get("comparison_paths") or ()),
+            ],
+            batch_name=kwargs["batch_name"],
+            batch_file=get_file_name(kwargs["batch_path"]),
+            order=kwargs["order"],
+            cardinality=kwargs["cardinality"],
+        )
+        record_experiment(
+            results_directory,
+            kwargs["experiment"],
+            kwargs["experiment_name"],
+            kwargs["dataset_path"],
+            kwargs["preprocessing_path"],
+            kwargs.get("streaming_paths")
+            or [kwargs["streaming_path"], *(kwargs.get("comparison_paths") or ())],
+            kwargs["batch_path"],
+            kwargs.get("streaming_parameters"),
+            kwargs["order"],
+            kwargs["cardinality"],
+        )
+    if open_results:
+        open_file(results_file)  # type: ignore
 
 
 def get_results_as_markdown(
-    calculation_time_plot_file: str, memory_usage_plot_file: str, **kwargs
+    calculation_time_plot_file: str,
+    memory_usage_plot_file: str,
+    accuracy_curve_plot_file: str | None = None,
+    prefix_accuracy_plot_file: str | None = None,
+    **kwargs,
 ) -> str:
     results = dedent_to_zero(f"""\
         # **Results of experiment `{kwargs["experiment_name"]}`**\n
@@ -95,6 +220,16 @@ def get_results_as_markdown(
             * Jaccard similarity: `{kwargs['jaccard_similarity']:.4g}` (order: `{kwargs['order']}`, cardinality: `{kwargs['cardinality']}`)
             * Streaming accuracy: `{kwargs['streaming_accuracy']:.4g}`
         """)
+    if kwargs.get("rank_metrics") is not None:
+        results += dedent_to_zero(f"""\
+            ## Rank quality\n
+            {kwargs["rank_metrics"].to_markdown(index=False)}
+        """)
+    if kwargs.get("streaming_comparison") is not None:
+        results += dedent_to_zero(f"""\
+            ## Streaming algorithms comparison\n
+            {kwargs["streaming_comparison"].to_markdown(index=False)}
+        """)
     results += dedent_to_zero(f"""\
         ## Streaming node rank\n
         {kwargs["streaming_node_rank"].to_markdown()}
@@ -110,16 +245,24 @@ def get_results_as_markdown(
         ## Memory usage history\n
         ![memory_usage](images/{memory_usage_plot_file})
     """)
+    if prefix_accuracy_plot_file:
+        results += dedent_to_zero(f"""\
+            ## Accuracy over the stream\n
+            ![prefix_accuracy](images/{prefix_accuracy_plot_file})
+        """)
+    if accuracy_curve_plot_file:
+        results += dedent_to_zero(f"""\
+            ## Accuracy for every cardinality of node rank\n
+            ![accuracy_curve](images/{accuracy_curve_plot_file})
+        """)
 
     return results
 
 
-def get_results_as_latex(
-    calculation_time_plot_file: str, memory_usage_plot_file: str, **kwargs
-) -> str:
-    experiment_name = kwargs["experiment_name"].replace("_", "\\_")
+def get_latex_preamble(title: str, experiment_name: str) -> str:
+    experiment_name = experiment_name.replace("_", "\\_")
 
-    results = dedent_to_lowest(f"""\
+    return dedent_to_lowest(f"""\
         \\documentclass{{article}}
 
         \\usepackage{{booktabs}}
@@ -127,18 +270,37 @@ def get_results_as_latex(
         \\usepackage{{float}}
         \\usepackage[T1]{{fontenc}}
         \\usepackage[a4paper, margin=1.2in]{{geometry}}
+        \\usepackage{{graphicx}}
         \\usepackage{{longtable}}
         \\usepackage{{svg}}
 
         \\graphicspath{{{{./images/}}}}
 
-        \\title{{\\huge Results of experiment\\\\\\texttt{{{experiment_name}}}}}
+        \\title{{\\huge {title}\\\\\\texttt{{{experiment_name}}}}}
         \\author{{}}
         \\date{{}}
 
         \\begin{{document}}
         \\maketitle
+    """)
+
+
+def get_latex_image(image_file: str) -> str:
+    # the svg package converts the images with Inkscape, the other formats are included directly
+    if image_file.endswith(".svg"):
+        return f"\\includesvg[width=\\linewidth]{{{image_file}}}"
+    return f"\\includegraphics[width=\\linewidth]{{{image_file}}}"
 
+
+def get_results_as_latex(
+    calculation_time_plot_file: str,
+    memory_usage_plot_file: str,
+    accuracy_curve_plot_file: str | None = None,
+    prefix_accuracy_plot_file: str | None = None,
+    **kwargs,
+) -> str:
+    results = get_latex_preamble("Results of experiment", kwargs["experiment_name"])
+    results += dedent_to_lowest(f"""
         \\section*{{Metadata}}
         \\begin{{itemize}}
             \\item Dataset: \\texttt{{{kwargs['dataset']}}}
@@ -162,6 +324,20 @@ def get_results_as_latex(
                 \\item Streaming accuracy: \\texttt{{{kwargs['streaming_accuracy']:.4g}}}
             \\end{{itemize}}
         """)
+    if kwargs.get("rank_metrics") is not None:
+        results += "\n" + kwargs["rank_metrics"].to_latex(
+            index=False,
+            longtable=True,
+            float_format="%.4g",
+            caption="Rank quality",
+        )
+    if kwargs.get("streaming_comparison") is not None:
+        results += "\n" + kwargs["streaming_comparison"].to_latex(
+            index=False,
+            longtable=True,
+            float_format="%.4g",
+            caption="Streaming algorithms comparison",
+        )
     results += "\n" + kwargs["streaming_node_rank"].to_latex(
         index=False, longtable=True, float_format="%.4g", caption="Streaming node rank"
     )
@@ -172,14 +348,102 @@ def get_results_as_latex(
     results += dedent_to_lowest(f"""
         \\begin{{figure}}[H]
             \\centering
-            \\includesvg[width=\\linewidth]{{{calculation_time_plot_file}}}
+            {get_latex_image(calculation_time_plot_file)}
             \\caption{{Calculation time}}
         \\end{{figure}}
         \\begin{{figure}}[H]
             \\centering
-            \\includesvg[width=\\linewidth]{{{memory_usage_plot_file}}}
+            {get_latex_image(memory_usage_plot_file)}
             \\caption{{Memory usage history}}
         \\end{{figure}}
+    """)
+    if prefix_accuracy_plot_file:
+        results += dedent_to_lowest(f"""\
+            \\begin{{figure}}[H]
+                \\centering
+                {get_latex_image(prefix_accuracy_plot_file)}
+                \\caption{{Accuracy over the stream}}
+            \\end{{figure}}
+        """)
+    if accuracy_curve_plot_file:
+        results += dedent_to_lowest(f"""\
+            \\begin{{figure}}[H]
+                \\centering
+                {get_latex_image(accuracy_curve_plot_file)}
+                \\caption{{Accuracy for every cardinality of node rank}}
+            \\end{{figure}}
+        """)
+    results += "\n\\end{document}\n"
+
+    return results
+
+
+def save_sweep_results(output_format: str, **kwargs) -> None:
+    results_directory = get_results_directory(kwargs["experiment_name"])
+
+    copy_used_algorithm(results_directory, kwargs["preprocessing_path"])
+    copy_used_algorithm(results_directory, kwargs["streaming_path"])
+    copy_used_algorithm(results_directory, kwargs["batch_path"])
+
+    sweep_plot_file = write_plot_images(
+        {"parameter_sweep": kwargs["sweep_plot"]},
+        results_directory,
+        kwargs.get("image_format", "svg"),
+    )["parameter_sweep"]
+
+    if output_format == "markdown":
+        results = get_sweep_results_as_markdown(sweep_plot_file, **kwargs)
+        results_file = results_directory / "results.md"
+    elif output_format == "latex":
+        results = get_sweep_results_as_latex(sweep_plot_file, **kwargs)
+        results_file = results_directory / "results.tex"
+    with Path.open(results_file, "w", encoding="utf-8") as file:  # type: ignore
+        file.write(results)  # type: ignore
+    open_file(results_file)  # type: ignore
+
+
+def get_sweep_results_as_markdown(sweep_plot_file: str, **kwargs) -> str:
+    results = dedent_to_zero(f"""\
+        # **Results of parameter sweep `{kwargs["experiment_name"]}`**\n
+        ## Metadata\n
+        * Dataset: `{kwargs["dataset"]}`
+        * Preprocessing function: `{kwargs["preprocessing_name"] or "Not used"}`
+        * Streaming algorithm: `{kwargs["streaming_name"]}`
+        * Batch algorithm: `{kwargs["batch_name"] or "Not used"}`
+        * Parameter grid: `{kwargs["parameter_grid"]}`
+        * Total edge count: `{kwargs["total_edge_count"]}`\n
+        ## Configurations\n
+        {kwargs["sweep_table"].to_markdown(index=False)}\n
+        ## Pareto front\n
+        ![parameter_sweep](images/{sweep_plot_file})
+    """)
+    return results
+
+
+def get_sweep_results_as_latex(sweep_plot_file: str, **kwargs) -> str:
+    results = get_latex_preamble(
+        "Results of parameter sweep", kwargs["experiment_name"]
+    )
+    results += dedent_to_lowest(f"""
+        \\section*{{Metadata}}
+        \\begin{{itemize}}
+            \\item Dataset: \\texttt{{{kwargs["dataset"]}}}
+            \\item Preprocessing function: \\texttt{{{kwargs["preprocessing_name"] or "Not used"}}}
+            \\item Streaming algorithm: \\texttt{{{kwargs["streaming_name"]}}}
+            \\item Batch algorithm: \\texttt{{{kwargs["batch_name"] or "Not used"}}}
+            \\item Parameter grid: \\texttt{{{kwargs["parameter_grid"]}}}
+            \\item Total edge count: \\texttt{{{kwargs["total_edge_count"]}}}
+        \\end{{itemize}}
+    """)
+    results += "\n" + kwargs["sweep_table"].to_latex(
+        index=False, longtable=True, float_format="%.4g", caption="Configurations"
+    )
+    results += dedent_to_lowest(f"""
+        \\begin{{figure}}[H]
+            \\centering
+            {get_latex_image(sweep_plot_file)}
+            \\caption{{Pareto front}}
+        \\end{{figure}}
 
         \\end{{document}}
     """)
@@ -0,0 +1,218 @@
+import contextlib
+import json
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.server._config import EXPERIMENTS_DIRECTORY
+
+from .experiment import ExperimentResults
+from .ranking import RankIndex
+from .runner import GroundTruth
+
+# bump whenever the layout of the archive changes
+ARCHIVE_FORMAT_VERSION = 1
+ARCHIVE_DIRECTORY = "data"
+METADATA_FILE = "metadata.json"
+
+
+class ArchiveError(ValueError):
+    def __init__(self, results_directory: Path, reason: str) -> None:
+        super().__init__(
+            f"The results saved in '{results_directory}' could not be loaded: {reason}"
+        )
+
+
+def get_node_arrays(rank_indices: list[RankIndex]) -> list[np.ndarray]:
+    # nodes of a single type are saved as plain arrays, which are memory-mapped when loaded -
+    # the nodes of all ranks share the type, so that they can still be compared with each other
+    node_types = {
+        type(node) for rank_index in rank_indices for node in rank_index.nodes
+    }
+    if node_types <= {str}:
+        return [rank_index.nodes.astype(str) for rank_index in rank_indices]
+    if node_types == {int}:
+        with contextlib.suppress(OverflowError):
+            return [rank_index.nodes.astype(np.int64) for rank_index in rank_indices]
+    # nodes of mixed (or other) types are pickled
+    return [rank_index.nodes for rank_index in rank_indices]
+
+
+def save_array(path: Path, array: np.ndarray) -> None:
+    # written under a temporary name first, the file it replaces may still be memory-mapped
+    temporary_path = path.with_name(f"partial_{path.name}")
+    np.save(temporary_path, array, allow_pickle=array.dtype.hasobject)
+    os.replace(temporary_path, path)
+
+
+def load_array(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # the pickled nodes can not be memory-mapped
+        return np.load(path, allow_pickle=True)
+
+
+def save_experiment(
+    results_directory: Path, experiment: ExperimentResults, **metadata: Any
+) -> None:
+    """
+    Archives the measurements and the node ranks of the experiment as .npy arrays in the data directory
+    of its results, together with the metadata of the run, so that the experiment can be analysed
+    and loaded again without running it.
+    """
+    archive_directory = results_directory / ARCHIVE_DIRECTORY
+    if experiment.archive_directory == archive_directory.resolve():
+        # the experiment was loaded from this archive
+        return
+    archive_directory.mkdir(parents=True, exist_ok=True)
+    # the metadata of results saved here before no longer describes the arrays once they are replaced
+    (archive_directory / METADATA_FILE).unlink(missing_ok=True)
+
+    streaming_count = len(experiment.streaming_names)
+    ranks = {
+        f"streaming_{index}": experiment.get_rank_index(index)
+        for index in range(streaming_count)
+    }
+    ranks["batch"] = experiment.get_batch_rank_index()
+    for prefix, ground_truth in enumerate(experiment.ground_truth):
+        ranks[f"prefix_{prefix}_batch"] = ground_truth.batch_rank
+        for index, rank_index in enumerate(ground_truth.streaming_ranks):
+            ranks[f"prefix_{prefix}_streaming_{index}"] = rank_index
+    node_arrays = get_node_arrays(list(ranks.values()))
+    for (name, rank_index), nodes in zip(ranks.items(), node_arrays):
+        save_array(archive_directory / f"rank_{name}_nodes.npy", nodes)
+        save_array(archive_directory / f"rank_{name}_values.npy", rank_index.values)
+
+    for index in range(streaming_count):
+        edges, durations = experiment.calculation_time[index]
+        save_array(archive_directory / f"time_{index}_edges.npy", edges)
+        save_array(archive_directory / f"time_{index}_durations.npy", durations)
+        samples = np.array(experiment.memory_usage[index], dtype=np.int64).reshape(
+            -1, 2
+        )
+        save_array(archive_directory / f"memory_{index}_edges.npy", samples[:, 0])
+        save_array(archive_directory / f"memory_{index}_bytes.npy", samples[:, 1])
+
+    # the metadata is written last, an archive without it is not listed
+    with open(archive_directory / METADATA_FILE, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "format_version": ARCHIVE_FORMAT_VERSION,
+                "saved_at": datetime.now().isoformat(timespec="seconds"),
+                **metadata,
+                "edge_count": experiment.edge_count,
+                "dataset_size": experiment.dataset_size,
+                "streaming_names": experiment.streaming_names,
+                "memory_probe_time": experiment.memory_probe_time,
+                "checkpoint_time": experiment.checkpoint_time,
+                "prefix_edge_counts": [
+                    ground_truth.edge_count for ground_truth in experiment.ground_truth
+                ],
+            },
+            file,
+            indent=2,
+            default=str,
+        )
+
+
+def load_metadata(results_directory: Path) -> dict[str, Any]:
+    metadata_path = results_directory / ARCHIVE_DIRECTORY / METADATA_FILE
+    try:
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = json.load(file)
+    except (OSError, json.JSONDecodeError) as exception:
+        raise ArchiveError(results_directory, str(exception)) from None
+    if metadata.get("format_version") != ARCHIVE_FORMAT_VERSION:
+        raise ArchiveError(
+            results_directory, "it was saved by an incompatible version of the tool."
+        )
+    return metadata
+
+
+def load_memory_usage(archive_directory: Path, index: int) -> list[tuple[int, int]]:
+    # the memory samples are few, they are read into the list of samples the results are plotted from
+    edges = np.load(archive_directory / f"memory_{index}_edges.npy")
+    memory = np.load(archive_directory / f"memory_{index}_bytes.npy")
+    return list(zip(edges.tolist(), memory.tolist()))
+
+
+def load_experiment(
+    results_directory: Path,
+) -> tuple[ExperimentResults, dict[str, Any]]:
+    """
+    Loads an experiment archived by save_experiment together with its metadata.
+    The arrays are memory-mapped, so they are only read from the disk once they are used.
+    """
+    metadata = load_metadata(results_directory)
+    archive_directory = (results_directory / ARCHIVE_DIRECTORY).resolve()
+
+    def load_rank(name: str) -> RankIndex:
+        return RankIndex.from_sorted(
+            load_array(archive_directory / f"rank_{name}_nodes.npy"),
+            load_array(archive_directory / f"rank_{name}_values.npy"),
+        )
+
+    try:
+        indices = range(len(metadata["streaming_names"]))
+        experiment = ExperimentResults.restore(
+            archive_directory,
+            metadata["edge_count"],
+            metadata["dataset_size"],
+            metadata["streaming_names"],
+            [load_rank(f"streaming_{index}") for index in indices],
+            load_rank("batch"),
+            [
+                (
+                    load_array(archive_directory / f"time_{index}_edges.npy"),
+                    load_array(archive_directory / f"time_{index}_durations.npy"),
+                )
+                for index in indices
+            ],
+            [load_memory_usage(archive_directory, index) for index in indices],
+            metadata["memory_probe_time"],
+            metadata["checkpoint_time"],
+            [
+                GroundTruth(
+                    edge_count,
+                    load_rank(f"prefix_{prefix}_batch"),
+                    [
+                        load_rank(f"prefix_{prefix}_streaming_{index}")
+                        for index in indices
+                    ],
+                )
+                for prefix, edge_count in enumerate(metadata["prefix_edge_counts"])
+            ],
+        )
+    # missing or corrupted arrays, as well as metadata missing some of its fields
+    except (
+        OSError,
+        EOFError,
+        ValueError,
+        KeyError,
+        pickle.UnpicklingError,
+    ) as exception:
+        raise ArchiveError(results_directory, str(exception)) from None
+    return experiment, metadata
+
+
+def get_saved_experiments() -> dict[str, Path]:
+    # the directories of the archived experiments by their names, the most recently saved first
+    saved_experiments = []
+    for metadata_path in EXPERIMENTS_DIRECTORY.glob(
+        f"**/{ARCHIVE_DIRECTORY}/{METADATA_FILE}"
+    ):
+        results_directory = metadata_path.parents[1]
+        saved_experiments.append(
+            (
+                metadata_path.stat().st_mtime,
+                results_directory.relative_to(EXPERIMENTS_DIRECTORY).as_posix(),
+                results_directory,
+            )
+        )
+    saved_experiments.sort(reverse=True)
+    return {name: directory for _, name, directory in saved_experiments}
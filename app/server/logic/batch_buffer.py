@@ -0,0 +1,170 @@
+from array import array
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnBuffer:
+    """
+    Growable buffer of one column of the batch input.
+    Integers and floats are stored in typed arrays, hashable values (like node names) are interned
+    and stored as integer codes - only columns mixing other values fall back to a list of objects.
+    """
+
+    def __init__(self) -> None:
+        self._kind: str | None = None
+        self._values: array | list = array("q")
+        self._codes: dict[Any, int] = {}
+        self._labels: list[Any] = []
+
+    def _to_objects(self) -> None:
+        self._values = self.to_numpy().tolist()
+        self._kind = "object"
+
+    def append(self, value: Any) -> None:
+        value_type = type(value)
+        if self._kind is None:
+            if value_type is int:
+                self._kind = "integer"
+            elif value_type is float:
+                self._kind = "float"
+                self._values = array("d")
+            elif isinstance(value, Hashable):
+                self._kind = "label"
+            else:
+                self._kind = "object"
+                self._values = []
+
+        match self._kind:
+            case "integer":
+                if value_type is int and -(2**63) <= value < 2**63:
+                    self._values.append(value)  # type: ignore
+                    return
+                if value_type is float:
+                    # integers followed by floats end up as floats, like in pandas
+                    self._values = array("d", self._values)
+                    self._kind = "float"
+                else:
+                    self._to_objects()
+            case "float":
+                if value_type is float or value_type is int:
+                    self._values.append(value)  # type: ignore
+                    return
+                self._to_objects()
+            case "label":
+                try:
+                    code = self._codes.setdefault(value, len(self._codes))
+                except TypeError:
+                    # unhashable values (e.g. lists) cannot be interned
+                    self._to_objects()
+                else:
+                    if code == len(self._labels):
+                        self._labels.append(value)
+                    self._values.append(code)  # type: ignore
+                    return
+
+        self._values.append(value)  # type: ignore
+
+    def to_numpy(self) -> np.ndarray:
+        match self._kind:
+            case "integer":
+                # the arrays are shared with the buffer instead of being copied
+                return np.frombuffer(self._values, dtype=np.int64)  # type: ignore
+            case "float":
+                return np.frombuffer(self._values, dtype=np.float64)  # type: ignore
+            case "label":
+                labels = np.empty(len(self._labels), dtype=object)
+                labels[:] = self._labels
+                return labels[np.frombuffer(self._values, dtype=np.int64)]  # type: ignore
+            case _:
+                values = np.empty(len(self._values), dtype=object)
+                values[:] = self._values
+                return values
+
+
+class BatchBuffer:
+    """
+    Accumulates the edges for the batch algorithm in columnar buffers instead of a list of python objects.
+    The columns follow how pandas creates a DataFrame from a list of the edges: tuples and lists are
+    split into columns 0, 1, ..., dictionaries into columns named by their keys, any other edge is one column 0.
+    Edges not following the shape of the first one are kept as they are and converted by pandas.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[Any] | None = None
+        self._columns: list[ColumnBuffer] = []
+        self._is_mapping = False
+        self._is_scalar = False
+        self._rows: list[Any] | None = None
+        self._row_count = 0
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def _fall_back_to_rows(self) -> None:
+        # the already buffered edges are converted back to their original form
+        frame = self.to_dataframe()
+        if self._is_mapping:
+            self._rows = frame.to_dict("records")
+        elif self._is_scalar:
+            self._rows = frame[0].tolist()
+        else:
+            self._rows = list(frame.itertuples(index=False, name=None))
+        self._columns = []
+
+    def append(self, row: Any) -> None:
+        if self._rows is not None:
+            self._rows.append(row)
+            self._row_count += 1
+            return
+
+        if self._keys is None:
+            if isinstance(row, dict):
+                self._is_mapping = True
+                self._keys = list(row)
+            elif isinstance(row, (tuple, list)):
+                self._keys = list(range(len(row)))
+            else:
+                self._is_scalar = True
+                self._keys = [0]
+            self._columns = [ColumnBuffer() for _ in self._keys]
+
+        if self._is_scalar:
+            if isinstance(row, (dict, tuple, list)):
+                self._fall_back_to_rows()
+                self.append(row)
+                return
+            self._columns[0].append(row)
+        else:
+            values = row.values() if self._is_mapping else row
+            if (
+                self._is_mapping != isinstance(row, dict)
+                or len(row) != len(self._keys)
+                or (self._is_mapping and list(row) != self._keys)
+            ):
+                self._fall_back_to_rows()
+                self.append(row)
+                return
+            for column, value in zip(self._columns, values):
+                column.append(value)
+        self._row_count += 1
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def clear(self) -> None:
+        # new buffers are allocated, so data frames sharing the previous ones stay intact
+        self.__init__()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        if self._rows is not None:
+            return pd.DataFrame(self._rows)
+        if self._keys is None:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {key: column.to_numpy() for key, column in zip(self._keys, self._columns)},
+            copy=False,
+        )
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import sqlite3
+from collections.abc import Mapping, Sequence
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from app.server._config import CATALOG_FILE
+
+from .edge_cache import hash_file
+from .metrics import METRIC_NAMES
+
+if TYPE_CHECKING:
+    from .experiment import ExperimentResults
+
+# bump whenever the tables change, an outdated catalog is created again
+CATALOG_FORMAT_VERSION = 1
+# the summary of every streaming algorithm (see ExperimentResults.get_summary)
+SUMMARY_COLUMNS = [
+    "average_time_ns",
+    "median_time_ns",
+    "p95_time_ns",
+    "p99_time_ns",
+    "average_memory_bytes",
+    "max_memory_bytes",
+    "jaccard_similarity",
+    "streaming_accuracy",
+    *METRIC_NAMES,
+]
+CATALOG_SCHEMA = f"""
+    CREATE TABLE runs (
+        results_directory TEXT PRIMARY KEY,
+        experiment_name TEXT NOT NULL,
+        saved_at TEXT NOT NULL,
+        dataset TEXT NOT NULL,
+        dataset_hash TEXT,
+        dataset_size INTEGER NOT NULL,
+        edge_count INTEGER NOT NULL,
+        preprocessing TEXT,
+        preprocessing_hash TEXT,
+        batch TEXT,
+        batch_hash TEXT,
+        rank_order TEXT,
+        cardinality INTEGER
+    );
+    CREATE TABLE algorithms (
+        results_directory TEXT NOT NULL REFERENCES runs ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        source_hash TEXT,
+        parameters TEXT NOT NULL,
+        {", ".join(f"{column} REAL" for column in SUMMARY_COLUMNS)},
+        PRIMARY KEY (results_directory, position)
+    );
+    CREATE INDEX runs_dataset_hash ON runs (dataset_hash);
+    CREATE INDEX algorithms_source_hash ON algorithms (source_hash);
+    CREATE TABLE file_hashes (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        modified_ns INTEGER NOT NULL,
+        hash TEXT NOT NULL
+    );
+"""
+
+
+def connect() -> sqlite3.Connection:
+    CATALOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # several sessions (or the app and the command line) may save their results at once
+    connection = sqlite3.connect(CATALOG_FILE, timeout=30)
+    connection.execute("PRAGMA foreign_keys = ON")
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if version != CATALOG_FORMAT_VERSION:
+        # the catalog only indexes the saved results, an outdated one is dropped rather than migrated
+        connection.executescript(
+            """
+            DROP TABLE IF EXISTS algorithms;
+            DROP TABLE IF EXISTS runs;
+            DROP TABLE IF EXISTS file_hashes;
+            """
+            + CATALOG_SCHEMA
+            + f"PRAGMA user_version = {CATALOG_FORMAT_VERSION};"
+        )
+    return connection
+
+
+def get_file_hash(connection: sqlite3.Connection, path: Path | None) -> str | None:
+    # the hash is kept together with the size and modification time of the file,
+    # so that a dataset is only read again once it changes
+    if path is None:
+        return None
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    row = connection.execute(
+        "SELECT hash FROM file_hashes WHERE path = ? AND size = ? AND modified_ns = ?",
+        (str(path), stat.st_size, stat.st_mtime_ns),
+    ).fetchone()
+    if row is not None:
+        return row[0]
+    digest = hashlib.blake2b(digest_size=20)
+    hash_file(digest, path)
+    connection.execute(
+        "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)",
+        (str(path), stat.st_size, stat.st_mtime_ns, digest.hexdigest()),
+    )
+    return digest.hexdigest()
+
+
+def get_dataset_hash(dataset_path: Path) -> str:
+    # the dataset keys both the edge cache and the checkpoints - it is hashed once per run,
+    # and not at all while it has not changed since it was last hashed
+    with closing(connect()) as connection, connection:
+        dataset_hash = get_file_hash(connection, dataset_path)
+    if dataset_hash is None:
+        raise FileNotFoundError(f"The dataset '{dataset_path}' could not be read.")
+    return dataset_hash
+
+
+def record_experiment(
+    results_directory: Path,
+    experiment: "ExperimentResults",
+    experiment_name: str,
+    dataset_path: Path,
+    preprocessing_path: Path | None,
+    streaming_paths: Sequence[Path],
+    batch_path: Path | None,
+    streaming_parameters: Sequence[Mapping[str, Any]] | None = None,
+    order: str | None = None,
+    cardinality: int | None = None,
+) -> None:
+    """
+    Adds the experiment saved in the results directory to the catalog, replacing the entry
+    of the results saved there before. Besides the names and hashes of the dataset and the algorithms,
+    the entry holds the summary of every streaming algorithm at the given order and cardinality.
+    """
+    streaming_count = len(experiment.streaming_names)
+    if len(streaming_paths) == 1:
+        # a single algorithm run with several sets of parameters
+        streaming_paths = list(streaming_paths) * streaming_count
+    streaming_parameters = streaming_parameters or [{}] * streaming_count
+    key = str(results_directory.resolve())
+
+    with closing(connect()) as connection, connection:
+        dataset_hash = get_file_hash(connection, dataset_path)
+        if dataset_hash is None:
+            # the dataset of loaded results may be gone, its hash is kept from the earlier entry
+            row = connection.execute(
+                "SELECT dataset_hash FROM runs WHERE results_directory = ?", (key,)
+            ).fetchone()
+            dataset_hash = row and row[0]
+        connection.execute("DELETE FROM runs WHERE results_directory = ?", (key,))
+        connection.execute(
+            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                experiment_name,
+                datetime.now().isoformat(timespec="seconds"),
+                Path(dataset_path).name,
+                dataset_hash,
+                experiment.dataset_size,
+                experiment.edge_count,
+                preprocessing_path and Path(preprocessing_path).name,
+                get_file_hash(connection, preprocessing_path),
+                batch_path and Path(batch_path).name,
+                get_file_hash(connection, batch_path),
+                order,
+                cardinality,
+            ),
+        )
+        for index, name in enumerate(experiment.streaming_names):
+            summary = experiment.get_summary(
+                order != "Ascending", cardinality or 10, index, batch_path is not None
+            )
+            connection.execute(
+                f"INSERT INTO algorithms VALUES ({', '.join('?' * (5 + len(SUMMARY_COLUMNS)))})",
+                (
+                    key,
+                    index,
+                    name,
+                    get_file_hash(connection, streaming_paths[index]),
+                    json.dumps(streaming_parameters[index], sort_keys=True),
+                    *(summary.get(column) for column in SUMMARY_COLUMNS),
+                ),
+            )
+
+
+def get_catalog(search: str = "") -> pd.DataFrame:
+    """
+    Lists the saved experiments with one row per streaming algorithm, the most recently saved first.
+    Only the experiments whose name, dataset or algorithm contain the searched text are listed.
+    """
+    with closing(connect()) as connection:
+        return pd.read_sql_query(
+            f"""
+            SELECT
+                runs.experiment_name AS experiment,
+                runs.saved_at,
+                runs.dataset,
+                runs.edge_count,
+                algorithms.name AS algorithm,
+                algorithms.parameters,
+                runs.batch,
+                runs.rank_order,
+                runs.cardinality,
+                {", ".join(f"algorithms.{column}" for column in SUMMARY_COLUMNS)},
+                runs.dataset_hash,
+                algorithms.source_hash,
+                runs.results_directory
+            FROM runs JOIN algorithms USING (results_directory)
+            WHERE instr(lower(runs.experiment_name), lower(:search))
+                OR instr(lower(runs.dataset), lower(:search))
+                OR instr(lower(algorithms.name), lower(:search))
+            ORDER BY runs.saved_at DESC, runs.experiment_name, algorithms.position
+            """,
+            connection,
+            params={"search": search},
+        )
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import pickle
+import shutil
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from app.server._config import CHECKPOINTS_DIRECTORY
+
+from .file_reading import get_data_suffix
+
+if TYPE_CHECKING:
+    from .runner import GroundTruth, StreamingTrack
+
+# bump whenever the layout of the saved state changes
+CHECKPOINT_FORMAT_VERSION = 2
+STATE_FILE = "state.pickle"
+
+
+def get_checkpoint_path(
+    dataset_path: Path,
+    dataset_hash: str,
+    algorithm_paths: Sequence[Path | None],
+    configuration: Mapping[str, Any],
+) -> Path:
+    # a checkpoint is only resumed by a run of the same dataset and algorithms with the same settings
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(
+        f"{CHECKPOINT_FORMAT_VERSION}{get_data_suffix(dataset_path)}{dataset_hash}{sorted(configuration.items())!r}".encode()
+    )
+    for path in algorithm_paths:
+        digest.update(Path(path).read_bytes() if path is not None else b"\0")
+    return CHECKPOINTS_DIRECTORY / digest.hexdigest()
+
+
+def get_timing_paths(directory: Path, index: int) -> tuple[Path, Path]:
+    return (
+        directory / f"timing_{index}_edges.bin",
+        directory / f"timing_{index}_durations.bin",
+    )
+
+
+class Checkpoint:
+    """
+    Periodically saves the state of the streaming algorithms, together with their timing and memory
+    measurements and the accuracy evaluated on prefixes of the stream, so that an interrupted run can be
+    resumed from the last checkpoint. The batch algorithm is not saved, it catches up on the skipped edges.
+    The checkpoint is taken between blocks of edges and its cost is accumulated separately from
+    the calculation times. The timing buffers are only appended to, while the rest of the state is
+    written to a temporary file which atomically replaces the previous one - the timings written
+    by an interrupted checkpoint are dropped when it is loaded.
+    """
+
+    def __init__(self, directory: Path, interval: float) -> None:
+        self.directory = directory
+        # total time spent on saving and loading the checkpoints in nanoseconds
+        self.time = 0
+        self._interval = int(interval * 1e9)
+        self._next_checkpoint = time.perf_counter_ns() + self._interval
+        self._saved_timing_counts: list[int] = []
+
+    def exists(self) -> bool:
+        return (self.directory / STATE_FILE).exists()
+
+    def is_due(self) -> bool:
+        return time.perf_counter_ns() >= self._next_checkpoint
+
+    def save(
+        self,
+        edge_count: int,
+        tracks: "Sequence[StreamingTrack]",
+        ground_truth: "Sequence[GroundTruth]" = (),
+    ) -> None:
+        start = time.perf_counter_ns()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self._saved_timing_counts:
+            self._saved_timing_counts = [0] * len(tracks)
+
+        track_states = []
+        for index, track in enumerate(tracks):
+            saved_count = self._saved_timing_counts[index]
+            edges_path, durations_path = get_timing_paths(self.directory, index)
+            with open(edges_path, "ab") as file:
+                file.write(track.timing.get_edges(saved_count).tobytes())
+            with open(durations_path, "ab") as file:
+                file.write(track.timing.durations[saved_count:].tobytes())
+            timing_state = track.timing.get_state()
+            self._saved_timing_counts[index] = timing_state["count"]
+            track_states.append(
+                {
+                    "algorithm": track.algorithm.get_state(),
+                    "timing": timing_state,
+                    "memory": track.memory.get_state(),
+                }
+            )
+
+        end = time.perf_counter_ns()
+        temporary_path = self.directory / f"{STATE_FILE}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(
+                {
+                    "edge_count": edge_count,
+                    "tracks": track_states,
+                    "ground_truth": list(ground_truth),
+                    "checkpoint_time": self.time + end - start,
+                },
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temporary_path, self.directory / STATE_FILE)
+
+        end = time.perf_counter_ns()
+        self.time += end - start
+        self._next_checkpoint = end + self._interval
+
+    def load(
+        self, tracks: "Sequence[StreamingTrack]"
+    ) -> tuple[int, "list[GroundTruth]"]:
+        # returns the amount of edges processed before the checkpoint and the prefixes evaluated until then
+        start = time.perf_counter_ns()
+        with open(self.directory / STATE_FILE, "rb") as file:
+            state = pickle.load(file)
+
+        self._saved_timing_counts = []
+        for index, (track, track_state) in enumerate(
+            zip(tracks, state["tracks"], strict=True)
+        ):
+            count = track_state["timing"]["count"]
+            timings = []
+            for path in get_timing_paths(self.directory, index):
+                timings.append(np.fromfile(path, dtype=np.int64, count=count))
+                os.truncate(path, 8 * count)
+            track.algorithm.set_state(track_state["algorithm"])
+            track.timing.set_state(track_state["timing"], *timings)
+            track.memory.set_state(track_state["memory"])
+            self._saved_timing_counts.append(count)
+
+        end = time.perf_counter_ns()
+        # the time spent on the checkpoints of the interrupted runs is also included
+        self.time = state["checkpoint_time"] + end - start
+        self._next_checkpoint = end + self._interval
+        return state["edge_count"], state["ground_truth"]
+
+    def remove(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,65 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from algorithms._config.interfaces import ResultList
+
+from .ranking import RankIndex, get_top_results
+
+
+def to_result_list(results: Iterable[Any] | Mapping[Any, Any]) -> ResultList:
+    # algorithms may submit their node rank as a dictionary or any other iterable of pairs
+    if isinstance(results, Mapping):
+        return list(results.items())
+    return list(results)
+
+
+def get_parameterized_results(
+    streaming_results: ResultList,
+    batch_results: ResultList,
+    orderDescending: bool,
+    cardinality: int,
+) -> tuple[ResultList, ResultList]:
+    return (
+        get_top_results(streaming_results, cardinality, orderDescending),
+        get_top_results(batch_results, cardinality, orderDescending),
+    )
+
+
+# the comparisons are answered from the rank indices built once per run,
+# only the top nodes of the given cardinality are visited
+
+
+def get_jaccard_similarity(
+    streaming_rank: RankIndex,
+    batch_rank: RankIndex,
+    orderDescending: bool,
+    cardinality: int = 10,
+) -> float:
+    streaming_nodes = set(streaming_rank.get_top_nodes(cardinality, orderDescending))
+    batch_count = len(set(batch_rank.get_top_nodes(cardinality, orderDescending)))
+
+    intersection_count = 0
+    for node in streaming_nodes:
+        rank = batch_rank.get_rank(node, orderDescending)
+        if rank is not None and rank < cardinality:
+            intersection_count += 1
+    union_count = len(streaming_nodes) + batch_count - intersection_count
+
+    # nothing to compare if neither of the algorithms ranked any nodes
+    return intersection_count / union_count if union_count else 0.0
+
+
+def get_streaming_accuracy(
+    streaming_rank: RankIndex,
+    batch_rank: RankIndex,
+    orderDescending: bool = False,
+    cardinality: int = 10,
+) -> float:
+    streaming_nodes = streaming_rank.get_top_nodes(cardinality, orderDescending)
+    batch_nodes = batch_rank.get_top_nodes(cardinality, orderDescending)
+    if not streaming_nodes:
+        return 0.0
+    correct = sum(
+        stream == batch for stream, batch in zip(streaming_nodes, batch_nodes)
+    )
+    return correct / len(streaming_nodes)
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import shutil
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.server._config import EDGE_CACHE_DIRECTORY
+
+from .file_reading import get_data_suffix
+
+# bump whenever the layout of the cached files changes
+CACHE_FORMAT_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 20
+REPLAY_BLOCK_SIZE = 1 << 16
+
+
+def hash_file(digest: hashlib.blake2b, file_path: Path) -> None:
+    with open(file_path, "rb") as file:
+        while block := file.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+
+
+def get_cache_path(
+    dataset_path: Path, dataset_hash: str, preprocessing_path: Path | None
+) -> Path:
+    # the cache is keyed by the content hash of the dataset and by the preprocessing source,
+    # the suffix is included as it determines how the dataset is read
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(
+        f"{CACHE_FORMAT_VERSION}{get_data_suffix(dataset_path)}{dataset_hash}".encode()
+    )
+    if preprocessing_path is not None:
+        digest.update(Path(preprocessing_path).read_bytes())
+    return EDGE_CACHE_DIRECTORY / digest.hexdigest()
+
+
+class EdgeCacheWriter:
+    """
+    Interns the node IDs of the preprocessed edges and collects them in typed arrays.
+    Only tuples of a source node, a destination node and an optional numeric weight can be cached,
+    where all nodes are either integers or strings - for any other edge the cache is abandoned.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        self._cache_path = cache_path
+        self._node_ids: dict[Any, int] = {}
+        self._node_type: type | None = None
+        self._edge_length: int | None = None
+        self._sources = array("q")
+        self._destinations = array("q")
+        self._weights = array("q")
+        self.is_valid = True
+
+    def append(self, edge: Any) -> None:
+        if not self.is_valid:
+            return
+        if type(edge) is not tuple or len(edge) not in (2, 3):
+            self.is_valid = False
+            return
+        if self._edge_length is None:
+            self._edge_length = len(edge)
+            self._node_type = type(edge[0])
+            if self._node_type not in (int, str):
+                self.is_valid = False
+                return
+        if (
+            len(edge) != self._edge_length
+            or type(edge[0]) is not self._node_type
+            or type(edge[1]) is not self._node_type
+        ):
+            self.is_valid = False
+            return
+
+        node_ids = self._node_ids
+        self._sources.append(node_ids.setdefault(edge[0], len(node_ids)))
+        self._destinations.append(node_ids.setdefault(edge[1], len(node_ids)))
+
+        if self._edge_length == 3:
+            weight = edge[2]
+            if type(weight) is float and self._weights.typecode == "q":
+                # integer weights are kept exact until the first floating point weight appears
+                self._weights = array("d", self._weights)
+            elif type(weight) not in (int, float):
+                self.is_valid = False
+                return
+            try:
+                self._weights.append(weight)
+            except OverflowError:
+                # integer weights exceeding 64 bits can not be kept in the typed array
+                self.is_valid = False
+
+    def save(self) -> None:
+        if not self.is_valid or self._edge_length is None:
+            return
+        nodes = np.array(list(self._node_ids))
+        # integers exceeding 64 bits would only be representable as pickled objects
+        if nodes.dtype == object:
+            return
+        # the files are written to a temporary directory first so that an interrupted run
+        # never leaves behind a partially written cache
+        temporary_path = self._cache_path.with_suffix(".tmp")
+        shutil.rmtree(temporary_path, ignore_errors=True)
+        temporary_path.mkdir(parents=True)
+
+        np.save(temporary_path / "sources.npy", np.frombuffer(self._sources, np.int64))
+        np.save(
+            temporary_path / "destinations.npy",
+            np.frombuffer(self._destinations, np.int64),
+        )
+        if self._edge_length == 3:
+            weights_type = np.int64 if self._weights.typecode == "q" else np.float64
+            np.save(
+                temporary_path / "weights.npy",
+                np.frombuffer(self._weights, weights_type),
+            )
+        np.save(temporary_path / "nodes.npy", nodes)
+        with open(temporary_path / "metadata.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {"edge_count": len(self._sources), "edge_length": self._edge_length},
+                file,
+            )
+
+        shutil.rmtree(self._cache_path, ignore_errors=True)
+        temporary_path.rename(self._cache_path)
+
+
+class EdgeCache:
+    """
+    Replays the preprocessed edges of a dataset from memory mapped arrays of interned node IDs.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        with open(cache_path / "metadata.json", encoding="utf-8") as file:
+            metadata = json.load(file)
+        self.edge_count: int = metadata["edge_count"]
+        self._edge_length: int = metadata["edge_length"]
+
+        self.sources = np.load(cache_path / "sources.npy", mmap_mode="r")
+        self.destinations = np.load(cache_path / "destinations.npy", mmap_mode="r")
+        self.weights = (
+            np.load(cache_path / "weights.npy", mmap_mode="r")
+            if self._edge_length == 3
+            else None
+        )
+        self.nodes = np.load(cache_path / "nodes.npy")
+
+    @classmethod
+    def exists(cls, cache_path: Path) -> bool:
+        return (cache_path / "metadata.json").exists()
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self.replay()
+
+    def replay(self, first_edge: int = 0) -> Iterator[tuple]:
+        # every node label is converted back to a python object only once
+        nodes = self.nodes.tolist()
+        for start in range(first_edge, self.edge_count, REPLAY_BLOCK_SIZE):
+            end = start + REPLAY_BLOCK_SIZE
+            sources = map(nodes.__getitem__, self.sources[start:end].tolist())
+            destinations = map(nodes.__getitem__, self.destinations[start:end].tolist())
+            if self.weights is None:
+                yield from zip(sources, destinations)
+            else:
+                yield from zip(sources, destinations, self.weights[start:end].tolist())
+
+    def to_dataframe(
+        self, first_edge: int = 0, last_edge: int | None = None
+    ) -> pd.DataFrame:
+        # the batch input is gathered straight from the memory mapped columns,
+        # node labels are shared python objects and weights are not copied at all
+        edges = slice(first_edge, last_edge)
+        nodes = self.nodes.astype(object)
+        columns = {0: nodes[self.sources[edges]], 1: nodes[self.destinations[edges]]}
+        if self.weights is not None:
+            columns[2] = self.weights[edges]
+        return pd.DataFrame(columns, copy=False)
@@ -0,0 +1,278 @@
+import asyncio
+import math
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from algorithms._config.interfaces import ResultList
+
+from . import comparison
+from .comparison import to_result_list
+from .metrics import RankComparison
+from .ranking import RankIndex
+from .runner import GroundTruth, Runner
+
+
+class ExperimentResults:
+    """
+    Results and measurements of a finished experiment detached from the Runner.
+    Holds only plain data (lists of results and numpy arrays), so unlike the Runner with its loaded
+    algorithms it can be sent back from the worker process which ran the experiment.
+    """
+
+    def __init__(self, runner: Runner) -> None:
+        indices = range(len(runner.streaming_names))
+
+        self.edge_count = runner.edge_count
+        self.dataset_size = runner.dataset_size
+        self.streaming_names = runner.streaming_names
+        self._streaming_results: list[ResultList] | None = [
+            to_result_list(runner.get_stream_results(index)) for index in indices
+        ]
+        self._batch_results: ResultList | None = to_result_list(
+            runner.get_batch_results()
+        )
+        # the timings are copied out of the preallocated buffers of the probes
+        self.calculation_time: list[tuple[np.ndarray, np.ndarray]] = [
+            tuple(np.array(values) for values in runner.get_calculation_time(index))  # type: ignore
+            for index in indices
+        ]
+        self.memory_usage = [runner.get_memory_usage(index) for index in indices]
+        self.memory_probe_time = runner.memory_probe_time
+        self.checkpoint_time = runner.checkpoint_time
+        self.ground_truth = runner.ground_truth
+        # the directory of the archived arrays, for results loaded from a saved experiment
+        self.archive_directory: Path | None = None
+        # built on the first comparison, after the results have been sent back from the worker
+        self._rank_indices: dict[int | None, RankIndex] = {}
+        self._rank_comparisons: dict[int, RankComparison] = {}
+
+    @classmethod
+    def restore(
+        cls,
+        archive_directory: Path,
+        edge_count: int,
+        dataset_size: int,
+        streaming_names: list[str],
+        streaming_ranks: list[RankIndex],
+        batch_rank: RankIndex,
+        calculation_time: list[tuple[np.ndarray, np.ndarray]],
+        memory_usage: list[list[tuple[int, int]]],
+        memory_probe_time: int = 0,
+        checkpoint_time: int = 0,
+        ground_truth: list[GroundTruth] | None = None,
+    ) -> "ExperimentResults":
+        # the results of a saved experiment, whose rank indices are loaded instead of built from the results
+        experiment = cls.__new__(cls)
+        experiment.edge_count = edge_count
+        experiment.dataset_size = dataset_size
+        experiment.streaming_names = streaming_names
+        # the result lists are only read from the memory-mapped rank indices once they are used
+        experiment._streaming_results = None
+        experiment._batch_results = None
+        experiment.calculation_time = calculation_time
+        experiment.memory_usage = memory_usage
+        experiment.memory_probe_time = memory_probe_time
+        experiment.checkpoint_time = checkpoint_time
+        experiment.ground_truth = ground_truth or []
+        experiment.archive_directory = archive_directory
+        experiment._rank_indices = {
+            **dict(enumerate(streaming_ranks)),
+            None: batch_rank,
+        }
+        experiment._rank_comparisons = {}
+        return experiment
+
+    @property
+    def streaming_results(self) -> list[ResultList]:
+        if self._streaming_results is None:
+            self._streaming_results = [
+                self._rank_indices[index].get_top(len(self._rank_indices[index]))
+                for index in range(len(self.streaming_names))
+            ]
+        return self._streaming_results
+
+    @property
+    def batch_results(self) -> ResultList:
+        if self._batch_results is None:
+            batch_rank = self._rank_indices[None]
+            self._batch_results = batch_rank.get_top(len(batch_rank))
+        return self._batch_results
+
+    def get_stream_results(self, index: int = 0) -> ResultList:
+        return self.streaming_results[index]
+
+    def get_batch_results(self) -> ResultList:
+        return self.batch_results
+
+    def get_rank_index(self, index: int = 0) -> RankIndex:
+        if index not in self._rank_indices:
+            self._rank_indices[index] = RankIndex(self.streaming_results[index])
+        return self._rank_indices[index]
+
+    def get_batch_rank_index(self) -> RankIndex:
+        if None not in self._rank_indices:
+            self._rank_indices[None] = RankIndex(self.batch_results)
+        return self._rank_indices[None]
+
+    def get_rank_comparison(self, index: int = 0) -> RankComparison:
+        if index not in self._rank_comparisons:
+            self._rank_comparisons[index] = RankComparison(
+                self.get_rank_index(index), self.get_batch_rank_index()
+            )
+        return self._rank_comparisons[index]
+
+    def get_rank_metrics(
+        self, orderDescending: bool, cardinality: int = 10, index: int = 0
+    ) -> dict[str, float]:
+        return self.get_rank_comparison(index).get_metrics(orderDescending, cardinality)
+
+    def get_accuracy_curves(
+        self, orderDescending: bool, index: int = 0
+    ) -> pd.DataFrame:
+        return self.get_rank_comparison(index).get_curves(orderDescending)
+
+    def get_prefix_accuracy(
+        self, orderDescending: bool, cardinality: int = 10, index: int = 0
+    ) -> pd.DataFrame:
+        # the accuracy after every evaluated prefix of the stream, ending with the whole stream
+        rows = [
+            (
+                prefix.edge_count,
+                comparison.get_jaccard_similarity(
+                    prefix.streaming_ranks[index],
+                    prefix.batch_rank,
+                    orderDescending,
+                    cardinality,
+                ),
+                comparison.get_streaming_accuracy(
+                    prefix.streaming_ranks[index],
+                    prefix.batch_rank,
+                    orderDescending,
+                    cardinality,
+                ),
+            )
+            for prefix in self.ground_truth
+        ]
+        rows.append(
+            (
+                self.edge_count,
+                self.get_jaccard_similarity(orderDescending, cardinality, index),
+                self.get_streaming_accuracy(orderDescending, cardinality, index),
+            )
+        )
+        return pd.DataFrame(
+            rows, columns=["edge", "jaccard_similarity", "streaming_accuracy"]
+        )
+
+    def get_summary(
+        self,
+        orderDescending: bool,
+        cardinality: int = 10,
+        index: int = 0,
+        with_batch: bool = True,
+    ) -> dict[str, float | None]:
+        # the measurements of a streaming algorithm and the quality of its node rank,
+        # undefined values (e.g. correlations of constant results) are None
+        _, durations = self.calculation_time[index]
+        memory = np.array([memory for _, memory in self.memory_usage[index]])
+        summary: dict[str, float | None] = {
+            "average_time_ns": get_statistic(np.mean, durations),
+            "median_time_ns": get_statistic(np.median, durations),
+            "p95_time_ns": get_statistic(np.percentile, durations, 95),
+            "p99_time_ns": get_statistic(np.percentile, durations, 99),
+            "average_memory_bytes": get_statistic(np.mean, memory),
+            "max_memory_bytes": int(memory.max()) if len(memory) else None,
+        }
+        if with_batch:
+            summary["jaccard_similarity"] = self.get_jaccard_similarity(
+                orderDescending, cardinality, index
+            )
+            summary["streaming_accuracy"] = self.get_streaming_accuracy(
+                orderDescending, cardinality, index
+            )
+            summary.update(self.get_rank_metrics(orderDescending, cardinality, index))
+        return {
+            key: None if value is None or math.isnan(value) else value
+            for key, value in summary.items()
+        }
+
+    def get_jaccard_similarity(
+        self, orderDescending: bool, cardinality: int = 10, index: int = 0
+    ) -> float:
+        return comparison.get_jaccard_similarity(
+            self.get_rank_index(index),
+            self.get_batch_rank_index(),
+            orderDescending,
+            cardinality,
+        )
+
+    def get_streaming_accuracy(
+        self, orderDescending: bool = False, cardinality: int = 10, index: int = 0
+    ) -> float:
+        return comparison.get_streaming_accuracy(
+            self.get_rank_index(index),
+            self.get_batch_rank_index(),
+            orderDescending,
+            cardinality,
+        )
+
+
+def get_statistic(
+    statistic: Callable[..., Any], values: np.ndarray, *arguments: Any
+) -> float | None:
+    return float(statistic(values, *arguments)) if len(values) else None
+
+
+def format_size(size: int) -> str:
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024:
+            return f"{size} {unit}"
+        size //= 1024
+    return "Very large"
+
+
+def run_experiment(**runner_arguments: Any) -> ExperimentResults:
+    # the algorithms are loaded from their paths in the process running the experiment
+    runner = Runner(**runner_arguments)
+    runner.validate_implementation()
+    runner.run_experiment()
+    return ExperimentResults(runner)
+
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # one worker per core, so that several experiments (e.g. from different sessions) can run at once -
+        # the workers are spawned rather than forked as the server process runs threads and an event loop
+        _executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+async def run_experiment_in_worker(**runner_arguments: Any) -> ExperimentResults:
+    global _executor
+    future = get_executor().submit(run_experiment, **runner_arguments)
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        # a worker which died (e.g. ran out of memory) makes the whole pool unusable,
+        # the next experiment starts a new one
+        _executor = None
+        raise
+
+
+def shutdown_workers() -> None:
+    # experiments still running when the app is closed are not waited for
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    for process in multiprocessing.active_children():
+        process.terminate()
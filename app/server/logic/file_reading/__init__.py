@@ -1,6 +1,15 @@
+from .compression import get_data_suffix, is_compressed, open_dataset
 from .csv_reading import CSVFile
 from .general_reading import TEXTFile
 from .mtx_reading import MTXFile
 from .processing_interface import FileProcessingStrategy
 
-__all__ = ["CSVFile", "MTXFile", "TEXTFile", "FileProcessingStrategy"]
+__all__ = [
+    "CSVFile",
+    "MTXFile",
+    "TEXTFile",
+    "FileProcessingStrategy",
+    "get_data_suffix",
+    "is_compressed",
+    "open_dataset",
+]
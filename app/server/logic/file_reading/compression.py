@@ -0,0 +1,124 @@
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, BinaryIO
+
+# amount of decompressed bytes handed over at once and how many of them may be waiting for the parser
+CHUNK_SIZE = 1 << 20
+QUEUED_CHUNK_COUNT = 8
+
+
+def open_zstandard(file_path: Path) -> BinaryIO:
+    # zstandard is only in the standard library since Python 3.14, before that the package is optional
+    try:
+        from compression import zstd  # type: ignore
+
+        return zstd.open(file_path)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        raise ModuleNotFoundError(
+            "Reading .zst datasets requires Python 3.14 or the zstandard package.",
+            name="zstandard",
+        ) from None
+    return zstandard.open(file_path, "rb")
+
+
+COMPRESSIONS: dict[str, Callable[[Path], BinaryIO]] = {
+    ".gz": gzip.open,  # type: ignore
+    ".bz2": bz2.open,  # type: ignore
+    ".xz": lzma.open,  # type: ignore
+    ".zst": open_zstandard,
+}
+
+
+def is_compressed(file_path: Path) -> bool:
+    return file_path.suffix.lower() in COMPRESSIONS
+
+
+def get_data_suffix(file_path: Path) -> str:
+    # the suffix telling how the data is read - e.g. '.csv' for both 'edges.csv' and 'edges.csv.gz'
+    if is_compressed(file_path):
+        return Path(file_path.stem).suffix
+    return file_path.suffix
+
+
+class DecompressingReader(io.RawIOBase):
+    """
+    Decompresses a dataset in a background thread, so that decompressing the following chunks
+    overlaps with parsing and processing the previous ones (the decompressors release the GIL).
+    Only a few chunks are decompressed ahead, the dataset is never kept uncompressed as a whole.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        # the file is opened right away, so that a missing decompressor is reported to the caller
+        compressed_file = COMPRESSIONS[file_path.suffix.lower()](file_path)
+        self._chunks: queue.Queue[bytes | Exception] = queue.Queue(QUEUED_CHUNK_COUNT)
+        self._chunk = memoryview(b"")
+        self._is_exhausted = False
+        self._is_stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._decompress, args=(compressed_file,), daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, chunk: bytes | Exception) -> None:
+        # waiting for the parser is interrupted when the reader is closed early
+        while not self._is_stopped.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _decompress(self, compressed_file: IO[bytes]) -> None:
+        try:
+            with compressed_file:
+                while not self._is_stopped.is_set():
+                    chunk = compressed_file.read(CHUNK_SIZE)
+                    self._put(chunk)
+                    if not chunk:
+                        return
+        # errors of the decompression (e.g. a corrupted file) are raised by the reader -
+        # whatever the decompressor raises is passed on, or the reader would wait for the next chunk forever
+        except Exception as exception:  # noqa: BLE001
+            self._put(exception)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore
+        if not self._chunk:
+            if self._is_exhausted:
+                return 0
+            chunk = self._chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                self._is_exhausted = True
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        self._is_stopped.set()
+        super().close()
+
+
+def open_dataset(file_path: Path) -> io.TextIOWrapper:
+    if not is_compressed(file_path):
+        return open(file_path, encoding="utf-8")
+    return io.TextIOWrapper(
+        io.BufferedReader(DecompressingReader(file_path), CHUNK_SIZE),
+        encoding="utf-8",
+    )
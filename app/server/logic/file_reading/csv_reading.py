@@ -1,19 +1,53 @@
+from collections.abc import Iterator, Sequence
 from csv import DictReader
 from io import TextIOWrapper
 from pathlib import Path
 
+import pandas as pd
+
 from .processing_interface import FileProcessingStrategy
 
+# amount of rows parsed at once by the column-projected reader
+CHUNK_ROW_COUNT = 1 << 16
+
+
+class CSVColumnReader:
+    """
+    Reads only the selected columns of a .csv file in chunks and yields each row
+    as a tuple of their values (in the order of the selected columns) instead of a dictionary.
+    """
+
+    def __init__(self, file_stream: TextIOWrapper, columns: Sequence[str]) -> None:
+        self.fieldnames = list(columns)
+        # all values are kept as strings, just like the csv module reads them
+        self._chunks = pd.read_csv(
+            file_stream,
+            usecols=self.fieldnames,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=CHUNK_ROW_COUNT,
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        for chunk in self._chunks:
+            yield from chunk[self.fieldnames].itertuples(index=False, name=None)
+
 
 class CSVFile(FileProcessingStrategy):
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, columns: Sequence[str] | None = None) -> None:
         self._file_path = file_path
+        self._columns = columns
 
-    def get_reader(self, file_stream: TextIOWrapper) -> DictReader[str]:
+    def get_reader(
+        self, file_stream: TextIOWrapper
+    ) -> DictReader[str] | CSVColumnReader:
+        if self._columns:
+            return CSVColumnReader(file_stream, self._columns)
         return DictReader(file_stream)
 
-    def set_headers(self, reader: DictReader[str]) -> None:
+    def set_headers(self, reader: DictReader[str] | CSVColumnReader) -> None:
         self._headers = reader.fieldnames
+        self._header_line_count = 1
 
-    def process_row(self, row: dict) -> dict:
+    def process_row(self, row: dict | tuple) -> dict | tuple:
         return row
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+# reading in large binary blocks and counting the newline bytes is done entirely in C,
+# which is an order of magnitude faster than letting a csv/text reader parse every line
+BLOCK_SIZE = 1 << 20
+
+
+def count_lines(file_path: Path) -> int:
+    line_count = 0
+    last_block = b""
+    with open(file_path, "rb") as file:
+        while block := file.read(BLOCK_SIZE):
+            line_count += block.count(b"\n")
+            last_block = block
+    # the last line does not have to be terminated with a newline
+    if last_block and not last_block.endswith(b"\n"):
+        line_count += 1
+    return line_count
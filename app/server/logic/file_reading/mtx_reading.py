@@ -1,46 +1,119 @@
-from io import TextIOWrapper
+from collections.abc import Iterator
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 
-from scipy.io import mminfo
+import numpy as np
 
 from .processing_interface import FileProcessingStrategy
 
+# amount of bytes parsed at once - a block holds roughly 500 thousand coordinate entries
+BLOCK_SIZE = 1 << 24
+
+EdgeBlock = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class MTXEdgeReader:
+    """
+    Parses the entries of a Matrix Market coordinate file in large blocks into NumPy arrays
+    instead of splitting each line separately. The blocks are read from the binary stream underlying
+    the file, so compressed datasets are parsed while they are being decompressed.
+    """
+
+    def __init__(self, file_stream: TextIOWrapper) -> None:
+        self._stream = file_stream.buffer
+
+        # the banner and the comments are followed by the size line: rows, columns, entries
+        line_count = 0
+        banner = b""
+        while True:
+            line = self._stream.readline()
+            if not line:
+                raise ValueError("The .mtx file does not contain a size line.")
+            line_count += 1
+            if line.startswith(b"%%MatrixMarket"):
+                banner = line
+            if not line.startswith(b"%") and line.strip():
+                break
+
+        if not banner:
+            raise ValueError(
+                "The .mtx file does not start with a %%MatrixMarket banner."
+            )
+        _, _, matrix_format, field, symmetry = banner.decode().lower().split()
+        row_count, column_count, entry_count = (int(size) for size in line.split())
+
+        self.headers = (
+            row_count,
+            column_count,
+            entry_count,
+            matrix_format,
+            field,
+            symmetry,
+        )
+        self.header_line_count = line_count
+        self.entry_count = entry_count
+        # pattern matrices have no values, complex ones store the real and the imaginary part
+        self._column_count = {"pattern": 2, "complex": 4}.get(field, 3)
+
+    def _parse_block(self, block: bytes) -> EdgeBlock | None:
+        entries = np.loadtxt(BytesIO(block), comments="%", ndmin=2)
+        if entries.size == 0:
+            return None
+        if entries.shape[1] != self._column_count:
+            raise ValueError(
+                f"Expected {self._column_count} values in each entry of the .mtx file, got {entries.shape[1]}."
+            )
+
+        sources = entries[:, 0].astype(np.int64)
+        destinations = entries[:, 1].astype(np.int64)
+        weights = (
+            np.ones(len(entries))
+            if self._column_count == 2
+            else np.ascontiguousarray(entries[:, 2])
+        )
+        return sources, destinations, weights
+
+    def blocks(self) -> Iterator[EdgeBlock]:
+        remainder = b""
+        while block := self._stream.read(BLOCK_SIZE):
+            # blocks are always parsed up to their last full line, the rest is carried over
+            block = remainder + block
+            line_end = block.rfind(b"\n") + 1
+            block, remainder = block[:line_end], block[line_end:]
+            if block and (entries := self._parse_block(block)) is not None:
+                yield entries
+        if remainder.strip() and (entries := self._parse_block(remainder)) is not None:
+            yield entries
+
+    def __iter__(self) -> Iterator[tuple[int, int, float]]:
+        # converting whole blocks with tolist yields plain python numbers,
+        # exactly like the previous line-by-line parsing did
+        for sources, destinations, weights in self.blocks():
+            yield from zip(sources.tolist(), destinations.tolist(), weights.tolist())
+
 
 class MTXFile(FileProcessingStrategy):
     def __init__(self, file_path: Path) -> None:
         self._file_path = file_path
 
-    def get_reader(self, file_stream: TextIOWrapper) -> TextIOWrapper:
-        return file_stream
-
-    def set_headers(self, reader: TextIOWrapper) -> None:
-        # opening the same file multiple times in one process is safe (using the default read-only mode)
-        # each time a new file object iterator is created - no shared state between them exists
-
-        # checking the header and comment count and iterating the main reader accordingly
-        with open(self._file_path) as file:
-            comment_count = 1
-            for line in file:
-                if line.startswith("%"):
-                    comment_count += 1
-                    continue
-                else:
-                    break
-
-        for _ in range(comment_count):
-            next(reader)
-
-        self._headers = mminfo(self._file_path)
-
-    def process_row(self, row: str) -> tuple[int, int] | tuple[int, int, float]:
-        # currently the formatting is based on the demo datasets, might not encapsulate all .mtx possibilities
-        split_row = row.rstrip().split(" ")
-        result = (0, 0)
-        if len(split_row) == 2:
-            result = (int(split_row[0]), int(split_row[1]), 1.0)
-        elif len(split_row) == 3:
-            result = (int(split_row[0]), int(split_row[1]), float(split_row[2]))
-        return result
+    def get_reader(self, file_stream: TextIOWrapper) -> MTXEdgeReader:
+        return MTXEdgeReader(file_stream)
+
+    def set_headers(self, reader: MTXEdgeReader) -> None:
+        # the reader has already parsed the banner, comments and the size line of the file
+        self._headers = reader.headers
+        self._header_line_count = reader.header_line_count
+        self._entry_count = reader.entry_count
+
+    def process_row(
+        self, row: tuple[int, int, float]
+    ) -> tuple[int, int] | tuple[int, int, float]:
+        # the rows are already converted to (source, destination, weight) by the reader
+        return row
+
+    def count_rows(self) -> int:
+        # the size line states the exact number of entries, no need to scan the file
+        return self._entry_count
 
     # def get_dataframe(self, lst) -> pd.DataFrame:
     # matrix = mmread(self._file_path)
@@ -1,9 +1,17 @@
 from abc import ABC, abstractmethod
 from io import TextIOWrapper
+from pathlib import Path
 from typing import Any
 
+from .compression import is_compressed
+from .line_counting import count_lines
+
 
 class FileProcessingStrategy(ABC):
+    _file_path: Path
+    # number of lines preceding the first row, set when the headers are read
+    _header_line_count: int = 0
+
     @abstractmethod
     def get_reader(self, file_stream: TextIOWrapper) -> Any: ...
 
@@ -13,6 +21,14 @@ class FileProcessingStrategy(ABC):
     @abstractmethod
     def process_row(self, row: Any) -> Any: ...
 
+    def count_rows(self) -> int | None:
+        # an estimate based on the newline count - used only for scheduling the memory samples
+        # and preallocating buffers, the exact edge count is known once the stream is processed
+        # compressed datasets are not decompressed an extra time only to count their lines
+        if is_compressed(self._file_path):
+            return None
+        return max(count_lines(self._file_path) - self._header_line_count, 0)
+
     # @abstractmethod
     # def get_dataframe(self, lst: list) -> pd.DataFrame:
     #     ...
@@ -0,0 +1,156 @@
+import os
+import time
+import tracemalloc
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from pympler.asizeof import asizeof
+
+from algorithms._config.interfaces import StreamingAlgorithm
+
+STATM_FILE = Path("/proc/self/statm")
+# allocations are attributed to the algorithm even when they happen a few calls deeper
+# (e.g. in the standard library called by the algorithm)
+TRACEMALLOC_FRAME_COUNT = 4
+
+
+class MemoryBackend(StrEnum):
+    AUTOMATIC = "automatic"
+    ASIZEOF = "asizeof"
+    FOOTPRINT = "footprint"
+    TRACEMALLOC = "tracemalloc"
+    RSS = "rss"
+
+
+class MemoryBackendError(ValueError):
+    pass
+
+
+def is_reporting_footprint(algorithm: StreamingAlgorithm) -> bool:
+    return type(algorithm).memory_footprint is not StreamingAlgorithm.memory_footprint
+
+
+class MemoryProbe:
+    """
+    Samples the memory usage of the streaming algorithm in bytes every sampling interval edges.
+
+    Backends:
+    - asizeof - approximate size of the whole object graph of the algorithm (cost grows with its state)
+    - footprint - size reported by the memory_footprint method of the algorithm
+    - tracemalloc - memory currently allocated by the code in the algorithm's file
+      (tracing slows down every allocation, including the ones in the timed calculations)
+    - rss - resident memory of the whole process read from /proc/self/statm (Linux only)
+    - automatic - footprint if the algorithm implements it, asizeof otherwise
+
+    The time spent on measuring is accumulated separately and never included in the calculation times.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryBackend,
+        algorithm: StreamingAlgorithm,
+        algorithm_path: Path,
+        sampling_interval: int = 1,
+    ) -> None:
+        if backend == MemoryBackend.AUTOMATIC:
+            backend = (
+                MemoryBackend.FOOTPRINT
+                if is_reporting_footprint(algorithm)
+                else MemoryBackend.ASIZEOF
+            )
+        if backend == MemoryBackend.FOOTPRINT and not is_reporting_footprint(algorithm):
+            raise MemoryBackendError(
+                "The streaming algorithm does not implement the memory_footprint method required by the selected memory measurement."
+            )
+        if backend == MemoryBackend.RSS and not STATM_FILE.exists():
+            raise MemoryBackendError(
+                "Measuring the resident memory of the process is only supported on Linux."
+            )
+
+        self.backend = backend
+        self._algorithm = algorithm
+        self._algorithm_file = str(Path(algorithm_path).resolve())
+        self._page_size = (
+            os.sysconf("SC_PAGE_SIZE") if backend == MemoryBackend.RSS else 0
+        )
+        self.interval = sampling_interval
+        # upper limit of the samples when the interval adapts to an unknown edge count
+        self._sample_limit: int | None = None
+
+        self.samples: list[tuple[int, int]] = []
+        # total time spent on taking the samples in nanoseconds
+        self.probe_time = 0
+        # index of the next edge after which the memory should be sampled
+        self.next_edge = 0
+        self._is_tracing = False
+
+    def start(self) -> None:
+        # tracing may already be started by the probe of another algorithm of the same run,
+        # only the probe which started it stops it
+        if self.backend == MemoryBackend.TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAME_COUNT)
+            self._is_tracing = True
+
+    def stop(self) -> None:
+        if self._is_tracing:
+            tracemalloc.stop()
+            self._is_tracing = False
+
+    def measure(self) -> int:
+        match self.backend:
+            case MemoryBackend.FOOTPRINT:
+                return self._algorithm.memory_footprint()
+            case MemoryBackend.TRACEMALLOC:
+                snapshot = tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(True, self._algorithm_file, all_frames=True)]
+                )
+                return sum(
+                    statistic.size for statistic in snapshot.statistics("filename")
+                )
+            case MemoryBackend.RSS:
+                with open(STATM_FILE, encoding="utf-8") as statm:
+                    resident_pages = int(statm.read().split()[1])
+                return resident_pages * self._page_size
+            case _:
+                return asizeof(self._algorithm)
+
+    def adapt_interval(self, sample_count: int) -> None:
+        # every edge is sampled at first - whenever the samples reach twice the sample count,
+        # every other one is dropped and the interval doubles, keeping them evenly spaced
+        self.interval = 1
+        self._sample_limit = 2 * sample_count
+
+    def sample(self, edge: int) -> None:
+        probe_start = time.perf_counter_ns()
+        self.samples.append((edge, self.measure()))
+        self.probe_time += time.perf_counter_ns() - probe_start
+        self.next_edge = edge + self.interval
+
+        if self._sample_limit is not None and len(self.samples) >= self._sample_limit:
+            self.samples = self.samples[::2]
+            self.interval *= 2
+            self.next_edge = self.samples[-1][0] + self.interval
+
+    def get_state(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "probe_time": self.probe_time,
+            "next_edge": self.next_edge,
+            "interval": self.interval,
+            "sample_limit": self._sample_limit,
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self.samples = list(state["samples"])
+        self.probe_time = state["probe_time"]
+        self.next_edge = state["next_edge"]
+        self.interval = state["interval"]
+        self._sample_limit = state["sample_limit"]
+
+    def sample_block(self, first_edge: int, edge_count: int) -> None:
+        # a block of edges is sampled once if the schedule falls into it,
+        # labelled with the last scheduled edge of the block
+        last_edge = first_edge + edge_count - 1
+        if self.next_edge <= last_edge:
+            self.sample(last_edge - (last_edge - self.next_edge) % self.interval)
@@ -0,0 +1,231 @@
+import math
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from .ranking import RankIndex
+
+# labels of the rank quality metrics in the results and reports
+METRIC_NAMES = {
+    "kendall_tau": "Kendall tau",
+    "spearman_rho": "Spearman rho",
+    "ndcg": "NDCG@k",
+    "precision": "precision@k",
+    "recall": "recall@k",
+    "mean_absolute_error": "mean absolute error",
+    "mean_relative_error": "mean relative error",
+}
+
+
+def get_tied_pair_count(sorted_values: np.ndarray) -> int:
+    run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    run_lengths = np.diff(np.r_[run_starts, len(sorted_values)])
+    return int((run_lengths * (run_lengths - 1) // 2).sum())
+
+
+def count_inversions(values: np.ndarray) -> int:
+    # pairs i < j with values[i] > values[j], counted by a bottom-up merge sort which merges all pairs
+    # of neighbouring blocks of a level at once - offsetting the dense ranks of every pair of blocks keeps
+    # the pairs apart, and the stable sort places equal elements of the left block first
+    # an element of a right block moves ahead of every greater element of its left block, so the
+    # inversions are the sum of the distances the elements of the right blocks move in the merge
+    size = len(values)
+    _, values = np.unique(values, return_inverse=True)
+    span = int(values.max()) + 1 if size else 1
+    positions = np.arange(size)
+    count = 0
+    width = 1
+    while width < size:
+        pair_offsets = positions // (2 * width) * span
+        order = np.argsort(pair_offsets + values, kind="stable")
+        is_right = order % (2 * width) >= width
+        # the position of each element of a right block before and after the merge
+        count += int(order[is_right].sum() - positions[is_right].sum())
+        values = values[order]
+        width *= 2
+    return count
+
+
+def get_kendall_tau(x: np.ndarray, y: np.ndarray) -> float:
+    # tau-b, which accounts for ties, in O(n log^2 n) following Knight's algorithm
+    size = len(x)
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+    pair_count = size * (size - 1) // 2
+    x_ties = get_tied_pair_count(x)
+    y_ties = get_tied_pair_count(np.sort(y))
+    joint_run_starts = np.r_[True, (x[1:] != x[:-1]) | (y[1:] != y[:-1])]
+    joint_ties = get_tied_pair_count(np.cumsum(joint_run_starts))
+    # pairs sorted by x which are out of order in y are discordant (ties in x are sorted by y)
+    discordant = count_inversions(y)
+
+    denominator = math.sqrt((pair_count - x_ties) * (pair_count - y_ties))
+    if not denominator:
+        return math.nan
+    return (pair_count - x_ties - y_ties + joint_ties - 2 * discordant) / denominator
+
+
+def get_average_ranks(values: np.ndarray) -> np.ndarray:
+    # tied values share the average of their ranks
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    is_run_start = np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    run_starts = np.flatnonzero(is_run_start)
+    run_ends = np.r_[run_starts[1:], len(values)]
+    ranks = np.empty(len(values))
+    ranks[order] = ((run_starts + run_ends - 1) / 2)[np.cumsum(is_run_start) - 1]
+    return ranks
+
+
+def get_spearman_rho(x: np.ndarray, y: np.ndarray) -> float:
+    x_ranks, y_ranks = get_average_ranks(x), get_average_ranks(y)
+    if len(x) < 2 or not x_ranks.std() or not y_ranks.std():
+        return math.nan
+    return float(np.corrcoef(x_ranks, y_ranks)[0, 1])
+
+
+class RankComparison:
+    """
+    Results of a streaming algorithm aligned with the results of the batch algorithm by node.
+    Every node ranked by either of them has its value and position in both arrays - a node missing from
+    the results of one algorithm has the value 0 and no position there. The metrics of all nodes are
+    computed once, the metrics of the top nodes are computed for the given order and cardinality.
+    """
+
+    def __init__(self, streaming_rank: RankIndex, batch_rank: RankIndex) -> None:
+        # the nodes of both results are hashed once, every node gets a code shared by both of them
+        codes, nodes = pd.factorize(
+            np.concatenate((streaming_rank.nodes, batch_rank.nodes))
+        )
+        streaming_codes = codes[: len(streaming_rank)]
+        batch_codes = codes[len(streaming_rank) :]
+
+        self._streaming_count = len(streaming_rank)
+        self._batch_count = len(batch_rank)
+        self.streaming_positions, self.streaming_values = self._align(
+            streaming_codes, streaming_rank, len(nodes)
+        )
+        self.batch_positions, self.batch_values = self._align(
+            batch_codes, batch_rank, len(nodes)
+        )
+        self._curves: dict[bool, pd.DataFrame] = {}
+
+    @staticmethod
+    def _align(
+        codes: np.ndarray, rank_index: RankIndex, node_count: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # the first (highest) position of a node submitted more than once is kept
+        positions = np.full(node_count, len(codes))
+        np.minimum.at(positions, codes, np.arange(len(codes)))
+        is_ranked = positions < len(codes)
+        positions[~is_ranked] = -1
+        values = np.zeros(node_count)
+        values[is_ranked] = rank_index.values[positions[is_ranked]]
+        return positions, values
+
+    @cached_property
+    def kendall_tau(self) -> float:
+        return get_kendall_tau(self.streaming_values, self.batch_values)
+
+    @cached_property
+    def spearman_rho(self) -> float:
+        return get_spearman_rho(self.streaming_values, self.batch_values)
+
+    @cached_property
+    def _batch_errors(self) -> tuple[np.ndarray, np.ndarray]:
+        # the errors are measured on the nodes ranked by the batch algorithm, the exact results
+        is_ranked = self.batch_positions >= 0
+        exact_values = self.batch_values[is_ranked]
+        return np.abs(self.streaming_values[is_ranked] - exact_values), exact_values
+
+    @property
+    def mean_absolute_error(self) -> float:
+        errors, _ = self._batch_errors
+        return float(errors.mean()) if len(errors) else math.nan
+
+    @property
+    def mean_relative_error(self) -> float:
+        errors, exact_values = self._batch_errors
+        is_nonzero = exact_values != 0
+        if not is_nonzero.any():
+            return math.nan
+        return float((errors[is_nonzero] / np.abs(exact_values[is_nonzero])).mean())
+
+    @staticmethod
+    def _get_ranks(
+        positions: np.ndarray, count: int, orderDescending: bool
+    ) -> np.ndarray:
+        # zero-based ranks in the given order, -1 for the nodes which were not ranked
+        if orderDescending:
+            return positions
+        return np.where(positions >= 0, count - 1 - positions, -1)
+
+    def get_top_metrics(
+        self, orderDescending: bool, cardinality: int
+    ) -> dict[str, float]:
+        streaming_ranks = self._get_ranks(
+            self.streaming_positions, self._streaming_count, orderDescending
+        )
+        batch_ranks = self._get_ranks(
+            self.batch_positions, self._batch_count, orderDescending
+        )
+        in_streaming_top = (streaming_ranks >= 0) & (streaming_ranks < cardinality)
+        in_batch_top = (batch_ranks >= 0) & (batch_ranks < cardinality)
+        hit_count = int((in_streaming_top & in_batch_top).sum())
+        streaming_top_count = int(in_streaming_top.sum())
+        batch_top_count = int(in_batch_top.sum())
+
+        # the gain of a node is graded by its position among the top nodes of the batch algorithm
+        gains = np.where(in_batch_top, cardinality - batch_ranks, 0)[in_streaming_top]
+        discounted_gain = (gains / np.log2(streaming_ranks[in_streaming_top] + 2)).sum()
+        ideal_ranks = np.arange(batch_top_count)
+        ideal_gain = ((cardinality - ideal_ranks) / np.log2(ideal_ranks + 2)).sum()
+
+        return {
+            "ndcg": float(discounted_gain / ideal_gain) if ideal_gain else math.nan,
+            "precision": (
+                hit_count / streaming_top_count if streaming_top_count else math.nan
+            ),
+            "recall": hit_count / batch_top_count if batch_top_count else math.nan,
+        }
+
+    def get_curves(self, orderDescending: bool) -> pd.DataFrame:
+        # a node is among the top k nodes of both algorithms for every k greater than the larger of its ranks,
+        # so the metrics of all cardinalities are cumulative counts of the ranks
+        if orderDescending not in self._curves:
+            streaming_ranks = self._get_ranks(
+                self.streaming_positions, self._streaming_count, orderDescending
+            )
+            batch_ranks = self._get_ranks(
+                self.batch_positions, self._batch_count, orderDescending
+            )
+            size = max(self._streaming_count, self._batch_count)
+
+            def count_top(ranks: np.ndarray) -> np.ndarray:
+                return np.cumsum(np.bincount(ranks[ranks >= 0], minlength=size))
+
+            is_shared = (streaming_ranks >= 0) & (batch_ranks >= 0)
+            hit_counts = count_top(np.maximum(streaming_ranks, batch_ranks)[is_shared])
+            streaming_top_counts = count_top(streaming_ranks)
+            batch_top_counts = count_top(batch_ranks)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._curves[orderDescending] = pd.DataFrame(
+                    {
+                        "k": np.arange(1, size + 1),
+                        "jaccard_similarity": hit_counts
+                        / (streaming_top_counts + batch_top_counts - hit_counts),
+                        "precision": hit_counts / streaming_top_counts,
+                        "recall": hit_counts / batch_top_counts,
+                    }
+                )
+        return self._curves[orderDescending]
+
+    def get_metrics(self, orderDescending: bool, cardinality: int) -> dict[str, float]:
+        return {
+            "kendall_tau": self.kendall_tau,
+            "spearman_rho": self.spearman_rho,
+            **self.get_top_metrics(orderDescending, cardinality),
+            "mean_absolute_error": self.mean_absolute_error,
+            "mean_relative_error": self.mean_relative_error,
+        }
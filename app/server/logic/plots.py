@@ -0,0 +1,182 @@
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from plotly.graph_objs import Figure
+
+# upper limit of the buckets of a downsampled series, each of them keeps its lowest and highest point
+PLOT_BUCKET_COUNT = 2000
+# upper limit of the cardinalities plotted on an accuracy curve
+ACCURACY_CURVE_POINT_COUNT = 1000
+ACCURACY_CURVE_METRICS = {
+    "jaccard_similarity": "Jaccard similarity",
+    "precision": "precision@k",
+}
+PREFIX_ACCURACY_METRICS = {
+    "jaccard_similarity": "Jaccard similarity",
+    "streaming_accuracy": "streaming accuracy",
+}
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_range: Sequence[float] | None = None,
+    bucket_count: int = PLOT_BUCKET_COUNT,
+) -> tuple[np.ndarray, np.ndarray]:
+    # the points of a sorted series are split into buckets of equal length, the lowest and the highest point
+    # of every bucket are kept - unlike averaging or plain decimation, no spike is lost
+    if x_range is not None:
+        # the points right outside of the range are kept, so that the line reaches its edges
+        start = max(int(np.searchsorted(x, x_range[0])) - 1, 0)
+        end = int(np.searchsorted(x, x_range[1], side="right")) + 1
+        x, y = x[start:end], y[start:end]
+    if len(x) <= 2 * bucket_count:
+        return x, y
+
+    bucket_size = -(-len(x) // bucket_count)
+    full_length = len(x) // bucket_size * bucket_size
+    buckets = y[:full_length].reshape(-1, bucket_size)
+    offsets = np.arange(0, full_length, bucket_size)
+    indices = [
+        offsets + buckets.argmin(axis=1),
+        offsets + buckets.argmax(axis=1),
+        [0, len(x) - 1],
+    ]
+    if full_length < len(x):
+        tail = y[full_length:]
+        indices.append([full_length + tail.argmin(), full_length + tail.argmax()])
+    selected = np.unique(np.concatenate(indices))
+    return x[selected], y[selected]
+
+
+def get_series_plot(
+    streaming_names: Sequence[str],
+    series: Sequence[tuple[np.ndarray, np.ndarray]],
+    labels: dict[str, str],
+    template: str = "plotly",
+) -> Figure:
+    # one line per streaming algorithm, rendered with WebGL
+    x_name, y_name = labels
+    df = pd.concat(
+        pd.DataFrame(dict(zip(labels, downsample(x, y)))).assign(algorithm=name)
+        for name, (x, y) in zip(streaming_names, series)
+    )
+    line_plot = px.line(
+        df,
+        x=x_name,
+        y=y_name,
+        color="algorithm" if len(streaming_names) > 1 else None,
+        labels=labels,
+        render_mode="webgl",
+        template=template,
+    )
+    return line_plot
+
+
+def get_calculation_time_plot(
+    streaming_names: Sequence[str],
+    calculation_time: Sequence[tuple[np.ndarray, np.ndarray]],
+    template: str = "plotly",
+) -> Figure:
+    return get_series_plot(
+        streaming_names,
+        calculation_time,
+        {"edge": "edge", "time": "time [ns]"},
+        template,
+    )
+
+
+def get_accuracy_curve_plot(
+    streaming_names: Sequence[str],
+    curves: Sequence[pd.DataFrame],
+    cardinality: int | None = None,
+    template: str = "plotly",
+) -> Figure:
+    # the cardinalities are thinned out evenly on the logarithmic axis for results of many nodes
+    df = pd.concat(
+        [
+            curve.iloc[
+                np.unique(
+                    np.geomspace(1, len(curve), ACCURACY_CURVE_POINT_COUNT).astype(int)
+                )
+                - 1
+            ]
+            .rename(columns=ACCURACY_CURVE_METRICS)
+            .melt(
+                id_vars="k",
+                value_vars=list(ACCURACY_CURVE_METRICS.values()),
+                var_name="metric",
+            )
+            .assign(algorithm=name)
+            for name, curve in zip(streaming_names, curves)
+            if len(curve)
+        ]
+        or [pd.DataFrame(columns=["k", "metric", "value", "algorithm"])]
+    )
+    line_plot = px.line(
+        df,
+        x="k",
+        y="value",
+        color="algorithm" if len(streaming_names) > 1 else None,
+        line_dash="metric",
+        log_x=True,
+        labels={"k": "cardinality of node rank", "value": ""},
+        template=template,
+    )
+    if cardinality is not None:
+        line_plot.add_vline(x=cardinality, line_dash="dot", line_color="gray")
+    return line_plot
+
+
+def get_prefix_accuracy_plot(
+    streaming_names: Sequence[str],
+    prefix_accuracy: Sequence[pd.DataFrame],
+    template: str = "plotly",
+) -> Figure:
+    # plotted against the processed edges like the memory usage history
+    df = pd.concat(
+        accuracy.rename(columns=PREFIX_ACCURACY_METRICS)
+        .melt(
+            id_vars="edge",
+            value_vars=list(PREFIX_ACCURACY_METRICS.values()),
+            var_name="metric",
+        )
+        .assign(algorithm=name)
+        for name, accuracy in zip(streaming_names, prefix_accuracy)
+    )
+    line_plot = px.line(
+        df,
+        x="edge",
+        y="value",
+        color="algorithm" if len(streaming_names) > 1 else None,
+        line_dash="metric",
+        markers=True,
+        labels={"edge": "edge", "value": ""},
+        template=template,
+    )
+    return line_plot
+
+
+def get_memory_series(
+    memory_usage: Sequence[list[tuple[int, int]]],
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    series = []
+    for samples in memory_usage:
+        values = np.array(samples, dtype=np.int64).reshape(-1, 2)
+        series.append((values[:, 0], values[:, 1]))
+    return series
+
+
+def get_memory_usage_plot(
+    streaming_names: Sequence[str],
+    memory_series: Sequence[tuple[np.ndarray, np.ndarray]],
+    template: str = "plotly",
+) -> Figure:
+    return get_series_plot(
+        streaming_names,
+        memory_series,
+        {"edge": "edge", "memory": "memory [B]"},
+        template,
+    )
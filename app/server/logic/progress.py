@@ -0,0 +1,170 @@
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from enum import IntEnum
+from pathlib import Path
+
+import numpy as np
+
+from algorithms._config.interfaces import ResultList
+
+PROGRESS_FILE = "progress.bin"
+SNAPSHOT_FILE = "snapshot.pickle"
+# progress is published at most this often (in nanoseconds), so that it does not slow down the processing
+PROGRESS_INTERVAL = 100_000_000
+READ_ATTEMPTS = 10
+
+
+class ProgressPhase(IntEnum):
+    STREAMING = 0
+    BATCH = 1
+    DONE = 2
+
+
+# fields of the shared progress record, the sequence is odd while the record is being written
+SEQUENCE = 0
+PHASE = 1
+EDGE_COUNT = 2
+EXPECTED_EDGE_COUNT = 3
+ELAPSED_TIME = 4
+MEMORY = 5
+SNAPSHOT = 6
+FIELD_COUNT = 7
+
+
+class Progress:
+    def __init__(self, fields: np.ndarray) -> None:
+        self.phase = ProgressPhase(fields[PHASE])
+        self.edge_count = int(fields[EDGE_COUNT])
+        # unknown for compressed datasets until they have been read
+        self.expected_edge_count: int | None = (
+            int(fields[EXPECTED_EDGE_COUNT])
+            if fields[EXPECTED_EDGE_COUNT] >= 0
+            else None
+        )
+        self.elapsed_time = int(fields[ELAPSED_TIME])
+        self.memory: int | None = int(fields[MEMORY]) if fields[MEMORY] >= 0 else None
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edge_count / self.elapsed_time * 1e9 if self.elapsed_time else 0.0
+
+    @property
+    def fraction(self) -> float | None:
+        if not self.expected_edge_count:
+            return None
+        return min(self.edge_count / self.expected_edge_count, 1.0)
+
+    @property
+    def remaining_seconds(self) -> float | None:
+        if not self.expected_edge_count or not self.edges_per_second:
+            return None
+        remaining_edge_count = max(self.expected_edge_count - self.edge_count, 0)
+        return remaining_edge_count / self.edges_per_second
+
+
+class ProgressChannel:
+    """
+    Progress of an experiment running in a worker process, shared through a small memory mapped file.
+    The worker is the only writer of the record, which is guarded by a sequence number instead of a lock -
+    readers retry while it is odd (being written) or changes during the read. Partial results are
+    written to a separate file, which is atomically replaced with every new snapshot.
+    """
+
+    def __init__(self) -> None:
+        self.directory = Path(tempfile.mkdtemp(prefix="nst-progress-"))
+        self._fields = np.memmap(
+            self.directory / PROGRESS_FILE,
+            dtype=np.int64,
+            mode="w+",
+            shape=(FIELD_COUNT,),
+        )
+        self._fields[EXPECTED_EDGE_COUNT] = -1
+        self._fields[MEMORY] = -1
+        self._fields.flush()
+        self._snapshot_version = 0
+        self._snapshot: tuple[int, list[ResultList]] | None = None
+
+    def read(self) -> Progress | None:
+        for _ in range(READ_ATTEMPTS):
+            sequence = self._fields[SEQUENCE]
+            if sequence % 2:
+                continue
+            fields = np.array(self._fields)
+            if self._fields[SEQUENCE] == sequence:
+                return Progress(fields)
+        return None
+
+    def read_snapshot(self) -> tuple[int, list[ResultList]] | None:
+        # the edge count at the time of the snapshot and the partial results of each streaming algorithm
+        version = int(self._fields[SNAPSHOT])
+        if version != self._snapshot_version:
+            with open(self.directory / SNAPSHOT_FILE, "rb") as file:
+                self._snapshot = pickle.load(file)
+            self._snapshot_version = version
+        return self._snapshot
+
+    def close(self) -> None:
+        del self._fields
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class ProgressPublisher:
+    """
+    Writes the progress of an experiment to the channel opened by the server.
+    Both the progress and the snapshots are only published after whole blocks of edges and never
+    within the timed calculations.
+    """
+
+    def __init__(
+        self, directory: Path, expected_edge_count: int | None, snapshot_interval: float
+    ) -> None:
+        self._directory = directory
+        self._fields = np.memmap(
+            directory / PROGRESS_FILE, dtype=np.int64, mode="r+", shape=(FIELD_COUNT,)
+        )
+        self._expected_edge_count = (
+            expected_edge_count if expected_edge_count is not None else -1
+        )
+        self._start = time.perf_counter_ns()
+        self._next_update = self._start
+        # snapshots every given amount of seconds, none if it is zero
+        self._snapshot_interval = int(snapshot_interval * 1e9)
+        self._next_snapshot = self._start + self._snapshot_interval
+
+    def is_due(self) -> bool:
+        return time.perf_counter_ns() >= self._next_update
+
+    def is_snapshot_due(self) -> bool:
+        return (
+            self._snapshot_interval > 0
+            and time.perf_counter_ns() >= self._next_snapshot
+        )
+
+    def update(
+        self, phase: ProgressPhase, edge_count: int, memory: int | None = None
+    ) -> None:
+        now = time.perf_counter_ns()
+        fields = self._fields
+        fields[SEQUENCE] += 1
+        fields[PHASE] = phase
+        fields[EDGE_COUNT] = edge_count
+        fields[EXPECTED_EDGE_COUNT] = (
+            self._expected_edge_count
+            if phase == ProgressPhase.STREAMING
+            else edge_count
+        )
+        fields[ELAPSED_TIME] = now - self._start
+        fields[MEMORY] = memory if memory is not None else -1
+        fields[SEQUENCE] += 1
+        self._next_update = now + PROGRESS_INTERVAL
+
+    def submit_snapshot(self, edge_count: int, results: list[ResultList]) -> None:
+        temporary_path = self._directory / f"{SNAPSHOT_FILE}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump((edge_count, results), file)
+        os.replace(temporary_path, self._directory / SNAPSHOT_FILE)
+        self._fields[SNAPSHOT] += 1
+        self._next_snapshot = time.perf_counter_ns() + self._snapshot_interval
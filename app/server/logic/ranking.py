@@ -0,0 +1,73 @@
+import heapq
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+
+from algorithms._config.interfaces import ResultList
+
+
+def get_top_results(
+    results: ResultList, cardinality: int, orderDescending: bool = True
+) -> ResultList:
+    # a single query of a few top nodes does not need the whole result list sorted
+    select = heapq.nlargest if orderDescending else heapq.nsmallest
+    return select(cardinality, results, key=itemgetter(1))
+
+
+class RankIndex:
+    """
+    Node rank of a result list sorted by value once, so that the top nodes of any cardinality and order
+    are sliced from the sorted arrays, and the rank of a node is looked up in a map built on first use.
+    """
+
+    def __init__(self, results: ResultList) -> None:
+        count = len(results)
+        nodes = np.fromiter((node for node, _ in results), dtype=object, count=count)
+        values = np.array([value for _, value in results])
+        # stable, so that nodes with equal values keep the order in which they were submitted
+        # (reversed in the ascending order, which is read from the end)
+        # booleans, None and integers exceeding 64 bits are compared as floats, None as NaN ranked last
+        keys = values if values.dtype.kind in "if" else values.astype(float)
+        order = np.argsort(-keys, kind="stable")
+        self.nodes = nodes[order]
+        self.values = values[order]
+        self._ranks: dict[Any, int] | None = None
+
+    @classmethod
+    def from_sorted(cls, nodes: np.ndarray, values: np.ndarray) -> "RankIndex":
+        # arrays already in the order of a rank index (e.g. loaded from saved results) are not sorted again
+        rank_index = cls.__new__(cls)
+        rank_index.nodes = nodes
+        rank_index.values = values
+        rank_index._ranks = None
+        return rank_index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _get_slice(self, cardinality: int, orderDescending: bool) -> slice:
+        if orderDescending:
+            return slice(0, cardinality)
+        # the ascending order is the descending one read from the end
+        return slice(-1, -min(cardinality, len(self.nodes)) - 1, -1)
+
+    def get_top_nodes(
+        self, cardinality: int, orderDescending: bool = True
+    ) -> list[Any]:
+        return self.nodes[self._get_slice(cardinality, orderDescending)].tolist()
+
+    def get_top(self, cardinality: int, orderDescending: bool = True) -> ResultList:
+        selected = self._get_slice(cardinality, orderDescending)
+        return list(zip(self.nodes[selected].tolist(), self.values[selected].tolist()))
+
+    def get_rank(self, node: Any, orderDescending: bool = True) -> int | None:
+        # zero-based position of the node in the given order, None if it was not ranked
+        if self._ranks is None:
+            nodes = self.nodes.tolist()
+            # the first position of a node submitted more than once is kept
+            self._ranks = dict(zip(reversed(nodes), range(len(nodes) - 1, -1, -1)))
+        rank = self._ranks.get(node)
+        if rank is None or orderDescending:
+            return rank
+        return len(self.nodes) - 1 - rank
@@ -3,11 +3,13 @@ import inspect
 import os
 import sys
 import time
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-from pympler.asizeof import asizeof
 
 from algorithms._config.interfaces import (
     BatchAlgorithm,
@@ -16,11 +18,21 @@ from algorithms._config.interfaces import (
     StreamingAlgorithm,
 )
 
-from .file_reading import CSVFile, MTXFile, TEXTFile
+from . import comparison
+from .batch_buffer import BatchBuffer
+from .catalog import get_dataset_hash
+from .checkpoint import Checkpoint, get_checkpoint_path
+from .comparison import to_result_list
+from .edge_cache import EdgeCache, EdgeCacheWriter, get_cache_path
+from .file_reading import CSVFile, MTXFile, TEXTFile, get_data_suffix, open_dataset
+from .memory import MemoryBackend, MemoryBackendError, MemoryProbe
+from .progress import ProgressPhase, ProgressPublisher
+from .ranking import RankIndex
+from .timing import TimingMode, TimingProbe
 
 
 def get_class_instance_from(
-    file_path: Path,
+    file_path: Path, **parameters: Any
 ) -> BatchAlgorithm | PreprocessEdge | StreamingAlgorithm | None:
     module_name = os.path.basename(file_path)
 
@@ -37,11 +49,112 @@ def get_class_instance_from(
         if not inspect.isabstract(MysteriousClass) and issubclass(
             MysteriousClass, (BatchAlgorithm, PreprocessEdge, StreamingAlgorithm)
         ):
-            return MysteriousClass()
+            return MysteriousClass(**parameters)
+
+
+# upper limit of the amount of edges passed at once to algorithms implementing on_edges_calculate
+EDGE_BLOCK_SIZE = 4096
 
 
 def get_sampling_interval(total_count: int, sample_count: int) -> int:
-    return total_count // sample_count
+    # datasets smaller than the sample count are sampled on every edge
+    return max(total_count // sample_count, 1)
+
+
+def is_updating_property(algorithm: BatchAlgorithm) -> bool:
+    return type(algorithm).update_property is not BatchAlgorithm.update_property
+
+
+def is_accumulating_edges(algorithm: BatchAlgorithm) -> bool:
+    algorithm_class = type(algorithm)
+    return (
+        algorithm_class.on_edge_accumulate is not BatchAlgorithm.on_edge_accumulate
+        or algorithm_class.on_edges_accumulate is not BatchAlgorithm.on_edges_accumulate
+    )
+
+
+class GroundTruth:
+    """
+    Node ranks of the batch algorithm and of every streaming algorithm after a prefix of the stream.
+    """
+
+    def __init__(
+        self, edge_count: int, batch_rank: RankIndex, streaming_ranks: list[RankIndex]
+    ) -> None:
+        self.edge_count = edge_count
+        self.batch_rank = batch_rank
+        self.streaming_ranks = streaming_ranks
+
+
+class StreamingTrack:
+    """
+    One of the streaming algorithms fed with the edges of the shared pass over the dataset,
+    together with its own timing and memory measurements.
+    """
+
+    def __init__(
+        self,
+        streaming_path: Path,
+        parameters: Mapping[str, Any],
+        expected_edge_count: int,
+        timing_mode: TimingMode,
+        timing_interval: int,
+        memory_backend: MemoryBackend,
+    ) -> None:
+        self.path = streaming_path
+        self.parameters = dict(parameters)
+        # the parameters are passed to the constructor of the algorithm class
+        self.algorithm: StreamingAlgorithm = get_class_instance_from(  # type: ignore
+            streaming_path, **self.parameters
+        )
+        self.name = type(self.algorithm).__name__
+        if self.parameters:
+            arguments = ", ".join(
+                f"{key}={value!r}" for key, value in parameters.items()
+            )
+            self.name += f"({arguments})"
+
+        # time intervals are saved using the perf_counter_ns for greater precision,
+        # the buffers are preallocated based on the (estimated) edge count
+        self.timing = TimingProbe(timing_mode, expected_edge_count, timing_interval)
+
+        # samples the memory used by the streaming algorithm in bytes - by default with pympler,
+        # which is restricted to the object itself and is an approximation of its size
+        # stops recording when the streaming algorithm is done computing
+        self.memory = MemoryProbe(memory_backend, self.algorithm, streaming_path)
+
+    def is_processing_blocks(self) -> bool:
+        # the block interface is optional, the default implementation only loops over the edges
+        # (timing whole blocks is also possible for algorithms processing edges one by one)
+        return (
+            type(self.algorithm).on_edges_calculate
+            is not StreamingAlgorithm.on_edges_calculate
+            or self.timing.mode == TimingMode.PER_BLOCK
+        )
+
+    def process_edges(self, edges: Sequence[Any], first_edge: int) -> None:
+        algorithm = self.algorithm
+        timing = self.timing
+        memory = self.memory
+        for edge_index, edge in enumerate(edges, first_edge):
+            if edge_index == timing.next_edge:
+                property_start = time.perf_counter_ns()
+                algorithm.on_edge_calculate(edge)
+                property_end = time.perf_counter_ns()
+                timing.record(edge_index, property_end - property_start)
+            else:
+                algorithm.on_edge_calculate(edge)
+
+            if edge_index == memory.next_edge:
+                memory.sample(edge_index)
+
+    def process_block(self, edges: Sequence[Any], first_edge: int) -> None:
+        property_start = time.perf_counter_ns()
+        self.algorithm.on_edges_calculate(edges)
+        property_end = time.perf_counter_ns()
+
+        self.timing.record_block(first_edge, len(edges), property_end - property_start)
+        self.memory.sample_block(first_edge, len(edges))
 
 
 class Runner:
@@ -49,8 +162,19 @@ class Runner:
         self,
         dataset_path: Path,
         preprocessing_path: Path | None,
-        streaming_path: Path,
+        streaming_path: Path | Sequence[Path],
         batch_path: Path | None,
+        streaming_parameters: Sequence[Mapping[str, Any]] | None = None,
+        use_edge_cache: bool = False,
+        timing_mode: TimingMode = TimingMode.EVERY_EDGE,
+        timing_interval: int = 100,
+        memory_backend: MemoryBackend = MemoryBackend.AUTOMATIC,
+        progress_directory: Path | None = None,
+        snapshot_interval: float = 0,
+        checkpoint_interval: float = 0,
+        resume_from_checkpoint: bool = True,
+        checkpoint_key: str = "",
+        ground_truth_prefix_count: int = 0,
     ):
         self._dataset = dataset_path
         self._with_preprocessing = preprocessing_path is not None
@@ -61,40 +185,152 @@ class Runner:
                 preprocessing_path  # type: ignore
             )
 
-        self._streaming: StreamingAlgorithm = get_class_instance_from(streaming_path)  # type: ignore
+        # several streaming algorithms can share one pass over the dataset,
+        # the first one is the main algorithm of the experiment
+        self._streaming_paths = (
+            [streaming_path]
+            if isinstance(streaming_path, Path)
+            else list(streaming_path)
+        )
 
         if self._with_batch:
             self._batch: BatchAlgorithm = get_class_instance_from(batch_path)  # type: ignore
+        # a batch algorithm implementing on_edge_accumulate builds its input during the pass over the dataset,
+        # the edges are then not buffered for it at all
+        self._is_accumulating_batch = self._with_batch and is_accumulating_edges(
+            self._batch
+        )
+
+        # the accuracy can also be evaluated on evenly spaced prefixes of the stream - a batch algorithm
+        # implementing update_property maintains its graph between them instead of starting over
+        self._ground_truth_prefix_count = (
+            ground_truth_prefix_count if self._with_batch else 0
+        )
+        self._is_updating_batch = bool(
+            self._ground_truth_prefix_count
+            and not self._is_accumulating_batch
+            and is_updating_property(self._batch)
+        )
+        self._ground_truth: list[GroundTruth] = []
+        self._prefix_edges: list[int] = []
+        # amount of edges the batch algorithm has been updated with
+        self._batch_edge_count = 0
 
-        file_extension = self._dataset.suffix
+        # compressed datasets are read like the data they contain, e.g. '.csv.gz' as a .csv file
+        file_extension = get_data_suffix(self._dataset)
 
         if file_extension == ".csv":
-            self._file_reading = CSVFile(self._dataset)
+            columns = self._preprocessing.columns if self._with_preprocessing else None
+            self._file_reading = CSVFile(self._dataset, columns)
         elif file_extension == ".mtx":
             self._file_reading = MTXFile(self._dataset)
         else:
             self._file_reading = TEXTFile(self._dataset)
 
-        # time intervals are now saved using the perf_counter_ns for greater precision
-        self._calculation_time_per_edge = []
         self._preprocessing_time_per_edge = []
 
-        with open(self._dataset, encoding="utf-8") as file:
-            reader: Any = self._file_reading.get_reader(file)
-            self._file_reading.set_headers(reader)
-            self._row_count = sum(1 for _ in reader)
+        # the content of the dataset keys both the edge cache and the checkpoints, it is only hashed once
+        self._dataset_hash = (
+            get_dataset_hash(self._dataset)
+            if use_edge_cache or checkpoint_interval > 0
+            else ""
+        )
 
-        # Saves the amount of stored memory in RAM (non-swapped) in MB by this runner process
-        # psutil implementation - will include everything including the sizes of the history and of the stream, batch object
-        # stops recording when the streaming algorithm is done computing
-        # pympler implementation - is restricted to the object itself, is an approximation of its size
-        self._memory_usage = []
+        # the preprocessed edges of a dataset can be converted once into a binary cache
+        # and replayed in the following runs without parsing the dataset again
+        self._edge_cache: EdgeCache | None = None
+        self._edge_cache_path: Path | None = None
+        if use_edge_cache:
+            self._edge_cache_path = get_cache_path(
+                self._dataset, self._dataset_hash, preprocessing_path
+            )
+            if EdgeCache.exists(self._edge_cache_path):
+                self._edge_cache = EdgeCache(self._edge_cache_path)
+
+        if self._edge_cache is not None:
+            self._row_count = self._edge_cache.edge_count
+        else:
+            # only the headers are parsed up front, the rows are counted on raw bytes instead of
+            # being parsed twice - the count is exact once the experiment has been run
+            # (and only known then for compressed datasets)
+            with open_dataset(self._dataset) as file:
+                reader: Any = self._file_reading.get_reader(file)
+                self._file_reading.set_headers(reader)
+            self._row_count = self._file_reading.count_rows()
+
+        # optional constructor parameters of each streaming algorithm - a single path
+        # can be given together with several sets of parameters (e.g. in a parameter sweep)
+        if streaming_parameters is None:
+            streaming_parameters = [{}] * len(self._streaming_paths)
+        elif len(self._streaming_paths) == 1:
+            self._streaming_paths *= len(streaming_parameters)
+
+        self._tracks = [
+            StreamingTrack(
+                path,
+                parameters,
+                self._row_count or 0,
+                timing_mode,
+                timing_interval,
+                memory_backend,
+            )
+            for path, parameters in zip(
+                self._streaming_paths, streaming_parameters, strict=True
+            )
+        ]
+        # algorithms with the same class name (e.g. modified copies) are told apart by a number
+        names = [track.name for track in self._tracks]
+        for index, track in enumerate(self._tracks):
+            if names.count(track.name) > 1:
+                track.name = f"{track.name} #{names[:index].count(track.name) + 1}"
+
+        self._streaming = self._tracks[0].algorithm
         self._processed_edge_count = 0
 
+        # the progress is published to the channel opened by the server, if there is one
+        self._progress_directory = progress_directory
+        self._snapshot_interval = snapshot_interval
+        self._progress: ProgressPublisher | None = None
+
+        # long runs can be checkpointed every given amount of seconds, none if it is zero -
+        # the key tells apart runs which would otherwise share a checkpoint (e.g. repetitions)
+        self._checkpoint: Checkpoint | None = None
+        self._resume_from_checkpoint = resume_from_checkpoint
+        # the state restored from a checkpoint is allocated by the unpickling rather than by the algorithm,
+        # and the process is a different one - the memory measured after resuming would not match
+        if (
+            checkpoint_interval > 0
+            and resume_from_checkpoint
+            and any(
+                track.memory.backend in (MemoryBackend.TRACEMALLOC, MemoryBackend.RSS)
+                for track in self._tracks
+            )
+        ):
+            raise MemoryBackendError(
+                "Resuming from a checkpoint is not supported by the tracemalloc and resident memory measurements."
+            )
+        if checkpoint_interval > 0:
+            self._checkpoint = Checkpoint(
+                get_checkpoint_path(
+                    self._dataset,
+                    self._dataset_hash,
+                    [preprocessing_path, batch_path, *self._streaming_paths],
+                    {
+                        "key": checkpoint_key,
+                        "parameters": [track.parameters for track in self._tracks],
+                        "timing_mode": timing_mode,
+                        "timing_interval": timing_interval,
+                        "memory_backend": memory_backend,
+                        "ground_truth_prefix_count": self._ground_truth_prefix_count,
+                    },
+                ),
+                checkpoint_interval,
+            )
+
     # getters for metrics and results -
     # some of them are optional (like results from batch) => changed method tuple return to getters
     @property
-    def edge_count(self) -> int:
+    def edge_count(self) -> int | None:
         return self._row_count
 
     @property
@@ -102,16 +338,53 @@ class Runner:
         return self._dataset.stat().st_size
 
     @property
-    def calculation_time_per_edge(self) -> list[int]:
-        return self._calculation_time_per_edge
+    def streaming_names(self) -> list[str]:
+        return [track.name for track in self._tracks]
+
+    @property
+    def streaming_paths(self) -> list[Path]:
+        return list(self._streaming_paths)
+
+    # the measurements and results of the streaming algorithms are selected by their index,
+    # the main algorithm is the default
+    @property
+    def calculation_time_per_edge(self) -> np.ndarray:
+        return self._tracks[0].timing.durations
+
+    @property
+    def calculation_time_edges(self) -> np.ndarray:
+        # indices of the timed edges - all of them unless the edges are sampled
+        return self._tracks[0].timing.edges
+
+    def get_calculation_time(self, index: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        timing = self._tracks[index].timing
+        return timing.edges, timing.durations
 
     @property
     def preprocessing_time_per_edge(self) -> list[int]:
         return self._preprocessing_time_per_edge
 
     @property
-    def memory_usage(self) -> list[int]:
-        return self._memory_usage
+    def memory_usage(self) -> list[tuple[int, int]]:
+        return self._tracks[0].memory.samples
+
+    def get_memory_usage(self, index: int = 0) -> list[tuple[int, int]]:
+        return self._tracks[index].memory.samples
+
+    @property
+    def memory_probe_time(self) -> int:
+        # time spent on measuring the memory in nanoseconds, excluded from the calculation times
+        return sum(track.memory.probe_time for track in self._tracks)
+
+    @property
+    def checkpoint_time(self) -> int:
+        # time spent on saving and loading checkpoints in nanoseconds, excluded from the calculation times
+        return self._checkpoint.time if self._checkpoint is not None else 0
+
+    @property
+    def ground_truth(self) -> list[GroundTruth]:
+        # the whole stream is not included, it is evaluated by the results of the experiment
+        return self._ground_truth
 
     def validate_algorithm_signatures(self, row_data) -> tuple[bool, str]:
         stream_signature = (
@@ -137,49 +410,41 @@ class Runner:
 
         return are_params_correct, message
 
-    def get_stream_results(self) -> ResultList:
-        return self._streaming.submit_results()
+    def get_stream_results(self, index: int = 0) -> ResultList:
+        return self._tracks[index].algorithm.submit_results()
 
     def get_batch_results(self) -> ResultList:
         return self._batch.submit_results() if self._with_batch else []
 
     def get_parameterized_results(
-        self, orderDescending: bool, cardinality: int
+        self, orderDescending: bool, cardinality: int, index: int = 0
     ) -> tuple[ResultList, ResultList]:
-        streaming_results = sorted(self.get_stream_results(), reverse=orderDescending)
-        batch_results = sorted(self.get_batch_results(), reverse=orderDescending)
-        return streaming_results[:cardinality], batch_results[:cardinality]
+        return comparison.get_parameterized_results(
+            to_result_list(self.get_stream_results(index)),
+            to_result_list(self.get_batch_results()),
+            orderDescending,
+            cardinality,
+        )
 
     def get_jaccard_similarity(
-        self, orderDescending: bool, cardinality: int = 10
+        self, orderDescending: bool, cardinality: int = 10, index: int = 0
     ) -> float:
-        streaming_results, batch_results = self.get_parameterized_results(
-            orderDescending, cardinality
+        return comparison.get_jaccard_similarity(
+            RankIndex(to_result_list(self.get_stream_results(index))),
+            RankIndex(to_result_list(self.get_batch_results())),
+            orderDescending,
+            cardinality,
         )
 
-        streaming_results = [node for node, val in streaming_results]
-        batch_results = [node for node, val in batch_results]
-
-        set_a = set(streaming_results)
-        set_b = set(batch_results)
-
-        intersection = set_a.intersection(set_b)
-        union = set_a.union(set_b)
-
-        return len(intersection) / len(union)
-
     def get_streaming_accuracy(
-        self, orderDescending: bool = False, cardinality: int = 10
+        self, orderDescending: bool = False, cardinality: int = 10, index: int = 0
     ) -> float:
-        streaming_results, batch_results = self.get_parameterized_results(
-            orderDescending, cardinality
+        return comparison.get_streaming_accuracy(
+            RankIndex(to_result_list(self.get_stream_results(index))),
+            RankIndex(to_result_list(self.get_batch_results())),
+            orderDescending,
+            cardinality,
         )
-        correct = 0
-        for stream, batch in zip(streaming_results, batch_results):
-            if stream[0] == batch[0]:
-                correct += 1
-
-        return correct / len(streaming_results)
 
     def validate_implementation(self) -> None:
         if self._with_preprocessing and (
@@ -188,7 +453,9 @@ class Runner:
             raise TypeError(
                 "Preprocessing algorithm is not implemeted right - cannot instantiate PreprocessEdge interface. Check if all methods have been supplied together with the right method name."
             )
-        elif not isinstance(self._streaming, StreamingAlgorithm):
+        elif not all(
+            isinstance(track.algorithm, StreamingAlgorithm) for track in self._tracks
+        ):
             raise TypeError(
                 "Streaming algorithm is not implemeted right - cannot instantiate StreamingAlgorithm interface. Check if all methods have been supplied together with the right method name."
             )
@@ -197,34 +464,226 @@ class Runner:
                 "Batch algorithm is not implemeted right - cannot instantiate BatchAlgorithm interface. Check if all methods have been supplied together with the right method name."
             )
 
-    def run_experiment(self, sample_count: int = 100) -> None:
-        sampling_interval = get_sampling_interval(self._row_count, sample_count)
-        rows_for_batch = []
-
-        with open(self._dataset, encoding="utf-8") as file:
+    def _read_edges(self, first_edge: int = 0) -> Iterator[Any]:
+        # replaying the cached edges skips both parsing the dataset and preprocessing
+        if self._edge_cache is not None:
+            yield from self._edge_cache.replay(first_edge)
+            return
+
+        # a dataset which is not read from the start cannot be cached
+        cache_writer = (
+            EdgeCacheWriter(self._edge_cache_path)
+            if self._edge_cache_path and not first_edge
+            else None
+        )
+        with open_dataset(self._dataset) as file:
             reader = self._file_reading.get_reader(file)
+            self._file_reading.set_headers(reader)
 
-            for row in reader:  # type: ignore
+            # the skipped rows are still read and parsed by the reader, only their preprocessing is skipped
+            for row in islice(reader, first_edge, None):  # type: ignore
                 row: Any = self._file_reading.process_row(row)
 
                 if self._with_preprocessing:
                     row = self._preprocessing.create_edge_from(row)
 
-                if self._with_batch:
-                    rows_for_batch.append(row)
+                if cache_writer is not None:
+                    cache_writer.append(row)
 
-                property_start = time.perf_counter_ns()
-                self._streaming.on_edge_calculate(row)  # type: ignore
-                property_end = time.perf_counter_ns()
+                yield row
+
+        if cache_writer is not None:
+            cache_writer.save()
 
-                calculation_duration = property_end - property_start
-                self._calculation_time_per_edge.append(calculation_duration)
+    def _process_edges(self, rows_for_batch: BatchBuffer | None) -> None:
+        # every edge is read and preprocessed once and dispatched to all streaming algorithms,
+        # each of them processes a whole block of edges before the next algorithm gets it
+        # blocks are never longer than the sampling interval so that no memory sample is skipped,
+        # the interval is checked for every block as it grows while reading datasets of unknown length
+        # edges processed before the checkpoint of a resumed run are skipped,
+        # unless they are read again to rebuild the input of the batch algorithm
+        resumed_edge_count = self._processed_edge_count
+        if resumed_edge_count and (
+            rows_for_batch is not None or self._is_accumulating_batch
+        ):
+            edges = self._read_edges()
+            for start in range(0, resumed_edge_count, EDGE_BLOCK_SIZE):
+                self._accumulate_batch(
+                    tuple(
+                        islice(edges, min(EDGE_BLOCK_SIZE, resumed_edge_count - start))
+                    ),
+                    rows_for_batch,
+                )
+        else:
+            edges = self._read_edges(resumed_edge_count)
+        pending_prefixes = [
+            edge for edge in self._prefix_edges if edge > resumed_edge_count
+        ]
+        while True:
+            block_size = min(EDGE_BLOCK_SIZE, self._tracks[0].memory.interval)
+            if pending_prefixes:
+                # blocks end at the prefixes, so that the ground truth is evaluated right after them
+                block_size = min(
+                    block_size, pending_prefixes[0] - self._processed_edge_count
+                )
+            block = tuple(islice(edges, block_size))
+            if not block:
+                break
+
+            self._accumulate_batch(block, rows_for_batch)
+
+            first_edge = self._processed_edge_count
+            for track in self._tracks:
+                if track.is_processing_blocks():
+                    track.process_block(block, first_edge)
+                else:
+                    track.process_edges(block, first_edge)
+            self._processed_edge_count += len(block)
+
+            if pending_prefixes and self._processed_edge_count == pending_prefixes[0]:
+                pending_prefixes.pop(0)
+                self._evaluate_prefix(rows_for_batch)
+            if self._progress is not None and self._progress.is_due():
+                self._publish_progress(self._progress)
+            if self._checkpoint is not None and self._checkpoint.is_due():
+                self._checkpoint.save(
+                    self._processed_edge_count, self._tracks, self._ground_truth
+                )
+
+    def _accumulate_batch(
+        self, block: tuple[Any, ...], rows_for_batch: BatchBuffer | None
+    ) -> None:
+        # accumulated outside of the timed calculations of the streaming algorithms
+        if self._is_accumulating_batch:
+            self._batch.on_edges_accumulate(block)
+        elif rows_for_batch is not None:
+            rows_for_batch.extend(block)
+
+    def _get_batch_data(
+        self, rows_for_batch: BatchBuffer | None, first_edge: int = 0
+    ) -> pd.DataFrame:
+        # the buffered edges are read as they are, the replayed ones are sliced from the edge cache
+        if rows_for_batch is not None:
+            return rows_for_batch.to_dataframe()
+        return self._edge_cache.to_dataframe(  # type: ignore
+            first_edge, self._processed_edge_count
+        )
 
-                if self._processed_edge_count % sampling_interval == 0:
-                    self._memory_usage.append(
-                        (self._processed_edge_count, asizeof(self._streaming))
-                    )
-                self._processed_edge_count += 1
+    def _update_batch(self, rows_for_batch: BatchBuffer | None) -> None:
+        # only the edges which arrived since the previous update are passed and kept in the buffer
+        self._batch.update_property(
+            self._get_batch_data(rows_for_batch, self._batch_edge_count)
+        )
+        self._batch_edge_count = self._processed_edge_count
+        if rows_for_batch is not None:
+            rows_for_batch.clear()
+
+    def _calculate_batch(
+        self, rows_for_batch: BatchBuffer | None, is_prefix: bool = False
+    ) -> None:
+        # the property of all edges processed so far
+        if self._is_accumulating_batch:
+            self._batch.finalize()
+        elif self._is_updating_batch:
+            self._update_batch(rows_for_batch)
+        else:
+            batch_data = self._get_batch_data(rows_for_batch)
+            # the buffers keep growing after a prefix, so they are not shared with the algorithm
+            if is_prefix and rows_for_batch is not None:
+                batch_data = batch_data.copy()
+            self._batch.calculate_property(batch_data)
+
+    def _evaluate_prefix(self, rows_for_batch: BatchBuffer | None) -> None:
+        # the prefix is evaluated between blocks, outside of the timed calculations
+        self._calculate_batch(rows_for_batch, is_prefix=True)
+        self._ground_truth.append(
+            GroundTruth(
+                self._processed_edge_count,
+                RankIndex(to_result_list(self._batch.submit_results())),
+                [
+                    RankIndex(to_result_list(track.algorithm.submit_results()))
+                    for track in self._tracks
+                ],
+            )
+        )
 
-            if self._with_batch:
-                self._batch.calculate_property(pd.DataFrame(rows_for_batch))  # type: ignore
+    def _publish_progress(self, progress: ProgressPublisher) -> None:
+        memory_samples = self._tracks[0].memory.samples
+        progress.update(
+            ProgressPhase.STREAMING,
+            self._processed_edge_count,
+            memory_samples[-1][1] if memory_samples else None,
+        )
+        if progress.is_snapshot_due():
+            # partial results are taken between blocks, outside of the timed calculations
+            progress.submit_snapshot(
+                self._processed_edge_count,
+                [
+                    to_result_list(track.algorithm.submit_results())
+                    for track in self._tracks
+                ],
+            )
+
+    def run_experiment(self, sample_count: int = 100) -> None:
+        if self._progress_directory is not None:
+            self._progress = ProgressPublisher(
+                self._progress_directory, self._row_count, self._snapshot_interval
+            )
+        # the batch input is kept in typed columnar buffers rather than a list of python rows,
+        # replayed edges do not have to be kept at all as they can be read from the edge cache again
+        rows_for_batch = (
+            BatchBuffer()
+            if self._with_batch
+            and self._edge_cache is None
+            and not self._is_accumulating_batch
+            else None
+        )
+        for track in self._tracks:
+            if self._row_count is None:
+                track.memory.adapt_interval(sample_count)
+            else:
+                track.memory.interval = get_sampling_interval(
+                    self._row_count, sample_count
+                )
+        # the prefixes are fractions of the edge count, which is not known up front for compressed datasets -
+        # those are only evaluated once the whole stream has been processed
+        if self._ground_truth_prefix_count and self._row_count:
+            self._prefix_edges = sorted(
+                {
+                    self._row_count * prefix // self._ground_truth_prefix_count
+                    for prefix in range(1, self._ground_truth_prefix_count)
+                }
+                - {0}
+            )
+        if self._checkpoint is not None:
+            if self._resume_from_checkpoint and self._checkpoint.exists():
+                self._processed_edge_count, self._ground_truth = self._checkpoint.load(
+                    self._tracks
+                )
+            else:
+                self._checkpoint.remove()
+        for track in self._tracks:
+            track.memory.start()
+        # the workers are reused by later experiments, a failed one must not leave tracemalloc tracing
+        try:
+            self._process_edges(rows_for_batch)
+        finally:
+            for track in self._tracks:
+                track.memory.stop()
+        # the finished streaming is checkpointed as well, so that it is not repeated if the batch fails
+        if self._checkpoint is not None:
+            self._checkpoint.save(
+                self._processed_edge_count, self._tracks, self._ground_truth
+            )
+
+        self._row_count = self._processed_edge_count
+
+        if self._with_batch:
+            if self._progress is not None:
+                self._progress.update(ProgressPhase.BATCH, self._row_count)
+            self._calculate_batch(rows_for_batch)
+
+        if self._checkpoint is not None:
+            self._checkpoint.remove()
+        if self._progress is not None:
+            self._progress.update(ProgressPhase.DONE, self._row_count)
@@ -0,0 +1,475 @@
+import asyncio
+import json
+import tomllib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from app.server._config import get_class_name_from
+
+from . import plots
+from .actions import IMAGE_FORMATS, get_results_directory, save_results
+from .experiment import ExperimentResults, format_size, run_experiment_in_worker
+from .memory import MemoryBackend
+from .metrics import METRIC_NAMES
+from .ranking import RankIndex
+from .timing import TimingMode
+
+OUTPUT_FORMATS = ["markdown", "latex"]
+
+# settings of an experiment which can also be given once for the whole manifest
+EXPERIMENT_DEFAULTS: dict[str, Any] = {
+    "repetitions": 1,
+    "use_edge_cache": False,
+    "timing_mode": TimingMode.EVERY_EDGE,
+    "timing_interval": 100,
+    "memory_backend": MemoryBackend.AUTOMATIC,
+    "order": "Descending",
+    "cardinality": 20,
+    "checkpoint_interval": 0,
+    "resume_from_checkpoint": True,
+    "ground_truth_prefix_count": 0,
+}
+
+
+class ManifestError(ValueError):
+    pass
+
+
+class ExperimentSpecification:
+    """
+    One experiment of a manifest - the arguments of its Runner and how the results are compared.
+    """
+
+    def __init__(self, name: str, settings: dict[str, Any]) -> None:
+        self.name = name
+        self.repetitions: int = settings["repetitions"]
+        self.order: str = settings["order"]
+        self.cardinality: int = settings["cardinality"]
+        self.runner_arguments: dict[str, Any] = {
+            "dataset_path": settings["dataset"],
+            "preprocessing_path": settings.get("preprocessing"),
+            "streaming_path": settings["streaming"],
+            "batch_path": settings.get("batch"),
+            "streaming_parameters": settings.get("streaming_parameters"),
+            "use_edge_cache": settings["use_edge_cache"],
+            "timing_mode": settings["timing_mode"],
+            "timing_interval": settings["timing_interval"],
+            "memory_backend": settings["memory_backend"],
+            "checkpoint_interval": settings["checkpoint_interval"],
+            "resume_from_checkpoint": settings["resume_from_checkpoint"],
+            "ground_truth_prefix_count": settings["ground_truth_prefix_count"],
+        }
+
+    @property
+    def with_batch(self) -> bool:
+        return self.runner_arguments["batch_path"] is not None
+
+    def get_run_name(self, suite_name: str, repetition: int) -> str:
+        if self.repetitions == 1:
+            return f"{suite_name}/{self.name}"
+        return f"{suite_name}/{self.name}/repetition_{repetition}"
+
+
+def get_manifest_path(value: Any, manifest_directory: Path, setting: str) -> Path:
+    if not isinstance(value, str):
+        raise ManifestError(f"The setting '{setting}' has to be a path.")
+    # paths are relative to the manifest, so that it can be moved together with the algorithms
+    path = (manifest_directory / value).resolve()
+    if not path.exists():
+        raise ManifestError(f"The {setting} path '{path}' does not exist.")
+    return path
+
+
+def get_settings(
+    table: Mapping[str, Any], defaults: Mapping[str, Any], manifest_directory: Path
+) -> dict[str, Any]:
+    settings = {**defaults, **table}
+    for required in ["dataset", "streaming"]:
+        if required not in settings:
+            raise ManifestError(f"Every experiment needs the setting '{required}'.")
+
+    for setting in ["dataset", "preprocessing", "batch"]:
+        if setting in settings:
+            settings[setting] = get_manifest_path(
+                settings[setting], manifest_directory, setting
+            )
+    streaming = settings["streaming"]
+    if isinstance(streaming, list):
+        settings["streaming"] = [
+            get_manifest_path(path, manifest_directory, "streaming")
+            for path in streaming
+        ]
+    else:
+        settings["streaming"] = get_manifest_path(
+            streaming, manifest_directory, "streaming"
+        )
+    if isinstance(settings.get("streaming_parameters"), dict):
+        settings["streaming_parameters"] = [settings["streaming_parameters"]]
+
+    try:
+        settings["timing_mode"] = TimingMode(settings["timing_mode"])
+        settings["memory_backend"] = MemoryBackend(settings["memory_backend"])
+    except ValueError as exception:
+        raise ManifestError(str(exception)) from None
+    if settings["order"] not in ("Ascending", "Descending"):
+        raise ManifestError(
+            "The setting 'order' has to be 'Ascending' or 'Descending'."
+        )
+    for setting in ["repetitions", "timing_interval", "cardinality"]:
+        if type(settings[setting]) is not int or settings[setting] < 1:
+            raise ManifestError(
+                f"The setting '{setting}' has to be a positive integer."
+            )
+    checkpoint_interval = settings["checkpoint_interval"]
+    if type(checkpoint_interval) not in (int, float) or checkpoint_interval < 0:
+        raise ManifestError(
+            "The setting 'checkpoint_interval' has to be a non-negative number of seconds."
+        )
+    if type(settings["resume_from_checkpoint"]) is not bool:
+        raise ManifestError("The setting 'resume_from_checkpoint' has to be a boolean.")
+    if (
+        checkpoint_interval > 0
+        and settings["resume_from_checkpoint"]
+        and settings["memory_backend"] in (MemoryBackend.TRACEMALLOC, MemoryBackend.RSS)
+    ):
+        raise ManifestError(
+            "Runs measured with the 'tracemalloc' or 'rss' memory backend can not be resumed from a checkpoint."
+        )
+    prefix_count = settings["ground_truth_prefix_count"]
+    if type(prefix_count) is not int or prefix_count < 0:
+        raise ManifestError(
+            "The setting 'ground_truth_prefix_count' has to be a non-negative integer."
+        )
+    return settings
+
+
+class Suite:
+    """
+    Experiments described by a TOML manifest. Settings at the top of the manifest apply to all
+    experiments listed in its [[experiments]] tables, which can override them:
+
+        name = "nightly"
+        output_format = "markdown"
+        image_format = "svg"
+        workers = 4
+        repetitions = 3
+
+        [[experiments]]
+        name = "misra-gries"
+        dataset = ["demos/connections.csv", "datasets/graph.mtx"]
+        preprocessing = "demos/connection_preprocessing.py"
+        streaming = ["demos/stream_misra_gries.py", "demos/degree_centrality_approximate_stream.py"]
+        streaming_parameters = [{ k = 50 }, {}]
+        batch = "demos/degree_centrality_batch.py"
+
+    An experiment listing several datasets is run once for each of them.
+    With checkpoint_interval set, runs interrupted before they finished resume from their last
+    checkpoint when the manifest is run again. With ground_truth_prefix_count set, the accuracy is also
+    evaluated on that many evenly spaced prefixes of the stream.
+    """
+
+    def __init__(self, manifest_path: Path) -> None:
+        try:
+            with open(manifest_path, "rb") as file:
+                manifest = tomllib.load(file)
+        except (OSError, tomllib.TOMLDecodeError) as exception:
+            raise ManifestError(
+                f"The manifest '{manifest_path}' could not be read: {exception}"
+            ) from None
+        manifest_directory = manifest_path.resolve().parent
+
+        self.name: str = manifest.get("name", manifest_path.stem)
+        self.output_format: str = manifest.get("output_format", "markdown")
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ManifestError(
+                f"The output format has to be one of: {', '.join(OUTPUT_FORMATS)}."
+            )
+        self.image_format: str = manifest.get("image_format", "svg")
+        if self.image_format not in IMAGE_FORMATS:
+            raise ManifestError(
+                f"The image format has to be one of: {', '.join(IMAGE_FORMATS)}."
+            )
+        self.workers: int | None = manifest.get("workers")
+
+        tables = manifest.get("experiments")
+        if not tables or not isinstance(tables, list):
+            raise ManifestError("The manifest does not list any [[experiments]].")
+        defaults = {
+            **EXPERIMENT_DEFAULTS,
+            **{key: manifest[key] for key in EXPERIMENT_DEFAULTS if key in manifest},
+        }
+
+        self.experiments: list[ExperimentSpecification] = []
+        for number, table in enumerate(tables, start=1):
+            name = table.get("name", f"experiment_{number}")
+            datasets = table.get("dataset")
+            if not isinstance(datasets, list):
+                datasets = [datasets] if datasets is not None else []
+            for dataset in datasets or [None]:
+                settings = get_settings(
+                    {**table, "dataset": dataset} if dataset else table,
+                    defaults,
+                    manifest_directory,
+                )
+                self.experiments.append(
+                    ExperimentSpecification(
+                        f"{name}-{settings['dataset'].stem}"
+                        if len(datasets) > 1
+                        else name,
+                        settings,
+                    )
+                )
+
+        names = [specification.name for specification in self.experiments]
+        if len(set(names)) != len(names):
+            raise ManifestError("The names of the experiments have to be unique.")
+
+    @property
+    def run_count(self) -> int:
+        return sum(specification.repetitions for specification in self.experiments)
+
+
+def get_metrics(
+    specification: ExperimentSpecification,
+    repetition: int,
+    experiment: ExperimentResults,
+) -> dict[str, Any]:
+    streaming_paths = specification.runner_arguments["streaming_path"]
+    if not isinstance(streaming_paths, list):
+        streaming_paths = [streaming_paths] * len(experiment.streaming_names)
+
+    algorithms = [
+        {
+            "name": name,
+            "path": str(streaming_paths[index]),
+            **experiment.get_summary(
+                specification.order == "Descending",
+                specification.cardinality,
+                index,
+                specification.with_batch,
+            ),
+        }
+        for index, name in enumerate(experiment.streaming_names)
+    ]
+
+    return {
+        "experiment": specification.name,
+        "repetition": repetition,
+        "dataset": str(specification.runner_arguments["dataset_path"]),
+        "edge_count": experiment.edge_count,
+        "dataset_size_bytes": experiment.dataset_size,
+        "memory_probe_time_ns": experiment.memory_probe_time,
+        "checkpoint_time_ns": experiment.checkpoint_time,
+        "order": specification.order,
+        "cardinality": specification.cardinality,
+        "algorithms": algorithms,
+    }
+
+
+def get_node_rank(
+    rank_index: RankIndex, specification: ExperimentSpecification
+) -> pd.DataFrame:
+    cardinality = specification.cardinality if specification.with_batch else None
+    return pd.DataFrame(
+        rank_index.get_top(
+            cardinality or len(rank_index), specification.order == "Descending"
+        ),
+        columns=["node", "value"],
+    )
+
+
+def save_run(
+    suite: Suite,
+    specification: ExperimentSpecification,
+    repetition: int,
+    experiment: ExperimentResults,
+    metrics: dict[str, Any],
+) -> None:
+    """
+    Writes the same results as saving them in the app, together with the metrics as JSON.
+    """
+    run_name = specification.get_run_name(suite.name, repetition)
+    runner_arguments = specification.runner_arguments
+    write_metrics(get_results_directory(run_name), metrics)
+    algorithms = metrics["algorithms"]
+    preprocessing_path = runner_arguments["preprocessing_path"]
+    streaming_paths = runner_arguments["streaming_path"]
+    if not isinstance(streaming_paths, list):
+        streaming_paths = [streaming_paths]
+    batch_path = runner_arguments["batch_path"]
+
+    streaming_comparison = None
+    if len(algorithms) > 1:
+        streaming_comparison = pd.DataFrame(
+            {
+                "algorithm": [algorithm["name"] for algorithm in algorithms],
+                "average time [ns]": [
+                    algorithm["average_time_ns"] for algorithm in algorithms
+                ],
+                "average memory [B]": [
+                    algorithm["average_memory_bytes"] for algorithm in algorithms
+                ],
+            }
+        )
+        if specification.with_batch:
+            streaming_comparison["Jaccard similarity"] = [
+                algorithm["jaccard_similarity"] for algorithm in algorithms
+            ]
+            streaming_comparison["streaming accuracy"] = [
+                algorithm["streaming_accuracy"] for algorithm in algorithms
+            ]
+
+    rank_metrics, accuracy_curve, accuracy_curves = None, None, None
+    prefix_accuracy, prefix_accuracies = None, None
+    if specification.with_batch:
+        order_descending = specification.order == "Descending"
+        curves = [
+            experiment.get_accuracy_curves(order_descending, index)
+            for index in range(len(algorithms))
+        ]
+        accuracy_curve = plots.get_accuracy_curve_plot(
+            experiment.streaming_names, curves, specification.cardinality
+        )
+        accuracy_curves = pd.concat(
+            curve.assign(algorithm=name)
+            for name, curve in zip(experiment.streaming_names, curves)
+        )
+        rank_metrics = pd.DataFrame(
+            {
+                "algorithm": [algorithm["name"] for algorithm in algorithms],
+                **{
+                    label: [algorithm[key] for algorithm in algorithms]
+                    for key, label in METRIC_NAMES.items()
+                },
+            }
+        )
+    if experiment.ground_truth:
+        accuracies = [
+            experiment.get_prefix_accuracy(
+                specification.order == "Descending", specification.cardinality, index
+            )
+            for index in range(len(algorithms))
+        ]
+        prefix_accuracy = plots.get_prefix_accuracy_plot(
+            experiment.streaming_names, accuracies
+        )
+        prefix_accuracies = pd.concat(
+            accuracy.assign(algorithm=name)
+            for name, accuracy in zip(experiment.streaming_names, accuracies)
+        )
+
+    save_results(
+        suite.output_format,
+        open_results=False,
+        image_format=suite.image_format,
+        experiment=experiment,
+        experiment_name=run_name,
+        dataset=Path(runner_arguments["dataset_path"]).name,
+        dataset_path=runner_arguments["dataset_path"],
+        preprocessing_path=preprocessing_path,
+        preprocessing_name=(
+            get_class_name_from(preprocessing_path) if preprocessing_path else None
+        ),
+        streaming_path=streaming_paths[0],
+        streaming_name=experiment.streaming_names[0],
+        comparison_paths=list(dict.fromkeys(streaming_paths[1:])),
+        streaming_paths=streaming_paths,
+        streaming_parameters=runner_arguments["streaming_parameters"],
+        streaming_comparison=streaming_comparison,
+        batch_path=batch_path,
+        batch_name=get_class_name_from(batch_path) if batch_path else None,
+        total_edge_count=experiment.edge_count,
+        dataset_size=format_size(experiment.dataset_size),
+        order=specification.order,
+        cardinality=specification.cardinality,
+        jaccard_similarity=algorithms[0].get("jaccard_similarity"),
+        streaming_accuracy=algorithms[0].get("streaming_accuracy"),
+        rank_metrics=rank_metrics,
+        accuracy_curve=accuracy_curve,
+        accuracy_curves=accuracy_curves,
+        prefix_accuracy=prefix_accuracy,
+        prefix_accuracies=prefix_accuracies,
+        streaming_node_rank=get_node_rank(experiment.get_rank_index(), specification),
+        batch_node_rank=(
+            get_node_rank(experiment.get_batch_rank_index(), specification)
+            if specification.with_batch
+            else None
+        ),
+        calculation_time=plots.get_calculation_time_plot(
+            experiment.streaming_names, experiment.calculation_time
+        ),
+        memory_usage=plots.get_memory_usage_plot(
+            experiment.streaming_names,
+            plots.get_memory_series(experiment.memory_usage),
+        ),
+        calculation_avg=f"Average: {algorithms[0]['average_time_ns']:.6g} ns",
+        memory_avg=f"Average: {algorithms[0]['average_memory_bytes']:.6g} B",
+    )
+
+
+def write_metrics(results_directory: Path, metrics: Any) -> None:
+    with open(results_directory / "metrics.json", "w", encoding="utf-8") as file:
+        json.dump(metrics, file, indent=2)
+
+
+def save_suite_metrics(suite: Suite, metrics: list[dict[str, Any]]) -> Path:
+    # besides the JSON, a flat table with one row per run and streaming algorithm
+    results_directory = get_results_directory(suite.name)
+    write_metrics(results_directory, metrics)
+    rows = [
+        {
+            **{key: value for key, value in run.items() if key != "algorithms"},
+            **{f"algorithm_{key}": value for key, value in algorithm.items()},
+        }
+        for run in metrics
+        for algorithm in run.get("algorithms", [{}])
+    ]
+    pd.DataFrame(rows).to_csv(results_directory / "metrics.csv", index=False)
+    return results_directory
+
+
+async def run_suite(
+    suite: Suite,
+    on_finished: Callable[
+        [ExperimentSpecification, int, ExperimentResults | Exception], None
+    ],
+    workers: int,
+) -> None:
+    # measurements of experiments running at the same time can affect each other,
+    # a single worker gives the most reliable calculation times
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run(specification: ExperimentSpecification, repetition: int) -> None:
+        async with semaphore:
+            try:
+                # every repetition is checkpointed separately
+                result: ExperimentResults | Exception = await run_experiment_in_worker(
+                    **specification.runner_arguments,
+                    checkpoint_key=specification.get_run_name(suite.name, repetition),
+                )
+            # a failed run is reported as its result, the rest of the suite still runs
+            except Exception as exception:  # noqa: BLE001
+                result = exception
+        on_finished(specification, repetition, result)
+
+    async def run_group(runs: list[tuple[ExperimentSpecification, int]]) -> None:
+        await run(*runs[0])
+        await asyncio.gather(*(run(*arguments) for arguments in runs[1:]))
+
+    # with the edge cache, the first run of a dataset fills the cache before the other runs
+    # of the same dataset replay it, so that no two workers write the same cache at once
+    groups: dict[Any, list[tuple[ExperimentSpecification, int]]] = {}
+    for specification in suite.experiments:
+        runner_arguments = specification.runner_arguments
+        for repetition in range(1, specification.repetitions + 1):
+            key: Any = (specification.name, repetition)
+            if runner_arguments["use_edge_cache"]:
+                key = (
+                    runner_arguments["dataset_path"],
+                    runner_arguments["preprocessing_path"],
+                )
+            groups.setdefault(key, []).append((specification, repetition))
+    await asyncio.gather(*(run_group(runs) for runs in groups.values()))
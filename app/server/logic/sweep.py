@@ -0,0 +1,158 @@
+import ast
+import asyncio
+from itertools import product
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from . import comparison
+from .experiment import ExperimentResults, run_experiment_in_worker
+
+# amount of values of a range in the parameter grid without an explicit count
+RANGE_VALUE_COUNT = 10
+
+
+class ParameterGridError(ValueError):
+    pass
+
+
+def parse_value(value: str) -> Any:
+    try:
+        return ast.literal_eval(value.strip())
+    except (ValueError, SyntaxError):
+        raise ParameterGridError(
+            f"The value '{value.strip()}' of the parameter grid is not a valid Python literal."
+        ) from None
+
+
+def parse_values(values: str) -> list[Any]:
+    # a range 'start..stop' or 'start..stop:count' is spread geometrically, so that parameters spanning
+    # several orders of magnitude (like the size of a summary) are covered evenly
+    if ".." in values and not values.lstrip().startswith(("'", '"')):
+        bounds, _, count = values.partition(":")
+        start, _, stop = bounds.partition("..")
+        start, stop = parse_value(start), parse_value(stop)
+        value_count = parse_value(count) if count.strip() else RANGE_VALUE_COUNT
+        if not (0 < start <= stop) or not (
+            type(value_count) is int and value_count > 0
+        ):
+            raise ParameterGridError(
+                f"The range '{values.strip()}' of the parameter grid has to go from a positive start to a larger stop with a positive count of values."
+            )
+        spread = np.geomspace(start, stop, value_count)
+        if isinstance(start, int) and isinstance(stop, int):
+            return sorted({round(value) for value in spread.tolist()})
+        return spread.tolist()
+    return [parse_value(value) for value in values.split(",")]
+
+
+def parse_parameter_grid(grid: str) -> dict[str, list[Any]]:
+    # every line holds a constructor parameter and its values - 'k = 10, 20, 50' or 'k = 10..10000:7'
+    parameter_grid: dict[str, list[Any]] = {}
+    for line in grid.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, separator, values = line.partition("=")
+        name = name.strip()
+        if not separator or not name.isidentifier():
+            raise ParameterGridError(
+                f"The line '{line}' of the parameter grid is not in the form 'parameter = values'."
+            )
+        if name in parameter_grid:
+            raise ParameterGridError(
+                f"The parameter '{name}' is given more than once in the parameter grid."
+            )
+        parameter_grid[name] = parse_values(values)
+    if not parameter_grid:
+        raise ParameterGridError("The parameter grid does not contain any parameter.")
+    return parameter_grid
+
+
+def get_configurations(parameter_grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    return [
+        dict(zip(parameter_grid, values))
+        for values in product(*parameter_grid.values())
+    ]
+
+
+def get_pareto_optimal(objectives: np.ndarray) -> np.ndarray:
+    # a configuration is Pareto optimal when no other one is at least as good in all objectives
+    # (all of them minimized) and better in at least one
+    optimal = np.ones(len(objectives), dtype=bool)
+    for index, objective in enumerate(objectives):
+        dominating = np.all(objectives <= objective, axis=1) & np.any(
+            objectives < objective, axis=1
+        )
+        optimal[index] = not dominating.any()
+    return optimal
+
+
+class SweepResults:
+    """
+    Measurements of every configuration of a parameter sweep, compared with the results of the batch algorithm.
+    """
+
+    def __init__(
+        self,
+        parameter_grid: dict[str, list[Any]],
+        experiments: list[ExperimentResults],
+    ) -> None:
+        self.parameter_grid = parameter_grid
+        self.configurations = get_configurations(parameter_grid)
+        self.experiments = experiments
+        self.batch_results = experiments[0].batch_results
+        self.edge_count = experiments[0].edge_count
+
+    def to_dataframe(self, orderDescending: bool, cardinality: int) -> pd.DataFrame:
+        sweep = pd.DataFrame(self.configurations)
+        with_batch = bool(self.batch_results)
+        if with_batch:
+            # the batch results are indexed once and shared by all configurations
+            batch_rank = self.experiments[0].get_batch_rank_index()
+            sweep["Jaccard similarity"] = [
+                comparison.get_jaccard_similarity(
+                    experiment.get_rank_index(),
+                    batch_rank,
+                    orderDescending,
+                    cardinality,
+                )
+                for experiment in self.experiments
+            ]
+        sweep["average time [ns]"] = [
+            experiment.calculation_time[0][1].mean() for experiment in self.experiments
+        ]
+        sweep["average memory [B]"] = [
+            np.mean([memory for _, memory in experiment.memory_usage[0]])
+            for experiment in self.experiments
+        ]
+
+        objectives = sweep[["average time [ns]", "average memory [B]"]].to_numpy()
+        if with_batch:
+            objectives = np.column_stack((-sweep["Jaccard similarity"], objectives))
+        sweep["Pareto optimal"] = get_pareto_optimal(objectives)
+        return sweep
+
+
+async def run_sweep_in_workers(
+    parameter_grid: dict[str, list[Any]], **runner_arguments: Any
+) -> SweepResults:
+    configurations = get_configurations(parameter_grid)
+    # all configurations replay the same preprocessed edges from the edge cache -
+    # the first one parses the dataset into the cache and runs the batch algorithm once,
+    # the remaining ones are then spread over the worker processes
+    runner_arguments["use_edge_cache"] = True
+    first_experiment = await run_experiment_in_worker(
+        **runner_arguments, streaming_parameters=configurations[:1]
+    )
+    runner_arguments["batch_path"] = None
+    experiments = await asyncio.gather(
+        *(
+            run_experiment_in_worker(
+                **runner_arguments, streaming_parameters=[configuration]
+            )
+            for configuration in configurations[1:]
+        )
+    )
+    return SweepResults(parameter_grid, [first_experiment, *experiments])
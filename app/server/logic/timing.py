@@ -0,0 +1,160 @@
+import math
+import random
+import time
+from array import array
+from enum import StrEnum
+from typing import Any
+
+import numpy as np
+
+CALIBRATION_REPETITIONS = 10_000
+
+
+class TimingMode(StrEnum):
+    EVERY_EDGE = "every_edge"
+    EVERY_NTH_EDGE = "every_nth_edge"
+    RANDOM_SAMPLE = "random_sample"
+    PER_BLOCK = "per_block"
+
+
+def calibrate_timer_overhead(repetitions: int = CALIBRATION_REPETITIONS) -> int:
+    # the median duration between two back-to-back readings of the timer is the cost
+    # of the measurement itself, which is included in every measured duration
+    durations = sorted(
+        -(time.perf_counter_ns() - time.perf_counter_ns()) for _ in range(repetitions)
+    )
+    return durations[len(durations) // 2]
+
+
+class TimingProbe:
+    """
+    Collects the calculation times of the streaming algorithm in preallocated buffers of 64-bit integers.
+    Depending on the mode every edge, every n-th edge, randomly chosen edges (on average one in n)
+    or whole blocks of edges are timed. The calibrated overhead of the timer is subtracted from each duration.
+    """
+
+    def __init__(
+        self,
+        mode: TimingMode = TimingMode.EVERY_EDGE,
+        expected_edge_count: int = 0,
+        interval: int = 100,
+        seed: int | None = None,
+    ) -> None:
+        self.mode = mode
+        self.overhead = calibrate_timer_overhead()
+        self._interval = max(interval, 1)
+        self._random = random.Random(seed)
+
+        capacity = (
+            expected_edge_count
+            if mode == TimingMode.EVERY_EDGE
+            else expected_edge_count // self._interval
+        ) + 1
+        # every timed edge is its own index when all of them are timed, only the other modes keep the indices
+        self._is_storing_edges = mode != TimingMode.EVERY_EDGE
+        self._edges = array("q", bytes(8 * capacity if self._is_storing_edges else 0))
+        self._durations = array("q", bytes(8 * capacity))
+        self._count = 0
+
+        # index of the next edge which should be timed
+        self.next_edge = 0
+        if mode == TimingMode.RANDOM_SAMPLE:
+            self.next_edge = self._random_skip()
+
+    def _random_skip(self) -> int:
+        # drawing the distance to the next sampled edge from a geometric distribution
+        # is equivalent to sampling each edge separately with the probability 1 / interval
+        if self._interval == 1:
+            return 0
+        return int(
+            math.log(1.0 - self._random.random()) / math.log(1.0 - 1 / self._interval)
+        )
+
+    def _advance(self) -> None:
+        match self.mode:
+            case TimingMode.EVERY_NTH_EDGE:
+                self.next_edge += self._interval
+            case TimingMode.RANDOM_SAMPLE:
+                self.next_edge += 1 + self._random_skip()
+            case _:
+                self.next_edge += 1
+
+    def _reserve(self, count: int) -> None:
+        missing = self._count + count - len(self._durations)
+        if missing > 0:
+            # grows geometrically when the edge count was underestimated
+            growth = bytes(8 * max(missing, len(self._durations)))
+            if self._is_storing_edges:
+                self._edges.frombytes(growth)
+            self._durations.frombytes(growth)
+
+    def record(self, edge: int, duration: int) -> None:
+        if self._count == len(self._durations):
+            self._reserve(1)
+        if self._is_storing_edges:
+            self._edges[self._count] = edge
+        self._durations[self._count] = max(duration - self.overhead, 0)
+        self._count += 1
+        self._advance()
+
+    def record_block(self, first_edge: int, edge_count: int, duration: int) -> None:
+        # the duration of a block is attributed evenly to all of its edges
+        duration = max(duration - self.overhead, 0) // edge_count
+        end_edge = first_edge + edge_count
+
+        match self.mode:
+            case TimingMode.PER_BLOCK:
+                self._reserve(1)
+                self._edges[self._count] = first_edge
+                self._durations[self._count] = duration
+                self._count += 1
+            case TimingMode.EVERY_EDGE:
+                self._reserve(edge_count)
+                self._durations[self._count : self._count + edge_count] = (
+                    array("q", [duration]) * edge_count
+                )
+                self._count += edge_count
+                self.next_edge = end_edge
+            case _:
+                while self.next_edge < end_edge:
+                    self._reserve(1)
+                    self._edges[self._count] = self.next_edge
+                    self._durations[self._count] = duration
+                    self._count += 1
+                    self._advance()
+
+    def get_state(self) -> dict[str, Any]:
+        # the buffers themselves are saved separately, as they are appended to with every checkpoint
+        return {
+            "count": self._count,
+            "next_edge": self.next_edge,
+            "random": self._random.getstate(),
+        }
+
+    def set_state(
+        self, state: dict[str, Any], edges: np.ndarray, durations: np.ndarray
+    ) -> None:
+        count = state["count"]
+        self._count = 0
+        self._reserve(count)
+        if self._is_storing_edges:
+            self._edges[:count] = array("q", edges.tobytes())
+        self._durations[:count] = array("q", durations.tobytes())
+        self._count = count
+        self.next_edge = state["next_edge"]
+        self._random.setstate(state["random"])
+
+    def get_edges(self, first: int = 0) -> np.ndarray:
+        # the indices of the timed edges from the first given timing on
+        if not self._is_storing_edges:
+            return np.arange(first, self._count, dtype=np.int64)
+        return np.frombuffer(self._edges, dtype=np.int64)[first : self._count]
+
+    # the arrays share memory with the buffers, which cannot grow while such a view is alive
+    @property
+    def edges(self) -> np.ndarray:
+        return self.get_edges()
+
+    @property
+    def durations(self) -> np.ndarray:
+        return np.frombuffer(self._durations, dtype=np.int64)[: self._count]
@@ -1,11 +1,17 @@
 from .edit import server_edit
+from .load_results import server_load_results
+from .progress import server_progress
 from .results import server_results
 from .run_experiment import server_run_experiment
 from .selectize import server_selectize
+from .sweep import server_sweep
 
 __all__ = [
     "server_edit",
+    "server_load_results",
+    "server_progress",
     "server_results",
     "server_run_experiment",
     "server_selectize",
+    "server_sweep",
 ]
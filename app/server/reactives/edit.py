@@ -4,6 +4,7 @@ from shiny import Inputs, reactive
 
 from app.server._config import AlgorithmType
 from app.server.logic.actions import edit_algorithm
+from app.server.logic.file_reading import get_data_suffix
 
 from .run_experiment import MissingPathError, get_paths
 
@@ -20,7 +21,7 @@ def server_edit(input: Inputs, error: reactive.Value) -> None:
             edit_algorithm(
                 input.select_preprocessing(),
                 AlgorithmType.PREPROCESSING,
-                dataset_path.suffix,
+                get_data_suffix(dataset_path),
             )
 
     @reactive.effect
@@ -34,7 +35,7 @@ def server_edit(input: Inputs, error: reactive.Value) -> None:
             edit_algorithm(
                 input.select_streaming(),
                 AlgorithmType.STREAMING,
-                dataset_path.suffix,
+                get_data_suffix(dataset_path),
             )
 
     @reactive.effect
@@ -48,5 +49,5 @@ def server_edit(input: Inputs, error: reactive.Value) -> None:
             edit_algorithm(
                 input.select_batch(),
                 AlgorithmType.BATCH,
-                dataset_path.suffix,
+                get_data_suffix(dataset_path),
             )
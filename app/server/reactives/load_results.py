@@ -0,0 +1,104 @@
+from pathlib import Path
+from random import random
+
+from shiny import Inputs, reactive, render, ui
+
+from app.server.logic import (
+    ArchiveError,
+    get_catalog,
+    get_saved_experiments,
+    load_experiment,
+)
+
+from .run_experiment import show_experiment
+
+
+def get_algorithm_path(results_directory: Path, file_name: str | None) -> Path | None:
+    # the copies of the algorithms saved together with the results
+    return results_directory / file_name if file_name else None
+
+
+def server_load_results(
+    input: Inputs,
+    run_paths: dict[str, reactive.Value],
+    results: dict[str, reactive.Value],
+    error: reactive.Value,
+) -> None:
+    @render.ui
+    @reactive.event(
+        input.refresh_saved_results_list, input.with_saved_results, ignore_none=False
+    )
+    def saved_results_selectize():
+        return (
+            ui.input_selectize(
+                "select_saved_results",
+                "",
+                {
+                    str(directory): name
+                    for name, directory in get_saved_experiments().items()
+                },
+            ),
+        )
+
+    @reactive.effect
+    @reactive.event(input.load_results)
+    def _() -> None:
+        if not input.select_saved_results():
+            error.set((random(), "No saved experiment was selected."))
+            return
+        results_directory = Path(input.select_saved_results())
+        try:
+            experiment, metadata = load_experiment(results_directory)
+        except ArchiveError as exception:
+            error.set((random(), str(exception)))
+            return
+
+        streaming_path, *comparison_paths = (
+            get_algorithm_path(results_directory, file_name)
+            for file_name in metadata["streaming_files"]
+        )
+        run_paths["dataset_path"].set(
+            Path(metadata.get("dataset_path") or metadata["dataset"])
+        )
+        run_paths["preprocessing_path"].set(
+            get_algorithm_path(results_directory, metadata["preprocessing_file"])
+        )
+        run_paths["streaming_path"].set(streaming_path)
+        run_paths["comparison_paths"].set(comparison_paths)
+        run_paths["batch_path"].set(
+            get_algorithm_path(results_directory, metadata["batch_file"])
+        )
+        results["layout"].set(
+            {
+                "with_sweep": False,
+                "with_batch": metadata["batch_file"] is not None,
+                "with_ground_truth": bool(experiment.ground_truth),
+            }
+        )
+        show_experiment(results, experiment)
+        ui.update_text("experiment_name", value=metadata["experiment_name"])
+
+    @reactive.effect
+    @reactive.event(input.show_catalog)
+    def _() -> None:
+        modal = ui.modal(
+            ui.input_text(
+                "catalog_search",
+                None,
+                placeholder="Experiment, dataset or algorithm",
+                width="100%",
+            ),
+            ui.output_data_frame("catalog"),
+            title="Saved experiments",
+            easy_close=True,
+            size="xl",
+        )
+        ui.modal_show(modal)
+
+    @render.data_frame
+    def catalog() -> render.DataGrid:
+        # listed again whenever the catalog is opened, as experiments may have been saved in the meantime
+        input.show_catalog()
+        return render.DataGrid(
+            get_catalog(input.catalog_search()).round(4), filters=True
+        )
@@ -0,0 +1,105 @@
+import pandas as pd
+from htmltools import Tag
+from shiny import reactive, render, ui
+
+from algorithms._config.interfaces import ResultList
+from app.server.logic import (
+    Progress,
+    ProgressChannel,
+    ProgressPhase,
+    format_size,
+    get_top_results,
+)
+
+# how often the progress of a running experiment is read, in seconds
+PROGRESS_REFRESH_INTERVAL = 0.5
+# amount of the top nodes of the partial results shown while running
+PARTIAL_NODE_COUNT = 5
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02}m {seconds:02}s"
+    if minutes:
+        return f"{minutes}m {seconds:02}s"
+    return f"{seconds}s"
+
+
+def get_progress_bar(progress: Progress) -> Tag:
+    fraction = progress.fraction
+    # without a known edge count the bar is only animated
+    width = f"{fraction:.1%}" if fraction is not None else "100%"
+    return ui.tags.div(
+        ui.tags.div(
+            class_="progress-bar"
+            + (
+                " progress-bar-striped progress-bar-animated"
+                if fraction is None
+                else ""
+            ),
+            style=f"width: {width}",
+        ),
+        class_="progress",
+    )
+
+
+def get_partial_node_rank(results: ResultList) -> pd.DataFrame:
+    return pd.DataFrame(
+        get_top_results(results, PARTIAL_NODE_COUNT), columns=["node", "value"]
+    )
+
+
+def server_progress(results: dict[str, reactive.Value]) -> None:
+    @reactive.calc
+    def get_progress() -> tuple[Progress | None, tuple | None] | None:
+        channel: ProgressChannel | None = results["progress"].get()
+        if channel is None:
+            return None
+        # polled only while an experiment is running
+        reactive.invalidate_later(PROGRESS_REFRESH_INTERVAL)
+        return channel.read(), channel.read_snapshot()
+
+    @render.ui
+    def experiment_progress() -> Tag | None:
+        current = get_progress()
+        if current is None or current[0] is None:
+            return None
+        progress, snapshot = current
+
+        if not progress.elapsed_time:
+            return ui.tags.small("Starting the experiment...")
+        if progress.phase == ProgressPhase.BATCH:
+            status = "Running the batch algorithm..."
+        else:
+            status = f"{progress.edge_count:,} edges"
+            if progress.expected_edge_count is not None:
+                status += f" of {progress.expected_edge_count:,}"
+        details = [
+            f"{progress.edges_per_second:,.0f} edges/s",
+            f"elapsed {format_duration(progress.elapsed_time / 1e9)}",
+        ]
+        if progress.remaining_seconds is not None:
+            details.append(f"ETA {format_duration(progress.remaining_seconds)}")
+        if progress.memory is not None:
+            details.append(f"memory {format_size(progress.memory)}")
+
+        partial_results = ()
+        if snapshot is not None:
+            edge_count, streaming_results = snapshot
+            partial_results = (
+                ui.tags.small(f"Partial results after {edge_count:,} edges"),
+                ui.HTML(
+                    get_partial_node_rank(streaming_results[0]).to_html(
+                        index=False, classes="table table-sm", border=0
+                    )
+                ),
+            )
+        return ui.tags.div(
+            ui.tags.small(status),
+            get_progress_bar(progress),
+            ui.tags.small(" · ".join(details)),
+            *partial_results,
+            id="experiment_progress_details",
+        )
@@ -1,21 +1,39 @@
+import math
 import traceback
+from collections.abc import Sequence
 from pathlib import Path
 from random import random
 from typing import Any
 
 import faicons as fa
+import numpy as np
 import pandas as pd
-import plotly.express as px
 from htmltools import Tag
-from plotly.graph_objs import Figure
+from plotly.graph_objs import Figure, FigureWidget
 from shiny import Inputs, reactive, render, ui
 from shinywidgets import render_widget
 
 from app.server._config import get_class_name_from
-from app.server.logic import Runner
+from app.server.logic import METRIC_NAMES, ExperimentResults, format_size, plots
 from app.server.logic.actions import save_results
 
 
+def get_zoomable_widget(
+    figure: Figure, series: Sequence[tuple[np.ndarray, np.ndarray]]
+) -> FigureWidget:
+    # the figure shows the downsampled series (one trace each) - whenever the visible range changes,
+    # the points within it are downsampled again, so that zooming in reveals the details of the range
+    widget = FigureWidget(figure)
+
+    def show_range(_: Any, x_range: Sequence[float] | None) -> None:
+        with widget.batch_update():
+            for trace, (x, y) in zip(widget.data, series):
+                trace.x, trace.y = plots.downsample(x, y, x_range)  # type: ignore
+
+    widget.layout.on_change(show_range, "xaxis.range")
+    return widget
+
+
 def server_results(
     input: Inputs,
     run_paths: dict[str, reactive.Value],
@@ -26,17 +44,62 @@ def server_results(
     def plotly_template() -> str:
         return "plotly_dark" if input.mode() == "dark" else "plotly"
 
-    @reactive.calc
-    def get_streaming_node_rank() -> pd.DataFrame:
+    # the figures are built once per run, the rendered ones are only restyled when the theme changes
+    widgets: dict[str, FigureWidget] = {}
+
+    def show_widget(name: str, widget: FigureWidget) -> FigureWidget:
+        with reactive.isolate():
+            widget.update_layout(template=plotly_template())
+        widgets[name] = widget
+        return widget
+
+    def get_themed_figure(figure: Figure) -> Figure:
+        # the saved images follow the theme as well, the cached figure itself is not modified
+        return Figure(figure).update_layout(template=plotly_template())
+
+    @reactive.effect
+    def _() -> None:
+        template = plotly_template()
+        for widget in widgets.values():
+            widget.update_layout(template=template)
+
+    def is_comparing_streaming() -> bool:
+        return len(results["streaming_names"].get()) > 1
+
+    def get_node_rank(index: int) -> pd.DataFrame:
         return pd.DataFrame(
-            results["streaming_results"].get(), columns=["node", "value"]
+            results["streaming_results"].get()[index], columns=["node", "value"]
         )
 
+    @reactive.calc
+    def get_streaming_node_rank() -> pd.DataFrame:
+        return get_node_rank(0)
+
+    @reactive.calc
+    def get_selected_node_rank() -> pd.DataFrame:
+        return get_node_rank(int(input.streaming_node_rank_algorithm()))
+
     @render.ui
     def streaming_node_rank() -> Tag:
+        if not is_comparing_streaming():
+            return ui.card(
+                ui.card_header("Streaming node rank"),
+                render.data_frame(get_streaming_node_rank),
+                full_screen=True,
+            )
+        # the node rank of each compared algorithm can be selected
         return ui.card(
             ui.card_header("Streaming node rank"),
-            render.data_frame(get_streaming_node_rank),
+            ui.input_selectize(
+                "streaming_node_rank_algorithm",
+                None,
+                {
+                    str(index): name
+                    for index, name in enumerate(results["streaming_names"].get())
+                },
+                width="100%",
+            ),
+            render.data_frame(get_selected_node_rank),
             full_screen=True,
         )
 
@@ -52,79 +115,100 @@ def server_results(
             full_screen=True,
         )
 
+    def format_averages(averages: list[float], unit: str) -> str:
+        if len(averages) == 1:
+            return f"Average: {averages[0]:.6g} {unit}"
+        names = results["streaming_names"].get()
+        return "Average: " + ", ".join(
+            f"{name} {average:.6g} {unit}" for name, average in zip(names, averages)
+        )
+
     @reactive.calc
     def get_calculation_time_plot() -> Figure:
-        df = pd.DataFrame(results["calculation_time"].get(), columns=["time [ns]"])
-        line_plot = px.line(
-            df,
-            y=df.columns.values[0],
-            labels={"index": "edge"},
-            template=plotly_template(),
+        return plots.get_calculation_time_plot(
+            results["streaming_names"].get(), results["calculation_time"].get()
         )
-        return line_plot
+
+    @reactive.calc
+    def calculation_time_averages() -> list[float]:
+        return [time.mean() for _, time in results["calculation_time"].get()]
 
     @reactive.calc
     def calculation_time_mean() -> str:
-        df = pd.DataFrame(results["calculation_time"].get(), columns=["time [ns]"])
-        return f"Average: {df.mean().values[0]:.6g} ns"
+        return format_averages(calculation_time_averages()[:1], "ns")
+
+    def get_calculation_time_widget() -> FigureWidget:
+        return show_widget(
+            "calculation_time",
+            get_zoomable_widget(
+                get_calculation_time_plot(), results["calculation_time"].get()
+            ),
+        )
 
     @render.ui
     def calculation_time_plot() -> Tag:
+        averages = format_averages(calculation_time_averages(), "ns")
         return ui.card(
-            ui.card_header(f"Calculation time\t|\t{calculation_time_mean()}"),
-            render_widget(get_calculation_time_plot),  # type: ignore
+            ui.card_header(f"Calculation time\t|\t{averages}"),
+            render_widget(get_calculation_time_widget),  # type: ignore
             full_screen=True,
         )
 
+    @reactive.calc
+    def get_memory_series() -> list[tuple[np.ndarray, np.ndarray]]:
+        # the samples are converted to arrays once, for the plot, its zooming and the averages
+        return plots.get_memory_series(results["memory_usage"].get())
+
     @reactive.calc
     def get_memory_usage_plot() -> Figure:
-        edge, memory = zip(*results["memory_usage"].get())
-        df = pd.DataFrame({"edge": edge, "memory": memory})
-        line_plot = px.line(
-            df,
-            x="edge",
-            y="memory",
-            labels={"edge": "edge", "memory": "memory [B]"},
-            template=plotly_template(),
+        return plots.get_memory_usage_plot(
+            results["streaming_names"].get(), get_memory_series()
         )
-        return line_plot
+
+    @reactive.calc
+    def memory_usage_averages() -> list[float]:
+        return [
+            memory.mean() if len(memory) else math.nan
+            for _, memory in get_memory_series()
+        ]
 
     @reactive.calc
     def memory_usage_mean() -> str:
-        df = pd.DataFrame(results["memory_usage"].get(), columns=["edge", "memory"])
-        return f"Average: {df['memory'].mean():.6g} B"
+        return format_averages(memory_usage_averages()[:1], "B")
+
+    def get_memory_usage_widget() -> FigureWidget:
+        return show_widget(
+            "memory_usage",
+            get_zoomable_widget(get_memory_usage_plot(), get_memory_series()),
+        )
 
     @render.ui
     def memory_usage_plot() -> Tag:
+        averages = format_averages(memory_usage_averages(), "B")
         return ui.card(
-            ui.card_header(f"Memory usage history\t|\t{memory_usage_mean()}"),
-            render_widget(get_memory_usage_plot),  # type: ignore
+            ui.card_header(f"Memory usage history\t|\t{averages}"),
+            render_widget(get_memory_usage_widget),  # type: ignore
             full_screen=True,
         )
 
     def get_total_edge_count() -> int:
-        runner: Runner = results["runner"].get()
-        return runner.edge_count
+        experiment: ExperimentResults = results["experiment"].get()
+        return experiment.edge_count
 
     def get_dataset_size() -> str:
-        runner: Runner = results["runner"].get()
-        size = runner.dataset_size
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                return f"{size} {unit}"
-            size //= 1024
-        return "Very large"
+        experiment: ExperimentResults = results["experiment"].get()
+        return format_size(experiment.dataset_size)
 
     @reactive.calc
     def get_comparison_metrics() -> tuple[float | Any, float | Any, str, int]:
-        runner: Runner = results["runner"].get()
+        experiment: ExperimentResults = results["experiment"].get()
         order, cardinality = (
             input.node_rank_order(),
             input.node_rank_cardinality(),
         )
         order_bool = order == "Descending"
-        jaccard_similarity = runner.get_jaccard_similarity(order_bool, cardinality)
-        streaming_accuracy = runner.get_streaming_accuracy(order_bool, cardinality)
+        jaccard_similarity = experiment.get_jaccard_similarity(order_bool, cardinality)
+        streaming_accuracy = experiment.get_streaming_accuracy(order_bool, cardinality)
         return (
             jaccard_similarity,
             streaming_accuracy,
@@ -132,6 +216,125 @@ def server_results(
             cardinality,
         )
 
+    @reactive.calc
+    def get_streaming_comparison() -> pd.DataFrame:
+        # the compared streaming algorithms side by side, all against the same batch results
+        comparison = pd.DataFrame(
+            {
+                "algorithm": results["streaming_names"].get(),
+                "average time [ns]": calculation_time_averages(),
+                "average memory [B]": memory_usage_averages(),
+            }
+        )
+        if run_paths["batch_path"].get() is not None:
+            experiment: ExperimentResults = results["experiment"].get()
+            _, _, order, cardinality = get_comparison_metrics()
+            order_bool = order == "Descending"
+            indices = range(len(comparison))
+            comparison["Jaccard similarity"] = [
+                experiment.get_jaccard_similarity(order_bool, cardinality, index)
+                for index in indices
+            ]
+            comparison["streaming accuracy"] = [
+                experiment.get_streaming_accuracy(order_bool, cardinality, index)
+                for index in indices
+            ]
+        return comparison
+
+    @reactive.calc
+    def get_rank_metrics() -> pd.DataFrame:
+        # quality of the node rank of every streaming algorithm measured against the batch results
+        experiment: ExperimentResults = results["experiment"].get()
+        _, _, order, cardinality = get_comparison_metrics()
+        names = results["streaming_names"].get()
+        rank_metrics = pd.DataFrame(
+            [
+                experiment.get_rank_metrics(order == "Descending", cardinality, index)
+                for index in range(len(names))
+            ]
+        ).rename(columns=METRIC_NAMES)
+        rank_metrics.insert(0, "algorithm", names)
+        return rank_metrics
+
+    @reactive.calc
+    def get_accuracy_curves() -> pd.DataFrame:
+        # all cardinalities at once - the cardinality input only moves the marker on the plot
+        experiment: ExperimentResults = results["experiment"].get()
+        order_bool = input.node_rank_order() == "Descending"
+        return pd.concat(
+            experiment.get_accuracy_curves(order_bool, index).assign(algorithm=name)
+            for index, name in enumerate(results["streaming_names"].get())
+        )
+
+    @reactive.calc
+    def get_accuracy_curve_plot() -> Figure:
+        curves = get_accuracy_curves()
+        names = results["streaming_names"].get()
+        return plots.get_accuracy_curve_plot(
+            names,
+            [curves[curves["algorithm"] == name] for name in names],
+            input.node_rank_cardinality(),
+        )
+
+    def get_accuracy_curve_widget() -> FigureWidget:
+        return show_widget("accuracy_curve", FigureWidget(get_accuracy_curve_plot()))
+
+    @render.ui
+    def accuracy_curve_plot() -> Tag:
+        return ui.card(
+            ui.card_header("Accuracy for every cardinality of node rank"),
+            render_widget(get_accuracy_curve_widget),  # type: ignore
+            full_screen=True,
+        )
+
+    def has_ground_truth() -> bool:
+        experiment: ExperimentResults = results["experiment"].get()
+        return bool(experiment.ground_truth)
+
+    @reactive.calc
+    def get_prefix_accuracy() -> pd.DataFrame:
+        experiment: ExperimentResults = results["experiment"].get()
+        _, _, order, cardinality = get_comparison_metrics()
+        return pd.concat(
+            experiment.get_prefix_accuracy(
+                order == "Descending", cardinality, index
+            ).assign(algorithm=name)
+            for index, name in enumerate(results["streaming_names"].get())
+        )
+
+    @reactive.calc
+    def get_prefix_accuracy_plot() -> Figure:
+        prefix_accuracy = get_prefix_accuracy()
+        names = results["streaming_names"].get()
+        return plots.get_prefix_accuracy_plot(
+            names,
+            [prefix_accuracy[prefix_accuracy["algorithm"] == name] for name in names],
+        )
+
+    def get_prefix_accuracy_widget() -> FigureWidget:
+        return show_widget("prefix_accuracy", FigureWidget(get_prefix_accuracy_plot()))
+
+    @render.ui
+    def prefix_accuracy_plot() -> Tag:
+        return ui.card(
+            ui.card_header("Accuracy over the stream"),
+            render_widget(get_prefix_accuracy_widget),  # type: ignore
+            full_screen=True,
+        )
+
+    @render.data_frame
+    def rank_metrics() -> pd.DataFrame:
+        return get_rank_metrics().round(4)
+
+    @render.data_frame
+    def streaming_comparison() -> pd.DataFrame:
+        return get_streaming_comparison().round(4)
+
+    def streaming_comparison_row() -> tuple[Tag, ...]:
+        if not is_comparing_streaming():
+            return ()
+        return (ui.output_data_frame("streaming_comparison"),)
+
     @render.text
     def total_edge_count() -> str:
         return str(get_total_edge_count())
@@ -206,6 +409,8 @@ def server_results(
                 ),
                 class_="value-box-row",
             ),
+            ui.output_data_frame("rank_metrics"),
+            *streaming_comparison_row(),
             height="100%",
         )
 
@@ -224,18 +429,22 @@ def server_results(
                 ui.output_text("dataset_size"),
                 showcase=fa.icon_svg("database", margin_left="2rem"),
             ),
+            *streaming_comparison_row(),
         )
 
     @render.ui
-    @reactive.event(input.run_experiment)
+    @reactive.event(results["layout"])
     def results_first_row() -> Tag:
+        layout = results["layout"].get()
+        if layout["with_sweep"]:
+            return ui.layout_columns(ui.output_ui("sweep_plot"), max_height="48%")
         columns = (
             (
                 ui.output_ui("streaming_node_rank"),
                 ui.output_ui("batch_node_rank"),
                 ui.output_ui("metrics_with_batch"),
             )
-            if input.with_batch()
+            if layout["with_batch"]
             else (
                 ui.output_ui("streaming_node_rank"),
                 ui.output_ui("calculation_time_plot"),
@@ -244,29 +453,37 @@ def server_results(
         return ui.layout_columns(
             *columns,
             max_height="48%",
-            col_widths=[3, 3, 6] if input.with_batch() else [3, 9],
+            col_widths=[3, 3, 6] if layout["with_batch"] else [3, 9],
         )
 
     @render.ui
-    @reactive.event(input.run_experiment)
+    @reactive.event(results["layout"])
     def results_second_row() -> Tag:
-        columns = (
-            (
+        layout = results["layout"].get()
+        if layout["with_sweep"]:
+            return ui.layout_columns(ui.output_ui("sweep_table"), max_height="49%")
+        if not layout["with_batch"]:
+            return ui.layout_columns(
+                ui.output_ui("metrics_no_batch"),
                 ui.output_ui("memory_usage_plot"),
-                ui.output_ui("calculation_time_plot"),
+                max_height="49%",
+                col_widths=[3, 9],
             )
-            if input.with_batch()
-            else (ui.output_ui("metrics_no_batch"), ui.output_ui("memory_usage_plot"))
-        )
+        # the accuracy on prefixes of the stream is shown next to the memory usage history
+        columns = [
+            ui.output_ui("memory_usage_plot"),
+            ui.output_ui("calculation_time_plot"),
+            ui.output_ui("accuracy_curve_plot"),
+        ]
+        if layout["with_ground_truth"]:
+            columns.insert(1, ui.output_ui("prefix_accuracy_plot"))
         return ui.layout_columns(
-            *columns,
-            max_height="49%",
-            col_widths=[6, 6] if input.with_batch() else [3, 9],
+            *columns, max_height="49%", col_widths=[12 // len(columns)] * len(columns)
         )
 
     @render.ui
-    @reactive.event(input.run_experiment)
-    def save_results_button() -> tuple[Tag, Tag]:
+    @reactive.event(results["layout"])
+    def save_results_button() -> tuple[Tag, Tag, Tag]:
         return (
             ui.input_radio_buttons(
                 "output_format",
@@ -275,6 +492,13 @@ def server_results(
                 selected="LaTeX",
                 inline=True,
             ),
+            ui.input_radio_buttons(
+                "image_format",
+                "Image format",
+                ["SVG", "PNG", "PDF"],
+                selected="SVG",
+                inline=True,
+            ),
             ui.input_task_button(
                 "save_results",
                 "Save results",
@@ -296,6 +520,9 @@ def server_results(
     @reactive.effect
     @reactive.event(input.save_results)
     def _() -> None:
+        # the results of a parameter sweep are saved separately
+        if results["sweep"].get() is not None:
+            return
         (
             preprocessing_name,
             batch_name,
@@ -308,6 +535,7 @@ def server_results(
         dataset_path: Path = run_paths["dataset_path"].get()
         preprocessing_path: Path | None = run_paths["preprocessing_path"].get()
         streaming_path: Path = run_paths["streaming_path"].get()
+        comparison_paths: list[Path] = run_paths["comparison_paths"].get()
         batch_path: Path | None = run_paths["batch_path"].get()
 
         if preprocessing_path:
@@ -321,26 +549,31 @@ def server_results(
                 get_comparison_metrics()
             )
             batch_name = get_class_name_from(batch_path)
-            # fmt: off
-            streaming_node_rank = (
-                streaming_node_rank
-                .sort_values("value", ascending=order == "Ascending")
-                .head(cardinality)
-            )  # fmt: on
-            batch_node_rank = (
-                get_batch_node_rank()
-                .sort_values("value", ascending=order == "Ascending")
-                .head(cardinality)
+            experiment: ExperimentResults = results["experiment"].get()
+            order_bool = order == "Descending"
+            streaming_node_rank = pd.DataFrame(
+                experiment.get_rank_index().get_top(cardinality, order_bool),
+                columns=["node", "value"],
+            )
+            batch_node_rank = pd.DataFrame(
+                experiment.get_batch_rank_index().get_top(cardinality, order_bool),
+                columns=["node", "value"],
             )
 
         save_results_task(
             output_format=input.output_format(),
+            image_format=input.image_format().lower(),
             experiment_name=input.experiment_name(),
             dataset=dataset_path.name,
+            dataset_path=dataset_path,
             preprocessing_path=preprocessing_path,
             preprocessing_name=preprocessing_name,
             streaming_path=streaming_path,
             streaming_name=streaming_name,
+            comparison_paths=comparison_paths,
+            streaming_comparison=(
+                get_streaming_comparison() if is_comparing_streaming() else None
+            ),
             batch_path=batch_path,
             batch_name=batch_name,
             total_edge_count=get_total_edge_count(),
@@ -349,10 +582,22 @@ def server_results(
             cardinality=cardinality,
             jaccard_similarity=jaccard_similarity,
             streaming_accuracy=streaming_accuracy,
+            rank_metrics=get_rank_metrics() if batch_path else None,
+            accuracy_curve=(
+                get_themed_figure(get_accuracy_curve_plot()) if batch_path else None
+            ),
+            accuracy_curves=get_accuracy_curves() if batch_path else None,
+            prefix_accuracy=(
+                get_themed_figure(get_prefix_accuracy_plot())
+                if has_ground_truth()
+                else None
+            ),
+            prefix_accuracies=get_prefix_accuracy() if has_ground_truth() else None,
             streaming_node_rank=streaming_node_rank,
             batch_node_rank=batch_node_rank,
-            calculation_time=get_calculation_time_plot(),
-            memory_usage=get_memory_usage_plot(),
+            calculation_time=get_themed_figure(get_calculation_time_plot()),
+            memory_usage=get_themed_figure(get_memory_usage_plot()),
             calculation_avg=calculation_time_mean(),
             memory_avg=memory_usage_mean(),
+            experiment=results["experiment"].get(),
         )
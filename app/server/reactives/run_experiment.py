@@ -6,11 +6,23 @@ from typing import Any
 
 from shiny import Inputs, reactive, ui
 
+from algorithms._config.interfaces import ResultList
 from app.server._config import (
     CONNECTION_PREPROCESSING_FUNCTION_FILE,
     CONNECTIONS_CSV_FILE,
 )
-from app.server.logic import Runner
+from app.server.logic import (
+    ExperimentResults,
+    MemoryBackend,
+    MemoryBackendError,
+    ParameterGridError,
+    ProgressChannel,
+    TimingMode,
+    parse_parameter_grid,
+    run_experiment_in_worker,
+    run_sweep_in_workers,
+)
+from app.server.logic.file_reading import get_data_suffix, is_compressed
 
 
 class MissingPathError(ValueError):
@@ -20,13 +32,28 @@ class MissingPathError(ValueError):
         )
 
 
+def get_uploaded_dataset_path(file_info: dict[str, str]) -> Path:
+    # uploaded files keep only the last suffix of their name (e.g. '0.gz' for 'edges.csv.gz'),
+    # the suffix of the compressed data is restored as it decides how the dataset is read
+    dataset_path = Path(file_info["datapath"])
+    data_suffix = get_data_suffix(Path(file_info["name"]))
+    if not is_compressed(dataset_path) or not data_suffix:
+        return dataset_path
+    restored_path = dataset_path.with_name(
+        f"{dataset_path.stem}{data_suffix}{dataset_path.suffix}"
+    )
+    if not restored_path.exists():
+        dataset_path.rename(restored_path)
+    return restored_path
+
+
 def select_dataset(option: str, path: list[dict[str, str]]) -> Path:
     dataset_path = Path()
     match option:
         case "0":
             if path is None:
                 raise MissingPathError("dataset")
-            dataset_path = Path(path[0]["datapath"])
+            dataset_path = get_uploaded_dataset_path(path[0])
         case "1":
             dataset_path = CONNECTIONS_CSV_FILE
     return dataset_path
@@ -50,6 +77,48 @@ def get_paths(input: Inputs) -> tuple[Any, ...]:
     return dataset_path, preprocessing_path, streaming_path, batch_path
 
 
+def get_comparison_paths(input: Inputs, streaming_path: Path) -> list[Path]:
+    if not input.with_streaming_comparison():
+        return []
+    comparison_paths = []
+    for path in input.select_streaming_comparison() or ():
+        path = Path(path).resolve()
+        if path != streaming_path and path not in comparison_paths:
+            comparison_paths.append(path)
+    return comparison_paths
+
+
+def sort_results(results: ResultList) -> ResultList:
+    return sorted(results, key=lambda item: item[1], reverse=True)
+
+
+def get_error_message(exception: Exception) -> str:
+    message = traceback.format_exc()
+    if isinstance(exception, UnicodeDecodeError):
+        message = "The dataset you provided is not in a UTF-8-compatible encoding."
+    elif isinstance(exception, (TypeError, MemoryBackendError)):
+        message = str(exception)
+    elif isinstance(exception, AttributeError):
+        message = "No implementation was selected for one of the functions/algorithms."
+    return message
+
+
+def show_experiment(
+    results: dict[str, reactive.Value], experiment: ExperimentResults
+) -> None:
+    # the results and measurements are listed per streaming algorithm,
+    # starting with the main one
+    results["sweep"].set(None)
+    results["experiment"].set(experiment)
+    results["streaming_names"].set(experiment.streaming_names)
+    results["streaming_results"].set(
+        [sort_results(result) for result in experiment.streaming_results]
+    )
+    results["batch_results"].set(sort_results(experiment.batch_results))
+    results["calculation_time"].set(experiment.calculation_time)
+    results["memory_usage"].set(experiment.memory_usage)
+
+
 def server_run_experiment(
     input: Inputs,
     run_paths: dict[str, reactive.Value],
@@ -58,66 +127,91 @@ def server_run_experiment(
 ) -> None:
     @ui.bind_task_button(button_id="run_experiment")
     @reactive.extended_task
-    async def run_experiment(runner: Runner) -> None:
+    async def run_experiment(**runner_arguments: Any) -> None:
+        # the experiment runs in a worker process, so the server keeps responding in the meantime
+        # and shows the progress the worker publishes
+        progress_channel = ProgressChannel()
+        results["progress"].set(progress_channel)
         try:
-            runner.validate_implementation()
-            runner.run_experiment()
+            experiment = await run_experiment_in_worker(
+                **runner_arguments, progress_directory=progress_channel.directory
+            )
         except Exception as exception:
-            message = traceback.format_exc()
-            if isinstance(exception, UnicodeDecodeError):
-                message = (
-                    "The dataset you provided is not in a UTF-8-compatible encoding."
-                )
-            elif isinstance(exception, TypeError):
-                message = str(exception)
-            error.set((random(), message))
+            error.set((random(), get_error_message(exception)))
         else:
-            stream_results = sorted(
-                runner.get_stream_results(), key=lambda item: item[1], reverse=True
-            )
-            batch_results = sorted(
-                runner.get_batch_results(), key=lambda item: item[1], reverse=True
-            )
+            show_experiment(results, experiment)
+        finally:
+            results["progress"].set(None)
+            progress_channel.close()
 
-            if type(stream_results) is dict:
-                stream_results = stream_results.items()
-            elif type(stream_results) is not list:
-                stream_results = list(stream_results)
-
-            if type(batch_results) is dict:
-                batch_results = batch_results.items()
-            elif type(batch_results) is not list:
-                batch_results = list(batch_results)
-
-            results["runner"].set(runner)
-            results["streaming_results"].set(stream_results)
-            results["batch_results"].set(batch_results)
-            results["calculation_time"].set(runner.calculation_time_per_edge)
-            results["memory_usage"].set(runner.memory_usage)
+    @ui.bind_task_button(button_id="run_experiment")
+    @reactive.extended_task
+    async def run_sweep(
+        parameter_grid: dict[str, list], **runner_arguments: Any
+    ) -> None:
+        try:
+            sweep = await run_sweep_in_workers(parameter_grid, **runner_arguments)
+        # any failure of the sweep is shown to the user instead of ending the task silently
+        except Exception as exception:  # noqa: BLE001
+            error.set((random(), get_error_message(exception)))
+        else:
+            results["sweep"].set(sweep)
 
     @reactive.effect
     @reactive.event(input.run_experiment)
     def _() -> None:
+        # the results are laid out for the settings of the run, as soon as it starts
+        results["layout"].set(
+            {
+                "with_sweep": input.with_sweep(),
+                "with_batch": input.with_batch(),
+                "with_ground_truth": bool(
+                    input.with_batch() and input.ground_truth_prefix_count()
+                ),
+            }
+        )
         try:
             dataset_path, preprocess_path, streaming_path, batch_path = get_paths(input)
-            runner = Runner(
-                dataset_path=dataset_path,
-                preprocessing_path=preprocess_path,
-                streaming_path=streaming_path,
-                batch_path=batch_path,
-            )
-            run_experiment(runner)
+            measurement_arguments = {
+                "timing_mode": TimingMode(input.timing_mode()),
+                "timing_interval": input.timing_interval() or 1,
+                "memory_backend": MemoryBackend(input.memory_backend()),
+            }
+            if input.with_sweep():
+                # every configuration of the swept algorithm is run instead of the compared algorithms
+                comparison_paths = []
+                run_sweep(
+                    parse_parameter_grid(input.sweep_grid()),
+                    dataset_path=dataset_path,
+                    preprocessing_path=preprocess_path,
+                    streaming_path=streaming_path,
+                    batch_path=batch_path,
+                    **measurement_arguments,
+                )
+            else:
+                comparison_paths = get_comparison_paths(input, streaming_path)
+                run_experiment(
+                    dataset_path=dataset_path,
+                    preprocessing_path=preprocess_path,
+                    streaming_path=[streaming_path, *comparison_paths],
+                    batch_path=batch_path,
+                    use_edge_cache=input.with_edge_cache(),
+                    snapshot_interval=input.snapshot_interval() or 0,
+                    checkpoint_interval=input.checkpoint_interval() or 0,
+                    resume_from_checkpoint=input.resume_from_checkpoint(),
+                    ground_truth_prefix_count=input.ground_truth_prefix_count() or 0,
+                    **measurement_arguments,
+                )
             run_paths["dataset_path"].set(dataset_path)
             run_paths["preprocessing_path"].set(preprocess_path)
             run_paths["streaming_path"].set(streaming_path)
+            run_paths["comparison_paths"].set(comparison_paths)
             run_paths["batch_path"].set(batch_path)
             ui.update_text(
                 "experiment_name", value=datetime.now().strftime("%Y-%m-%d %H_%M_%S")
             )
         except Exception as exception:
             message = traceback.format_exc()
-            if isinstance(exception, MissingPathError):
+            if isinstance(exception, (MissingPathError, ParameterGridError)):
                 message = str(exception)
-            elif isinstance(exception, AttributeError):
-                message = "No implementation was selected for one of the functions/algorithms."
             error.set((random(), message))
@@ -22,6 +22,21 @@ def get_algorithms(type: AlgorithmType) -> dict[str, str]:
     return algorithms
 
 
+def get_streaming_choices() -> dict[str, dict[str, str]]:
+    return {
+        "Existing": get_algorithms(AlgorithmType.STREAMING),
+        "Presupplied": {
+            str(
+                DEGREE_CENTRALITY_STREAM_ACCURATE_ALGORITHM_FILE
+            ): "Degree centrality stream accurate",
+            str(
+                DEGREE_CENTRALITY_STREAM_APPROXIMATE_ALGORITHM_FILE
+            ): "Degree centrality stream approximate",
+            str(MISRA_GRIES_STREAM_ALGORITHM_FILE): "Misra-Gries stream",
+        },
+    }
+
+
 def server_selectize(input: Inputs) -> None:
     @render.ui
     @reactive.event(input.refresh_preprocessing_list, ignore_none=False)
@@ -50,23 +65,24 @@ def server_selectize(input: Inputs) -> None:
             ui.input_selectize(
                 "select_streaming",
                 "",
-                {
-                    "": {"New": "New algorithm"},
-                    "Existing": get_algorithms(AlgorithmType.STREAMING),
-                    "Presupplied": {
-                        str(
-                            DEGREE_CENTRALITY_STREAM_ACCURATE_ALGORITHM_FILE
-                        ): "Degree centrality stream accurate",
-                        str(
-                            DEGREE_CENTRALITY_STREAM_APPROXIMATE_ALGORITHM_FILE
-                        ): "Degree centrality stream approximate",
-                        str(MISRA_GRIES_STREAM_ALGORITHM_FILE): "Misra-Gries stream",
-                    },
-                },
+                {"": {"New": "New algorithm"}, **get_streaming_choices()},
                 selected=str(DEGREE_CENTRALITY_STREAM_ACCURATE_ALGORITHM_FILE),
             ),
         )
 
+    @render.ui
+    @reactive.event(input.refresh_streaming_list, ignore_none=False)
+    def streaming_comparison_selectize():
+        # the algorithms run alongside the selected streaming algorithm in the same pass
+        return (
+            ui.input_selectize(
+                "select_streaming_comparison",
+                "Compared algorithms",
+                get_streaming_choices(),
+                multiple=True,
+            ),
+        )
+
     @render.ui
     @reactive.event(input.refresh_batch_list, ignore_none=False)
     def batch_selectize():
@@ -0,0 +1,136 @@
+import traceback
+from pathlib import Path
+from random import random
+
+import pandas as pd
+import plotly.express as px
+from htmltools import Tag
+from plotly.graph_objs import Figure
+from shiny import Inputs, reactive, render, req, ui
+from shinywidgets import render_widget
+
+from app.server._config import get_class_name_from
+from app.server.logic import SweepResults
+from app.server.logic.actions import save_sweep_results
+
+
+def server_sweep(
+    input: Inputs,
+    run_paths: dict[str, reactive.Value],
+    results: dict[str, reactive.Value],
+    error: reactive.Value,
+) -> None:
+    @reactive.calc
+    def plotly_template() -> str:
+        return "plotly_dark" if input.mode() == "dark" else "plotly"
+
+    def with_batch() -> bool:
+        return run_paths["batch_path"].get() is not None
+
+    @reactive.calc
+    def get_sweep_table() -> pd.DataFrame:
+        sweep: SweepResults = req(results["sweep"].get())
+        order, cardinality = "Descending", 10
+        if with_batch():
+            order, cardinality = input.node_rank_order(), input.node_rank_cardinality()
+        return sweep.to_dataframe(order == "Descending", cardinality)
+
+    @reactive.calc
+    def get_sweep_plot() -> Figure:
+        sweep_table = get_sweep_table()
+        sweep: SweepResults = results["sweep"].get()
+        # accuracy against memory with the latency as the colour, without the batch algorithm
+        # there is no accuracy and the latency is plotted against memory instead
+        scatter_plot = px.scatter(
+            sweep_table,
+            x="average memory [B]",
+            y="Jaccard similarity" if with_batch() else "average time [ns]",
+            color="average time [ns]" if with_batch() else None,
+            symbol="Pareto optimal",
+            hover_data=list(sweep.configurations[0]),
+            template=plotly_template(),
+        )
+        scatter_plot.update_traces(marker_size=10)
+        scatter_plot.update_layout(
+            legend={"orientation": "h", "yanchor": "bottom", "y": 1.02}
+        )
+        return scatter_plot
+
+    @render.ui
+    def sweep_plot() -> Tag:
+        return ui.card(
+            ui.card_header("Pareto front of the parameter sweep"),
+            render_widget(get_sweep_plot),  # type: ignore
+            full_screen=True,
+        )
+
+    @render.ui
+    def sweep_table() -> Tag:
+        sweep: SweepResults = req(results["sweep"].get())
+        controls = ()
+        if with_batch():
+            controls = (
+                ui.row(
+                    ui.input_selectize(
+                        "node_rank_order",
+                        label="Sorting order",
+                        choices=["Ascending", "Descending"],
+                        selected="Descending",
+                        width="50%",
+                    ),
+                    ui.input_numeric(
+                        "node_rank_cardinality",
+                        label="Cardinality of node rank",
+                        value=20,
+                        min=1,
+                        width="50%",
+                    ),
+                ),
+            )
+        return ui.card(
+            ui.card_header(f"Configurations\t|\tTotal edge count: {sweep.edge_count}"),
+            *controls,
+            render.data_frame(get_sweep_table),
+            full_screen=True,
+        )
+
+    @ui.bind_task_button(button_id="save_results")
+    @reactive.extended_task
+    async def save_sweep_results_task(output_format: str, **kwargs) -> None:
+        try:
+            save_sweep_results(output_format.lower(), **kwargs)
+        # any failure of the save is shown to the user instead of ending the task silently
+        except Exception:  # noqa: BLE001
+            error.set((random(), traceback.format_exc()))
+
+    @reactive.effect
+    @reactive.event(input.save_results)
+    def _() -> None:
+        if results["sweep"].get() is None:
+            return
+        dataset_path: Path = run_paths["dataset_path"].get()
+        preprocessing_path: Path | None = run_paths["preprocessing_path"].get()
+        streaming_path: Path = run_paths["streaming_path"].get()
+        batch_path: Path | None = run_paths["batch_path"].get()
+        sweep: SweepResults = results["sweep"].get()
+
+        save_sweep_results_task(
+            output_format=input.output_format(),
+            image_format=input.image_format().lower(),
+            experiment_name=input.experiment_name(),
+            dataset=dataset_path.name,
+            preprocessing_path=preprocessing_path,
+            preprocessing_name=preprocessing_path
+            and get_class_name_from(preprocessing_path),
+            streaming_path=streaming_path,
+            streaming_name=get_class_name_from(streaming_path),
+            batch_path=batch_path,
+            batch_name=batch_path and get_class_name_from(batch_path),
+            parameter_grid="; ".join(
+                f"{name} = {', '.join(map(repr, values))}"
+                for name, values in sweep.parameter_grid.items()
+            ),
+            total_edge_count=sweep.edge_count,
+            sweep_table=get_sweep_table(),
+            sweep_plot=get_sweep_plot(),
+        )
@@ -3,8 +3,11 @@ from shiny import ui
 
 from .batch import batch
 from .dataset import dataset
+from .measurement import measurement
 from .preprocessing import preprocessing
+from .saved_results import saved_results
 from .streaming import streaming
+from .sweep import sweep
 
 sidebar = ui.sidebar(
     ui.input_dark_mode(id="mode", mode="light"),
@@ -14,8 +17,12 @@ sidebar = ui.sidebar(
     *dataset(),
     *preprocessing(),
     *streaming(),
+    *sweep(),
     *batch(),
+    *measurement(),
+    *saved_results(),
     ui.tags.div(class_="flex-divider"),
+    ui.output_ui("experiment_progress"),
     ui.output_ui("save_results_button"),
     ui.input_task_button(
         "run_experiment",
@@ -25,5 +25,11 @@ def batch() -> tuple[Tag, ...]:
             ui.input_action_button(
                 "edit_batch", "Edit batch algorithm", icon=fa.icon_svg("code")
             ),
+            ui.input_numeric(
+                "ground_truth_prefix_count",
+                "Accuracy on n prefixes of the stream",
+                value=0,
+                min=0,
+            ),
         ),
     )
@@ -18,4 +18,5 @@ def dataset() -> tuple[Tag, ...]:
             ui.input_file("dataset_path", "Path to dataset"),
             ui.input_switch("with_preprocessing", "Preprocess data", False),
         ),
+        ui.input_switch("with_edge_cache", "Cache preprocessed edges", False),
     )
@@ -0,0 +1,58 @@
+from htmltools import Tag
+from shiny import ui
+
+
+def measurement() -> tuple[Tag, ...]:
+    return (
+        ui.input_switch("with_measurement_settings", "Customize measurement", False),
+        ui.panel_conditional(
+            "input.with_measurement_settings == true",
+            ui.input_selectize(
+                "timing_mode",
+                "Timed edges",
+                {
+                    "every_edge": "Every edge",
+                    "every_nth_edge": "Every n-th edge",
+                    "random_sample": "Random sample of edges",
+                    "per_block": "Blocks of edges",
+                },
+                selected="every_edge",
+            ),
+            ui.panel_conditional(
+                "input.timing_mode == 'every_nth_edge' || input.timing_mode == 'random_sample'",
+                ui.input_numeric(
+                    "timing_interval", "Time one in n edges", value=100, min=1
+                ),
+            ),
+            ui.input_selectize(
+                "memory_backend",
+                "Memory measurement",
+                {
+                    "automatic": "Automatic",
+                    "asizeof": "Size of the algorithm object (pympler)",
+                    "footprint": "Reported by the algorithm",
+                    "tracemalloc": "Allocations of the algorithm (tracemalloc)",
+                    "rss": "Resident memory of the process",
+                },
+                selected="automatic",
+            ),
+            ui.input_numeric(
+                "snapshot_interval",
+                "Partial results every n seconds",
+                value=10,
+                min=0,
+            ),
+            ui.input_numeric(
+                "checkpoint_interval",
+                "Checkpoint every n seconds",
+                value=0,
+                min=0,
+            ),
+            ui.panel_conditional(
+                "input.checkpoint_interval > 0",
+                ui.input_switch(
+                    "resume_from_checkpoint", "Resume from the last checkpoint", True
+                ),
+            ),
+        ),
+    )
@@ -0,0 +1,34 @@
+import faicons as fa
+from htmltools import Tag
+from shiny import ui
+
+
+def saved_results() -> tuple[Tag, ...]:
+    return (
+        ui.input_switch("with_saved_results", "Load saved results", False),
+        ui.panel_conditional(
+            "input.with_saved_results == true",
+            ui.row(
+                ui.column(10, "Saved experiment", class_="selectize-label"),
+                ui.column(
+                    2,
+                    ui.input_action_button(
+                        "refresh_saved_results_list",
+                        label=None,
+                        icon=fa.icon_svg("rotate"),
+                        class_="refresh-button",
+                    ),
+                ),
+                class_="selectize-row",
+            ),
+            ui.output_ui("saved_results_selectize"),
+            ui.input_action_button(
+                "load_results", "Load results", icon=fa.icon_svg("folder-open")
+            ),
+            ui.input_action_button(
+                "show_catalog",
+                "Compare saved experiments",
+                icon=fa.icon_svg("table-list"),
+            ),
+        ),
+    )
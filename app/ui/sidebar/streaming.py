@@ -24,4 +24,11 @@ def streaming() -> tuple[Tag, ...]:
             "Edit streaming algorithm",
             icon=fa.icon_svg("code"),
         ),
+        ui.input_switch(
+            "with_streaming_comparison", "Compare with other algorithms", False
+        ),
+        ui.panel_conditional(
+            "input.with_streaming_comparison == true",
+            ui.output_ui("streaming_comparison_selectize"),
+        ),
     )
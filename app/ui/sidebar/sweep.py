@@ -0,0 +1,18 @@
+from htmltools import Tag
+from shiny import ui
+
+
+def sweep() -> tuple[Tag, ...]:
+    return (
+        ui.input_switch("with_sweep", "Sweep algorithm parameters", False),
+        ui.panel_conditional(
+            "input.with_sweep == true",
+            ui.input_text_area(
+                "sweep_grid",
+                "Parameter grid",
+                placeholder="k = 10..10000:7\ndecay = 0.9, 0.99",
+                rows=3,
+                resize="vertical",
+            ),
+        ),
+    )
@@ -4,8 +4,11 @@ from algorithms._config.interfaces import PreprocessEdge
 
 
 class ConnectionPreprocessing(PreprocessEdge):
+    # only these two of the dataset's columns are read from the file
+    columns = ("start_stop", "end_stop")
+
     def __init__(self) -> None: ...
 
     def create_edge_from(self, line: Any) -> Sequence | dict:
-        # The edge is a dictionary. Its keys are the headers of the supplied .csv file.
-        return (line["start_stop"], line["end_stop"])
+        # The edge is a tuple of the values of the declared columns.
+        return line
@@ -1,9 +1,13 @@
+from collections import Counter
+from collections.abc import Sequence
+from itertools import chain
+
 from algorithms._config.interfaces import ResultList, StreamingAlgorithm
 
 
 class DegreeCentralityApproximateVersion(StreamingAlgorithm):
     def __init__(self) -> None:
-        self.degrees = {}
+        self.degrees = Counter()
 
     def on_edge_calculate(self, edge: tuple) -> None:
         vertex_start = edge[0]
@@ -18,5 +22,9 @@ class DegreeCentralityApproximateVersion(StreamingAlgorithm):
         self.degrees[vertex_start] = self.degrees[vertex_start] + 1
         self.degrees[vertex_end] = self.degrees[vertex_end] + 1
 
+    def on_edges_calculate(self, edges: Sequence[tuple]) -> None:
+        # both ends of every edge in the block are counted at once
+        self.degrees.update(chain.from_iterable((edge[0], edge[1]) for edge in edges))
+
     def submit_results(self) -> ResultList:
         return list(self.degrees.items())
@@ -4,9 +4,9 @@ from algorithms._config.interfaces import ResultList, StreamingAlgorithm
 
 
 class MisraAlgorithm(StreamingAlgorithm):
-    def __init__(self) -> None:
+    def __init__(self, k: int = 20) -> None:
         self.results = {}
-        self.k = 20
+        self.k = k
 
     def on_edge_calculate(self, edge: Sequence | dict) -> None:
         vertex_start = edge[0]